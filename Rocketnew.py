@@ -1,32 +1,51 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import requests
 import pandas as pd
 from datetime import datetime, timedelta
 import pytz
-from geopy.distance import geodesic
-import folium
-from streamlit_folium import folium_static
 import math
+import os
+import base64
+import time
+import threading
+import functools
+import importlib.util
+from collections import OrderedDict
 import numpy as np
-from folium.plugins import AntPath
-import random
 
-# Plotly für erweiterte Charts
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
-    st.warning("⚠️ Plotly nicht verfügbar. Einige Charts werden nicht angezeigt. Installieren Sie mit: pip install plotly")
+# Modelle und Berechnungen ohne Streamlit (siehe Paket rockets)
+from rockets.geometry import (azimuth_to_direction, calculate_direction_from_germany, distance_from_germany_km,
+                              germany_coords, great_circle_distance_km, look_angles_from_germany)
+from rockets.history import (analyze_best_sighting_times, analyze_seasonal_patterns, generate_historical_sightings,
+                             generate_sighting_predictions, get_best_sighting_month, get_notable_sightings,
+                             prepare_hourly_chart_data, prepare_monthly_chart_data, prepare_sighting_types_data)
+from rockets.http_client import get_fixture_store, get_http_client
+from rockets.launches import (build_launch_analysis, find_next_visible_launch, get_launch_snapshot,
+                              launch_table_from_snapshot, load_launch_snapshot)
+from rockets.orbits import (LAUNCH_ORBIT_PARAMS, build_launch_trajectory, calculate_orbit_path_with_time,
+                            calculate_orbit_period, determine_orbit_type)
+from rockets.precompute import PRECOMPUTE_ENABLED, start_precompute_scheduler
+from rockets.raster import compute_trajectory_visibility_raster
+from rockets.reentry import calculate_reentry_observation_windows, evaluate_reentry_visibility, simulate_reentry_data
+from rockets.satellites import (ISS_PASS_HORIZON_DAYS, SGP4_AVAILABLE, download_tle_catalog, get_current_iss_info,
+                                get_iss_data_version, get_iss_passes, get_iss_position_approximation,
+                                get_iss_visibility_from_germany, get_iss_visibility_info, get_satellite_catalog)
+from rockets.sites import (LaunchSiteRegistry, STATIC_LAUNCH_SITES, get_best_launch_positions_for_germany,
+                           get_launch_position_rank)
+from rockets.starlink import STARLINK_TLE_PATH, predict_constellation_passes
+from rockets.sun import NIGHT_SUN_ELEVATION_DEG, get_next_night_window
+from rockets.visibility import (OBSERVER_GRID_KM, aggregate_visibility_by_region, compute_visibility_field,
+                                get_observer_grid, is_point_visible_from_germany)
+from rockets.windows import (LAUNCH_TIMELINE_DAYS, LAUNCH_TIMELINE_PAGE_SIZE, LAUNCH_WINDOW_MIN_VISIBILITY,
+                             MANIFEST_ANALYSIS_ORBITS, analyze_launch_manifest, calculate_visibility_schedule,
+                             get_trajectory_analysis_cache, iter_visibility_windows, launch_positions)
 
-# Seitentitel und Beschreibung
-st.title("🚀 Raketenstarts - Sichtbarkeit von Deutschland")
-st.markdown("""
-### Diese App zeigt kommende Raketenstarts und deren Sichtbarkeit von Deutschland aus
-Erfahren Sie, wann und wo Sie Raketen und Satelliten am deutschen Himmel sehen können!
-""")
+# Plotly für erweiterte Charts (Import erst beim Zeichnen im Verlaufs-Tab)
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+# Karten und Charts werden erst bei Bedarf importiert: folium/streamlit_folium und plotly
+# kosten zusammen über eine Sekunde Startzeit und werden nicht in jedem Lauf gebraucht
 
 # Live-Countdown zum nächsten Start
 def create_launch_countdown(next_launch_time, launch_name):
@@ -107,326 +126,46 @@ def create_launch_countdown(next_launch_time, launch_name):
         </div>
         """
 
-# Aktuelle sichtbare Raketen/Ereignisse Übersicht
-st.info("""
-🌟 **AKTUELL SICHTBARE EREIGNISSE:**
-• **ISS-Überflüge**: Täglich 2-5 mal sichtbar (hellster "Stern" am Himmel)
-• **Starlink-Satelliten**: Einzelne Satelliten regelmäßig als bewegende Punkte
-• **SpaceX Falcon 9**: Gelegentlich Spiralen nach Starts über Europa sichtbar
-• **Europäische Raketen 2025**: Isar Spectrum (Norwegen), RFA One & Orbex (Schottland)
-""")
-
-# Warnung über realistische Sichtbarkeit
-st.warning("""
-⚠️ **WICHTIGER HINWEIS ZUR SICHTBARKEIT:**
-- Raketen sind nur in **großer Höhe** (>100km) und bei **optimalen Bedingungen** sichtbar
-- **Aufstieg**: Nur die ersten 5-15 Minuten, wenn Triebwerke brennen
-- **Orbit**: Nur wenn Sonnenlicht reflektiert wird und über dem Horizont (>10° Elevation)
-- **Wetter**: Klarer Himmel erforderlich, keine Wolken
-- **Zeit**: Beste Sichtbarkeit in Dämmerung oder Nacht
-- **Live-Countdown**: Zeigt Zeit bis zum nächsten Start in Echtzeit
-""")
+# Startdaten einmal pro Aktualisierung parsen und kompakt cachen
+@st.cache_data(ttl=60)  # Kurzer Prozess-Cache, die Aktualität regelt der Festplatten-Cache
+def get_launch_table():
+    snapshot = get_launch_snapshot()
+    launches = launch_table_from_snapshot(snapshot)
+    if launches is None:
+        st.error((snapshot or {}).get("last_error") or "Startdaten sind derzeit nicht verfügbar.")
+    return launches
 
-# Sidebar für wichtige Informationen
-st.sidebar.title("📍 Sichtbarkeit von Deutschland")
-st.sidebar.info("""
-**Aktuell von Deutschland sichtbare Raketen:**
-- SpaceX Falcon 9 (bei passenden Bedingungen)
-- Europäische Raketen (Ariane 6, Vega C)
-- Isar Aerospace Spectrum (Norwegen) 
-- Orbex Prime (Schottland)
-- RFA One (Schottland)
+# Heatmap-Darstellung: Sichtbarkeit entlang der Flugbahn als PNG-Overlay statt Einzelmarkern
+MAP_RENDER_MODES = {"raster": "🔥 Heatmap", "markers": "📍 Einzelmarker"}
+MAP_RENDER_MODE = os.environ.get("ROCKETS_MAP_MODE", "raster")
 
-**Beste Sichtbarkeit:**
-- 🌙 Nachts (22:00-04:00)
-- 🌅 Dämmerung (20:00-22:00, 04:00-06:00)
-- ☀️ Tagsüber meist nicht sichtbar
-""")
+def encode_png_data_url(rgba):
+    """Kodiert ein RGBA-Bild einmalig als PNG-Data-URL"""
+    from folium.utilities import write_png
+    return "data:image/png;base64," + base64.b64encode(write_png(rgba)).decode("ascii")
 
-# Funktion zum Abrufen von Daten über bevorstehende Raketenstarts
-@st.cache_data(ttl=3600)
-def get_launch_data():
-    url = "https://ll.thespacedevs.com/2.2.0/launch/upcoming/?limit=30&mode=detailed"
-    headers = {"Accept": "application/json"}
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Fehler beim Abrufen der Daten: {response.status_code}")
-            return None
-    except requests.exceptions.RequestException as e:
-        st.error(f"Verbindungsfehler: {str(e)}")
+def build_trajectory_visibility_overlay(launch_coords, launch_epoch, target_orbit):
+    """Sichtbarkeits-Heatmap (PNG-Data-URL, Bildgrenzen) für Aufstieg und ersten Umlauf"""
+    raster = compute_trajectory_visibility_raster(launch_coords, launch_epoch, target_orbit)
+    if raster is None:
         return None
+    rgba, bounds = raster
+    return encode_png_data_url(rgba), bounds
 
-# Funktion zum Simulieren von Wiedereintritts-Daten (da echte APIs oft eingeschränkt sind)
-@st.cache_data(ttl=1800)  # 30 Minuten Cache
-def get_reentry_data():
-    """Simuliert Wiedereintritts-Daten basierend auf realistischen Szenarien"""
-    
-    current_time = datetime.now(pytz.UTC)
-    reentries = []
-    
-    # Bekannte/wahrscheinliche Wiedereintritte der nächsten Wochen
-    simulated_reentries = [
-        {
-            "name": "SpaceX Falcon 9 Upper Stage",
-            "object_type": "Rocket Body",
-            "origin": "Starlink Mission",
-            "mass_kg": 4000,
-            "size": "12m x 3.7m",
-            "reentry_time": current_time + timedelta(days=2, hours=14, minutes=23),
-            "uncertainty_hours": 6,
-            "predicted_location": {"lat": 52.0, "lon": 12.0},
-            "trajectory_start": {"lat": 58.0, "lon": -5.0},
-            "trajectory_end": {"lat": 45.0, "lon": 25.0},
-            "visibility_duration_minutes": 4,
-            "risk_level": "Low",
-            "debris_survival": "Minimal"
-        },
-        {
-            "name": "Chinese Long March 5B Core Stage",
-            "object_type": "Rocket Body", 
-            "origin": "Tiangong Station Mission",
-            "mass_kg": 21000,
-            "size": "33m x 5m",
-            "reentry_time": current_time + timedelta(days=5, hours=8, minutes=45),
-            "uncertainty_hours": 12,
-            "predicted_location": {"lat": 47.0, "lon": 8.0},
-            "trajectory_start": {"lat": 55.0, "lon": -10.0},
-            "trajectory_end": {"lat": 38.0, "lon": 30.0},
-            "visibility_duration_minutes": 6,
-            "risk_level": "Medium",
-            "debris_survival": "Possible small fragments"
-        },
-        {
-            "name": "Progress Cargo Spacecraft",
-            "object_type": "Spacecraft",
-            "origin": "ISS Resupply Mission",
-            "mass_kg": 7000,
-            "size": "7m x 2.7m",
-            "reentry_time": current_time + timedelta(days=8, hours=21, minutes=12),
-            "uncertainty_hours": 3,
-            "predicted_location": {"lat": 49.0, "lon": 15.0},
-            "trajectory_start": {"lat": 60.0, "lon": -2.0},
-            "trajectory_end": {"lat": 35.0, "lon": 35.0},
-            "visibility_duration_minutes": 3,
-            "risk_level": "Low",
-            "debris_survival": "Complete burnup expected"
-        },
-        {
-            "name": "Starlink Satellite (Deorbited)",
-            "object_type": "Satellite",
-            "origin": "Starlink Constellation",
-            "mass_kg": 260,
-            "size": "2.8m x 1.65m",
-            "reentry_time": current_time + timedelta(days=12, hours=3, minutes=56),
-            "uncertainty_hours": 2,
-            "predicted_location": {"lat": 53.0, "lon": 9.0},
-            "trajectory_start": {"lat": 62.0, "lon": -8.0},
-            "trajectory_end": {"lat": 42.0, "lon": 28.0},
-            "visibility_duration_minutes": 2,
-            "risk_level": "Very Low",
-            "debris_survival": "Complete burnup"
-        },
-        {
-            "name": "ESA Upper Stage (AVUM)",
-            "object_type": "Rocket Body",
-            "origin": "Vega-C Mission",
-            "mass_kg": 1200,
-            "size": "2.6m x 1.9m", 
-            "reentry_time": current_time + timedelta(days=15, hours=16, minutes=34),
-            "uncertainty_hours": 4,
-            "predicted_location": {"lat": 50.0, "lon": 6.0},
-            "trajectory_start": {"lat": 57.0, "lon": -12.0},
-            "trajectory_end": {"lat": 41.0, "lon": 22.0},
-            "visibility_duration_minutes": 3,
-            "risk_level": "Low",
-            "debris_survival": "Minimal fragments possible"
-        }
-    ]
-    
-    return {"results": simulated_reentries}
+@st.cache_data(max_entries=64)
+def get_trajectory_visibility_overlay(launch_coords, launch_epoch, target_orbit):
+    """Heatmap je Flugbahn gecacht (für Sitzungen)"""
+    return build_trajectory_visibility_overlay(launch_coords, launch_epoch, target_orbit)
 
-# Verbesserte Umlaufzeitberechnung mit Höhenprofil
-def calculate_orbit_period(orbit_height, current_height=None):
-    earth_radius = 6371  # km
-    gravitational_parameter = 3.986004418e14  # m³/s²
-    
-    effective_height = current_height if current_height is not None else orbit_height
-    orbit_radius = (earth_radius + effective_height) * 1000  # m
-    
-    orbit_period_seconds = 2 * math.pi * math.sqrt(orbit_radius**3 / gravitational_parameter)
-    return orbit_period_seconds / 60  # Minuten
-
-# Verbesserte Orbit-Pfad-Berechnung für realistische Umlaufbahnen (Kompatibilitätsfunktion)
-def calculate_orbit_path(launch_site_coords, inclination=51.6, orbit_height=300, num_points=200):
-    """Vereinfachte Orbit-Berechnung ohne Zeitverschiebung für Kompatibilität"""
-    return calculate_orbit_path_with_time(launch_site_coords, inclination, orbit_height, 
-                                        time_offset_minutes=0, num_points=num_points)
-
-# Verbesserte Orbit-Pfad-Berechnung mit Erdrotation
-def calculate_orbit_path_with_time(launch_site_coords, inclination=51.6, orbit_height=300, 
-                                  launch_time_utc=None, time_offset_minutes=0, num_points=200):
-    """Berechnet Umlaufbahn unter Berücksichtigung der Erdrotation"""
-    
-    earth_radius = 6371  # km
-    earth_rotation_rate = 360 / (24 * 60)  # Grad pro Minute (15°/Stunde)
-    
-    launch_lat_rad = math.radians(launch_site_coords[0])
-    launch_lon_rad = math.radians(launch_site_coords[1])
-    
-    # Erdrotation seit dem Start berücksichtigen
-    rotation_offset = math.radians(earth_rotation_rate * time_offset_minutes)
-    
-    x0 = earth_radius * math.cos(launch_lat_rad) * math.cos(launch_lon_rad)
-    y0 = earth_radius * math.cos(launch_lat_rad) * math.sin(launch_lon_rad)
-    z0 = earth_radius * math.sin(launch_lat_rad)
-    
-    inclination_rad = math.radians(inclination)
-    
-    # Aufstiegsknoten verschiebt sich mit der Erdrotation
-    right_ascension = (launch_lon_rad + math.pi/2 - rotation_offset) % (2 * math.pi)
-    orbit_radius = earth_radius + orbit_height
-    
-    points = []
-    
-    for i in range(num_points):
-        theta = i * (2 * math.pi / num_points)
-        
-        x_orbit = orbit_radius * math.cos(theta)
-        y_orbit = orbit_radius * math.sin(theta)
-        z_orbit = 0
-        
-        # Rotation um die z-Achse für den Aufstiegsknoten (mit Erdrotation)
-        x_rotated = x_orbit * math.cos(right_ascension) - y_orbit * math.sin(right_ascension)
-        y_rotated = x_orbit * math.sin(right_ascension) + y_orbit * math.cos(right_ascension)
-        z_rotated = z_orbit
-        
-        # Rotation um die x-Achse für die Inklination
-        x_final = x_rotated
-        y_final = y_rotated * math.cos(inclination_rad) - z_rotated * math.sin(inclination_rad)
-        z_final = y_rotated * math.sin(inclination_rad) + z_rotated * math.cos(inclination_rad)
-        
-        # Umrechnung in geografische Koordinaten
-        lat = math.degrees(math.asin(z_final / orbit_radius))
-        lon = math.degrees(math.atan2(y_final, x_final))
-        
-        # Normalisierung der Longitude
-        lon = (lon + 180) % 360 - 180
-        
-        points.append((lat, lon))
-    
-    return points
-
-# Aufstiegspfad-Berechnung
-def calculate_ascent_path(launch_site_coords, target_orbit, ascent_duration=10, num_points=20):
-    start_lat, start_lon = launch_site_coords
-    orbit_path = calculate_orbit_path(launch_site_coords, target_orbit["inclination"], target_orbit["height"], 100)
-    target_point = orbit_path[0]
-    
-    ascent_path = []
-    for i in range(num_points):
-        progress = i / (num_points - 1)
-        current_height = target_orbit["height"] * (1 - math.exp(-5 * progress))
-        current_lat = start_lat + progress * (target_point[0] - start_lat)
-        current_lon = start_lon + progress * (target_point[1] - start_lon)
-        ascent_path.append(((current_lat, current_lon), current_height))
-    
-    return ascent_path
-
-# Deutschland-Koordinaten
-germany_coords = (51.1657, 10.4515)
-
-# Sichtbarkeitsberechnung für einen einzelnen Punkt
-def is_point_visible_from_germany(position, height, time_utc):
-    """Verbesserte Sichtbarkeitsberechnung mit realistischen physikalischen Constraints"""
-    
-    # 1. Mindesthöhe für Sichtbarkeit
-    if height < 100:  # Unter 100km ist praktisch nichts sichtbar
-        return 0, 0, 0
-    
-    # 2. Entfernung zu Deutschland
-    distance = geodesic(germany_coords, position).kilometers
-    
-    # 3. Elevation (Winkel über dem Horizont) berechnen
-    # Vereinfachte Berechnung: Je weiter entfernt, desto niedriger der Winkel
-    earth_radius = 6371  # km
+def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_type, render_mode="markers",
+                          site_registry=None, overlay_source=get_trajectory_visibility_overlay):
+    """Erstellt eine detaillierte Karte mit Aufstiegspfad, Orbit und Sichtbarkeitsfenstern.
     
-    # Winkel über dem Horizont (vereinfacht)
-    if distance > 0:
-        # Berücksichtigung der Erdkrümmung
-        horizon_distance = math.sqrt(2 * earth_radius * height + height**2)
-        
-        if distance > horizon_distance:
-            return 0, 0, 0  # Unter dem Horizont, nicht sichtbar
-        
-        # Elevationswinkel (sehr vereinfacht)
-        elevation_angle = math.degrees(math.atan(height / distance))
-        
-        # Unter 10° Elevation meist nicht gut sichtbar
-        if elevation_angle < 10:
-            elevation_factor = elevation_angle / 10  # Linear abnehmen unter 10°
-        else:
-            elevation_factor = 1.0
-    else:
-        elevation_factor = 1.0
-    
-    # 4. Maximale Sichtdistanz basierend auf Höhe
-    if height < 200:
-        max_visibility_distance = 800  # km für niedrige Höhen
-    elif height < 500:
-        max_visibility_distance = 1200  # km für mittlere Höhen
-    elif height < 1000:
-        max_visibility_distance = 1800  # km für hohe Orbits
-    else:
-        max_visibility_distance = 2500  # km für sehr hohe Orbits
-    
-    # 5. Tageszeit-Faktor (wichtig für Sonnenlicht-Reflexion)
-    de_timezone = pytz.timezone('Europe/Berlin')
-    local_time = time_utc.astimezone(de_timezone)
-    hour = local_time.hour
-    
-    if 22 <= hour or hour <= 4:
-        time_factor = 1.0  # Nacht - beste Sichtbarkeit
-    elif (20 <= hour < 22) or (4 < hour <= 6):
-        time_factor = 0.8  # Dämmerung - gute Sichtbarkeit
-    elif (18 <= hour < 20) or (6 < hour <= 8):
-        time_factor = 0.3  # Morgen/Abend - mäßige Sichtbarkeit
-    else:
-        time_factor = 0.05  # Tag - sehr schlecht sichtbar (nur große, helle Objekte)
-    
-    # 6. Entfernungsfaktor
-    if distance <= max_visibility_distance:
-        distance_factor = max(0, 1 - (distance / max_visibility_distance))
-    else:
-        distance_factor = 0
-    
-    # 7. Höhenfaktor (höhere Objekte sind besser sichtbar)
-    if height >= 400:
-        height_factor = 1.0
-    elif height >= 200:
-        height_factor = 0.8
-    elif height >= 100:
-        height_factor = 0.5
-    else:
-        height_factor = 0.1
-    
-    # 8. Gesamtsichtbarkeit berechnen
-    visibility_chance = (
-        distance_factor * 0.4 +      # 40% Entfernung
-        time_factor * 0.3 +          # 30% Tageszeit  
-        elevation_factor * 0.2 +     # 20% Elevation
-        height_factor * 0.1          # 10% Höhe
-    ) * 100
-    
-    # Realistische Begrenzung
-    visibility_chance = min(100, max(0, visibility_chance))
-    
-    return visibility_chance, distance_factor, time_factor
-
-def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_type):
-    """Erstellt eine detaillierte Karte mit Aufstiegspfad, Orbit und Sichtbarkeitsfenstern"""
+    Im Modus "raster" wird die Sichtbarkeit als ein PNG-Overlay statt als einzelne
+    Marker mit Popups dargestellt. Der Hintergrund-Worker übergibt sein Startort-Register und
+    eine Heatmap-Funktion ohne Streamlit-Cache, Sitzungen nutzen die gecachten Varianten.
+    """
+    import folium
     
     # Karte zentriert auf Europa
     trajectory_map = folium.Map(location=[54, 15], zoom_start=4)
@@ -447,7 +186,7 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
     ).add_to(trajectory_map)
     
     # Linie zwischen ISS und Startplatz
-    distance_iss_launch = geodesic(iss_position, launch_coords).kilometers
+    distance_iss_launch = float(great_circle_distance_km(*iss_position, *launch_coords, ellipsoidal=True))
     if distance_iss_launch < 2000:  # Nur wenn ISS den Start sehen könnte
         folium.PolyLine(
             [iss_position, launch_coords],
@@ -495,20 +234,20 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
         ascent_times.append(current_time)
         
         # Zeitmarkierungen alle 2 Minuten während Aufstieg
-        if minute % 2 == 0:
+        if minute % 2 == 0 and render_mode == "markers":
             # Sichtbarkeit zu diesem Zeitpunkt berechnen
             visibility, _, _ = is_point_visible_from_germany((current_lat, current_lon), current_height, current_time)
             
-            # Nur markieren wenn tatsächlich sichtbar (mindestens 20% und über 100km Höhe)
-            if visibility > 20 and current_height > 100:
+            # Nur markieren wenn tatsächlich sichtbar (Schwelle der Sichtbarkeitsfenster und über 100km Höhe)
+            if visibility >= LAUNCH_WINDOW_MIN_VISIBILITY and current_height > 100:
                 color = "green" if visibility > 60 else "orange" if visibility > 40 else "red"
                 
                 de_timezone = pytz.timezone('Europe/Berlin')
                 local_time = current_time.astimezone(de_timezone)
                 
                 # Elevation berechnen für bessere Info
-                distance_to_germany = geodesic(germany_coords, (current_lat, current_lon)).kilometers
-                elevation_angle = math.degrees(math.atan(current_height / distance_to_germany)) if distance_to_germany > 0 else 0
+                distance_to_germany = distance_from_germany_km(current_lat, current_lon)
+                elevation_angle = float(look_angles_from_germany(current_lat, current_lon, current_height)[0])
                 
                 popup_text = f"""
                 <b>🚀 Aufstieg T+{minute} Min</b><br>
@@ -541,7 +280,6 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
     ).add_to(trajectory_map)
     
     # 2. ORBITALE PFADE - Erster Umlauf mit Erdrotation
-    orbit_period = calculate_orbit_period(target_orbit["height"])  # Minuten
     orbit_start_time = launch_time_utc + timedelta(minutes=ascent_duration)
     
     # Orbit-Pfad mit Erdrotation berechnen
@@ -565,48 +303,59 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
         tooltip=f"🛸 Erster Umlauf ({orbit_start_time.strftime('%H:%M')} UTC)"
     ).add_to(trajectory_map)
     
-    # Sichtbarkeitsanalyse für den ersten Umlauf
-    for i in range(0, len(orbit_path), 8):  # Jeden 8. Punkt markieren
-        point = orbit_path[i]
-        
-        # Zeit für diesen Punkt berechnen
-        point_progress = i / len(orbit_path)
-        point_time = orbit_start_time + timedelta(minutes=point_progress * orbit_period)
-        
-        # Sichtbarkeit berechnen
-        visibility, _, _ = is_point_visible_from_germany(point, target_orbit["height"], point_time)
-        distance = geodesic(germany_coords, point).kilometers
-        
-        # Elevation prüfen
-        elevation_angle = math.degrees(math.atan(target_orbit["height"] / distance)) if distance > 0 else 0
+    if render_mode == "raster":
+        # Sichtbarkeit entlang der gesamten Flugbahn als ein einziges Bild
+        overlay = overlay_source(tuple(launch_coords), launch_time_utc.timestamp(), target_orbit)
+        if overlay is not None:
+            image_url, bounds = overlay
+            folium.raster_layers.ImageOverlay(
+                image=image_url,
+                bounds=bounds,
+                interactive=False,
+                pixelated=False,
+                name="Sichtbarkeit"
+            ).add_to(trajectory_map)
+    else:
+        # Sichtbarkeitsfenster im ersten Umlauf: Abschnitt als Linie, Höhepunkt als Marker
+        de_timezone = pytz.timezone('Europe/Berlin')
+        orbit_windows = [window for window in calculate_visibility_schedule(launch_coords, launch_time_utc, target_orbit, 1)
+                         if window['phase'] != "Aufstieg"]
         
-        # Nur Punkte mit >10° Elevation und >30% Sichtbarkeit anzeigen
-        if visibility > 30 and elevation_angle > 10:
-            color = "lightgreen" if visibility > 70 else "yellow" if visibility > 50 else "orange"
+        for window in orbit_windows:
+            color = "lightgreen" if window['visibility'] > 70 else "yellow" if window['visibility'] > 50 else "orange"
             
-            de_timezone = pytz.timezone('Europe/Berlin')
-            local_time = point_time.astimezone(de_timezone)
+            window_lats, window_lons, _ = launch_positions(launch_coords, launch_time_utc.timestamp(), target_orbit,
+                                                           np.linspace(window['start'], window['end'], 20))
+            folium.PolyLine(
+                np.column_stack([window_lats, window_lons]).tolist(),
+                color=color,
+                weight=8,
+                opacity=0.8,
+                tooltip=f"Sichtbar {window['start_de']} bis {window['end_de']}"
+            ).add_to(trajectory_map)
             
             popup_text = f"""
             <b>🛸 Erster Umlauf</b><br>
-            Zeit UTC: {point_time.strftime('%H:%M:%S')}<br>
-            Zeit DE: {local_time.strftime('%H:%M:%S')}<br>
+            Beginn DE: {window['start_de']} ({window['start_direction']})<br>
+            Höhepunkt DE: {window['time_de']}<br>
+            Ende DE: {window['end_de']} ({window['end_direction']})<br>
+            Dauer: {window['duration'] / 60:.1f} Min<br>
             Höhe: {target_orbit["height"]} km<br>
-            Elevation: {elevation_angle:.1f}°<br>
-            Entfernung: {distance:.0f} km<br>
-            Sichtbarkeit: {visibility:.0f}%<br>
-            Position: {point[0]:.1f}°N, {point[1]:.1f}°E
+            Max. Elevation: {window['elevation']:.1f}°<br>
+            Entfernung: {window['distance']:.0f} km<br>
+            Sichtbarkeit: {window['visibility']:.0f}%<br>
+            Position: {window['coords'][0]:.1f}°N, {window['coords'][1]:.1f}°E
             """
             
             folium.CircleMarker(
-                location=point,
+                location=window['coords'],
                 radius=8,
                 color=color,
                 fill=True,
                 fillColor=color,
                 fillOpacity=0.8,
                 popup=popup_text,
-                tooltip=f"Umlauf 1: {visibility:.0f}% sichtbar, {elevation_angle:.1f}° Elevation"
+                tooltip=f"Umlauf 1: {window['visibility']:.0f}% sichtbar, {window['elevation']:.1f}° Elevation"
             ).add_to(trajectory_map)
     
     # 3. SICHTBARKEITSZONEN um Deutschland
@@ -628,7 +377,7 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
         ).add_to(trajectory_map)
     
     # 4. BESTE STARTPOSITIONEN markieren
-    best_positions = get_best_launch_positions_for_germany()
+    best_positions = get_best_launch_positions_for_germany(site_registry or get_launch_site_registry())
     for i, pos in enumerate(best_positions[:3]):  # Top 3 anzeigen
         if i == 0:
             color = "gold"
@@ -647,13 +396,18 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
         ).add_to(trajectory_map)
     
     # 5. LEGENDE erstellen
-    legend_html = f"""
-    <div style="position: fixed; top: 10px; right: 10px; z-index: 1000; 
-                background-color: white; padding: 15px; border: 2px solid grey; 
-                border-radius: 10px; font-size: 12px; max-width: 250px;">
-    <h4>🗺️ Flugbahn-Legende</h4>
-    
-    <p><b>Aufstieg (T+0 bis T+{ascent_duration} Min):</b><br>
+    if render_mode == "raster":
+        visibility_legend_html = f"""<p><b>Flugbahn:</b><br>
+    <i class="fa fa-circle" style="color:red;"></i> Aufstieg (T+0 bis T+{ascent_duration} Min)<br>
+    <i class="fa fa-circle" style="color:blue;"></i> Erster Umlauf (Start+{ascent_duration:.0f}min)</p>
+    
+    <p><b>Heatmap Sichtbarkeit:</b><br>
+    <span style="display:inline-block; width:200px; height:10px;
+          background:linear-gradient(to right, rgb(220,50,30), rgb(255,140,0), rgb(255,230,0), rgb(120,220,60), rgb(0,170,80));"></span><br>
+    20% &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp; 60% &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp; 100%<br>
+    Orbit nur ab >10° Elevation</p>"""
+    else:
+        visibility_legend_html = f"""<p><b>Aufstieg (T+0 bis T+{ascent_duration} Min):</b><br>
     <i class="fa fa-circle" style="color:red;"></i> Aufstiegspfad<br>
     <i class="fa fa-circle" style="color:green;"></i> Gut sichtbar (>60%, >100km Höhe)<br>
     <i class="fa fa-circle" style="color:orange;"></i> Bedingt sichtbar (40-60%, >100km)<br>
@@ -663,7 +417,16 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
     <i class="fa fa-circle" style="color:blue;"></i> Erster Umlauf (Start+{ascent_duration:.0f}min)<br>
     <i class="fa fa-circle" style="color:lightgreen;"></i> Sehr gut sichtbar (>70%, >10° Elevation)<br>
     <i class="fa fa-circle" style="color:yellow;"></i> Gut sichtbar (50-70%, >10° Elevation)<br>
-    <i class="fa fa-circle" style="color:orange;"></i> Bedingt sichtbar (30-50%, >10° Elevation)</p>
+    <i class="fa fa-circle" style="color:orange;"></i> Bedingt sichtbar (20-50%, >10° Elevation)<br>
+    Linie = Sichtbarkeitsfenster, Punkt = Höhepunkt</p>"""
+    
+    legend_html = f"""
+    <div style="position: fixed; top: 10px; right: 10px; z-index: 1000; 
+                background-color: white; padding: 15px; border: 2px solid grey; 
+                border-radius: 10px; font-size: 12px; max-width: 250px;">
+    <h4>🗺️ Flugbahn-Legende</h4>
+    
+    {visibility_legend_html}
     
     <p><b>🌍 Realistische Orbital-Mechanik:</b><br>
     • Zeigt nur den ersten Umlauf nach dem Start<br>
@@ -688,364 +451,163 @@ def create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_ty
     
     return trajectory_map
 
-def calculate_visibility_schedule(launch_coords, launch_time_utc, target_orbit):
-    """Berechnet einen detaillierten Zeitplan der Sichtbarkeitsfenster"""
-    
-    schedule = []
-    de_timezone = pytz.timezone('Europe/Berlin')
-    
-    # 1. Aufstiegsphase
-    ascent_duration = target_orbit["ascent_duration"]
-    
-    for minute in range(0, ascent_duration + 1, 2):  # Alle 2 Minuten
-        progress = minute / ascent_duration
-        
-        # Vereinfachte Position während Aufstieg
-        inclination_rad = math.radians(target_orbit["inclination"])
-        lat_offset = progress * 2 * math.cos(inclination_rad)
-        lon_offset = progress * 4 * math.sin(inclination_rad) if target_orbit["inclination"] > 0 else progress * 4
-        
-        current_lat = launch_coords[0] + lat_offset
-        current_lon = launch_coords[1] + lon_offset
-        current_height = target_orbit["height"] * (1 - math.exp(-3 * progress))
-        
-        current_time = launch_time_utc + timedelta(minutes=minute)
-        visibility, _, _ = is_point_visible_from_germany((current_lat, current_lon), current_height, current_time)
-        
-        distance = geodesic(germany_coords, (current_lat, current_lon)).kilometers
-        
-        schedule.append({
-            'phase': f'Aufstieg T+{minute} Min',
-            'time_utc': current_time.strftime('%H:%M:%S'),
-            'time_de': current_time.astimezone(de_timezone).strftime('%H:%M:%S'),
-            'coords': (current_lat, current_lon),
-            'height': int(current_height),
-            'visibility': visibility,
-            'distance': distance
-        })
-    
-    # 2. Orbitale Phase - erste 3 Umläufe mit Erdrotation
-    orbit_period = calculate_orbit_period(target_orbit["height"])
-    orbit_start_time = launch_time_utc + timedelta(minutes=ascent_duration)
-    
-    for orbit_num in range(3):  # Erste 3 Umläufe
-        orbit_time_offset = orbit_num * orbit_period
-        current_orbit_time = orbit_start_time + timedelta(minutes=orbit_time_offset)
-        
-        # Orbit-Pfad mit Erdrotation für diesen Zeitpunkt
-        orbit_path = calculate_orbit_path_with_time(
-            launch_coords,
-            target_orbit["inclination"],
-            target_orbit["height"],
-            launch_time_utc,
-            ascent_duration + orbit_time_offset,
-            60
-        )
-        
-        for i in range(0, len(orbit_path), 5):  # Jeden 5. Punkt prüfen
-            point = orbit_path[i]
-            point_progress = i / len(orbit_path)
-            point_time = current_orbit_time + timedelta(minutes=point_progress * orbit_period)
-            
-            visibility, _, _ = is_point_visible_from_germany(point, target_orbit["height"], point_time)
-            distance = geodesic(germany_coords, point).kilometers
-            
-            # Elevation prüfen
-            elevation_angle = math.degrees(math.atan(target_orbit["height"] / distance)) if distance > 0 else 0
-            
-            if visibility > 20 and elevation_angle > 10:  # Nur relevante und sichtbare Punkte
-                schedule.append({
-                    'phase': f'Umlauf {orbit_num + 1}',
-                    'time_utc': point_time.strftime('%H:%M:%S'),
-                    'time_de': point_time.astimezone(de_timezone).strftime('%H:%M:%S'),
-                    'coords': point,
-                    'height': target_orbit["height"],
-                    'visibility': visibility,
-                    'distance': distance
-                })
-    
-    # Nach Sichtbarkeit sortieren
-    schedule = sorted(schedule, key=lambda x: x['visibility'], reverse=True)
-    
-    return schedule[:15]  # Top 15 Sichtbarkeitsfenster
+# Cache für fertig gerenderte Karten (HTML), damit Reruns die Karte nicht neu aufbauen
+MAP_MODEL_VERSION = 7  # erhöhen, wenn sich Inhalt oder Berechnung der Karten ändert
+MAP_CACHE_MAX_BYTES = int(float(os.environ.get("ROCKETS_MAP_CACHE_MB", "64")) * 1024 * 1024)
+MAP_WIDTH = 700
+MAP_HEIGHT = 500
 
-def calculate_direction_from_germany(coords):
-    """Berechnet die Himmelsrichtung von Deutschland aus zu den gegebenen Koordinaten"""
-    
-    lat_diff = coords[0] - germany_coords[0]
-    lon_diff = coords[1] - germany_coords[1]
-    
-    if abs(lat_diff) > abs(lon_diff):
-        if lat_diff > 0:
-            return "Norden 🧭"
-        else:
-            return "Süden 🧭"
-    else:
-        if lon_diff > 0:
-            return "Osten 🧭"
-        else:
-            return "Westen 🧭"
+class MapHtmlCache:
+    """Thread-sicherer LRU-Cache für Karten-HTML mit Speicherbudget in Bytes"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        with self.lock:
+            html = self.entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return html
+    
+    def put(self, key, html):
+        size = len(html.encode("utf-8"))
+        if size > self.max_bytes:
+            return  # Einzelne Karte größer als das Budget: nicht cachen
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= len(self.entries.pop(key).encode("utf-8"))
+            self.entries[key] = html
+            self.total_bytes += size
+            # Am längsten nicht genutzte Karten verdrängen
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted.encode("utf-8"))
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
 
-def get_iss_position_approximation(time_utc):
-    """Approximiert die ISS-Position zu einem gegebenen Zeitpunkt"""
-    # ISS Orbital-Parameter (vereinfacht)
-    iss_height = 408  # km
-    iss_inclination = 51.6  # Grad
-    iss_period = 92.68  # Minuten
-    
-    # Referenzzeitpunkt (approximiert)
-    epoch = datetime(2025, 1, 1, tzinfo=pytz.UTC)
-    minutes_since_epoch = (time_utc - epoch).total_seconds() / 60
-    
-    # Orbits seit Epoche
-    orbits_completed = minutes_since_epoch / iss_period
-    current_orbit_progress = (orbits_completed % 1) * 360  # Grad im aktuellen Orbit
-    
-    # Vereinfachte Position basierend auf Inklination
-    lat = math.sin(math.radians(current_orbit_progress)) * iss_inclination
-    
-    # Longitude mit Erdrotation
-    earth_rotation_since_epoch = minutes_since_epoch * (360 / (24 * 60))  # Grad
-    lon = (current_orbit_progress - earth_rotation_since_epoch) % 360
-    if lon > 180:
-        lon -= 360
-    
-    return (lat, lon)
+@st.cache_resource
+def get_map_html_cache():
+    """Ein Karten-Cache pro Prozess, gemeinsam für alle Sitzungen"""
+    return MapHtmlCache(MAP_CACHE_MAX_BYTES)
 
-def get_iss_visibility_info(launch_time_utc, launch_coords):
-    """Berechnet ISS-Sichtbarkeitsinformationen für einen Start"""
-    
-    iss_position = get_iss_position_approximation(launch_time_utc)
-    
-    # Entfernung ISS zu Startplatz
-    distance_to_launch = geodesic(iss_position, launch_coords).kilometers
-    
-    # ISS-Sichtbarkeit von Deutschland
-    iss_visibility_from_germany, _, _ = is_point_visible_from_germany(
-        iss_position, 408, launch_time_utc
-    )
-    
-    # Kann ISS den Start sehen? (vereinfachte Berechnung)
-    # ISS kann etwa 2000km weit sehen
-    iss_can_see_launch = "Ja ✅" if distance_to_launch < 2000 else "Nein ❌"
-    
-    visibility_text = "Sehr gut ✅" if iss_visibility_from_germany > 70 else \
-                     "Gut ⭐" if iss_visibility_from_germany > 40 else \
-                     "Möglich 🟡" if iss_visibility_from_germany > 10 else "Nicht sichtbar ❌"
-    
-    return {
-        'approx_position': f"{iss_position[0]:.1f}°N, {iss_position[1]:.1f}°E",
-        'visibility_from_germany': visibility_text,
-        'distance_to_launch': distance_to_launch,
-        'iss_can_see_launch': iss_can_see_launch
-    }
+def render_map_html(folium_map):
+    """Rendert eine folium-Karte einmalig zu eigenständigem HTML (wie folium_static)"""
+    import folium
+    return folium.Figure().add_child(folium_map).render()
 
-def get_best_launch_positions_for_germany():
-    """Gibt die besten Startpositionen für Sichtbarkeit von Deutschland zurück"""
-    
-    # Bekannte Startplätze mit Koordinaten
-    launch_sites = [
-        {"name": "SaxaVord Spaceport (Schottland)", "coords": (60.7, -0.8), "active": True},
-        {"name": "Andøya Spaceport (Norwegen)", "coords": (69.3, 16.0), "active": True},
-        {"name": "Sutherland Spaceport (Schottland)", "coords": (58.4, -4.2), "active": True},
-        {"name": "Plesetsk (Russland)", "coords": (62.9, 40.6), "active": True},
-        {"name": "Vandenberg (Kalifornien)", "coords": (34.6, -120.6), "active": True},
-        {"name": "Cape Canaveral (Florida)", "coords": (28.6, -80.6), "active": True},
-        {"name": "Kourou (Franz. Guayana)", "coords": (5.2, -52.8), "active": True},
-        {"name": "Baikonur (Kasachstan)", "coords": (45.9, 63.3), "active": True},
-        {"name": "Wallops (Virginia)", "coords": (37.8, -75.5), "active": True},
-        {"name": "Rocket Lab Mahia (Neuseeland)", "coords": (-39.3, 177.9), "active": True}
-    ]
-    
-    # Berechne Entfernungen und bewerte Sichtbarkeit
-    for site in launch_sites:
-        distance = geodesic(germany_coords, site["coords"]).kilometers
-        site["distance"] = distance
-        
-        # Bewertung basierend auf Entfernung
-        if distance <= 1000:
-            site["rating"] = "Exzellent"
-            site["score"] = 5
-        elif distance <= 2000:
-            site["rating"] = "Sehr gut"
-            site["score"] = 4
-        elif distance <= 3500:
-            site["rating"] = "Gut"
-            site["score"] = 3
-        elif distance <= 6000:
-            site["rating"] = "Mäßig"
-            site["score"] = 2
-        else:
-            site["rating"] = "Schlecht"
-            site["score"] = 1
-    
-    # Sortiere nach Entfernung (beste zuerst)
-    launch_sites.sort(key=lambda x: x["distance"])
-    
-    return launch_sites[:5]  # Top 5
+def trajectory_map_key(launch, orbit_type, render_mode, site_registry):
+    """Schlüssel aus Start-ID, Startzeit, Orbit-Typ, Darstellung, Modellversion, ISS-Bahndaten und
+    Startort-Register statt aus den Argumenten"""
+    return (launch.id, launch.net_epoch, orbit_type, render_mode, MAP_MODEL_VERSION, get_iss_data_version(),
+            site_registry.version)
 
-def get_launch_position_rank(launch_coords):
-    """Bewertet die Qualität einer Startposition für Deutschland"""
-    
-    distance = geodesic(germany_coords, launch_coords).kilometers
-    
-    if distance <= 1000:
-        return "🥇 Exzellent (Top 3 weltweit)"
-    elif distance <= 2000:
-        return "🥈 Sehr gut (Top 10 weltweit)" 
-    elif distance <= 3500:
-        return "🥉 Gut (Top 20 weltweit)"
-    elif distance <= 6000:
-        return "🟡 Mäßig (Top 50 weltweit)"
-    else:
-        return "🔴 Schlecht für Sichtbarkeit"
+def get_trajectory_map_html(launch, target_orbit, orbit_type, render_mode=MAP_RENDER_MODE):
+    """Liefert das HTML der Flugbahnkarte eines Starts: vorberechnet, aus dem Cache oder neu gerendert"""
+    cache_key = trajectory_map_key(launch, orbit_type, render_mode, get_launch_site_registry())
+    html = (read_precomputed("launch_maps") or {}).get(cache_key)
+    if html is not None:
+        return html
+    
+    map_cache = get_map_html_cache()
+    html = map_cache.get(cache_key)
+    if html is None:
+        trajectory_map = create_trajectory_map(launch.coords, launch.net_utc, target_orbit, orbit_type, render_mode)
+        html = render_map_html(trajectory_map)
+        map_cache.put(cache_key, html)
+    return html
 
-def get_current_iss_info():
-    """Holt aktuelle ISS-Position und -Daten"""
-    try:
-        # Vereinfachte ISS-Position (in echter App würde man ISS API verwenden)
-        import time
-        current_time = time.time()
-        
-        # Simulierte ISS-Position basierend auf aktueller Zeit
-        iss_period = 92.68 * 60  # ISS Umlaufzeit in Sekunden
-        progress = (current_time % iss_period) / iss_period
-        
-        # Vereinfachte Orbital-Berechnung
-        lat = math.sin(progress * 2 * math.pi) * 51.6  # Max Breite entspricht Inklination
-        lon = (progress * 360 - (current_time / 240) % 360) % 360  # Erdrotation berücksichtigen
-        if lon > 180:
-            lon -= 360
-            
-        return {
-            'latitude': lat,
-            'longitude': lon,
-            'altitude': 408.0,  # Durchschnittliche ISS-Höhe
-            'velocity': 27600.0  # km/h
-        }
-    except:
-        # Fallback-Position
-        return {
-            'latitude': 0.0,
-            'longitude': 0.0,
-            'altitude': 408.0,
-            'velocity': 27600.0
-        }
+def show_map_html(html, width=MAP_WIDTH, height=MAP_HEIGHT):
+    """Zeigt fertig gerendertes Karten-HTML an"""
+    components.html(html, height=height + 10, width=width)
 
-def get_iss_visibility_from_germany():
-    """Berechnet aktuelle ISS-Sichtbarkeit von Deutschland"""
-    current_time = datetime.now(pytz.UTC)
-    iss_info = get_current_iss_info()
-    iss_coords = (iss_info['latitude'], iss_info['longitude'])
-    
-    # Entfernung und Elevation berechnen
-    distance = geodesic(germany_coords, iss_coords).kilometers
-    
-    if distance > 2000:  # ISS zu weit entfernt
-        return {
-            'is_visible': False,
-            'reason': 'ISS zu weit entfernt',
-            'next_pass': 'In ~45 Minuten',
-            'elevation': 0,
-            'azimuth': 0,
-            'direction': 'N/A',
-            'visibility_quality': 'Nicht sichtbar'
-        }
-    
-    # Elevation über Horizont
-    elevation = math.degrees(math.atan(iss_info['altitude'] / distance)) if distance > 0 else 0
-    
-    # Azimut (vereinfacht)
-    lat_diff = iss_coords[0] - germany_coords[0]
-    lon_diff = iss_coords[1] - germany_coords[1]
-    azimuth = math.degrees(math.atan2(lon_diff, lat_diff)) % 360
-    
-    # Richtung bestimmen
-    if 337.5 <= azimuth or azimuth < 22.5:
-        direction = "Norden"
-    elif 22.5 <= azimuth < 67.5:
-        direction = "Nordosten"
-    elif 67.5 <= azimuth < 112.5:
-        direction = "Osten"
-    elif 112.5 <= azimuth < 157.5:
-        direction = "Südosten"
-    elif 157.5 <= azimuth < 202.5:
-        direction = "Süden"
-    elif 202.5 <= azimuth < 247.5:
-        direction = "Südwesten"
-    elif 247.5 <= azimuth < 292.5:
-        direction = "Westen"
-    else:
-        direction = "Nordwesten"
-    
-    # Sichtbarkeit prüfen
-    visibility, _, _ = is_point_visible_from_germany(iss_coords, iss_info['altitude'], current_time)
-    
-    if elevation < 10:
-        return {
-            'is_visible': False,
-            'reason': 'Unter dem Horizont',
-            'next_pass': 'In ~20-90 Minuten',
-            'elevation': elevation,
-            'azimuth': azimuth,
-            'direction': direction,
-            'visibility_quality': 'Nicht sichtbar'
-        }
-    
-    if visibility < 30:
-        return {
-            'is_visible': False,
-            'reason': 'Ungünstige Lichtverhältnisse',
-            'next_pass': 'Bei Dämmerung/Nacht',
-            'elevation': elevation,
-            'azimuth': azimuth,
-            'direction': direction,
-            'visibility_quality': 'Schlecht'
-        }
-    
-    # ISS ist sichtbar!
-    quality = "Exzellent" if visibility > 80 else "Sehr gut" if visibility > 60 else "Gut"
-    
-    return {
-        'is_visible': True,
-        'elevation': elevation,
-        'azimuth': azimuth,
-        'direction': direction,
-        'visibility_quality': quality,
-        'next_pass': 'Jetzt sichtbar!',
-        'reason': 'Optimal sichtbar'
-    }
+def build_launch_visibility_field(launch_coords, launch_epoch, target_orbit, resolution_km):
+    """Sichtbarkeitsfeld über Deutschland für Aufstieg und ersten Umlauf eines Starts"""
+    launch_time_utc = datetime.fromtimestamp(launch_epoch, pytz.UTC)
+    lats, lons, heights, epochs = build_launch_trajectory(launch_coords, launch_time_utc, target_orbit)
+    return compute_visibility_field(get_observer_grid(resolution_km), lats, lons, heights, epochs)
+
+@st.cache_data(max_entries=32)
+def get_launch_visibility_field(launch_coords, launch_epoch, target_orbit, resolution_km):
+    """Sichtbarkeitsfeld je Start und Auflösung gecacht (für Sitzungen)"""
+    return build_launch_visibility_field(launch_coords, launch_epoch, target_orbit, resolution_km)
+
+def get_current_visibility_field(launch, orbit_type, target_orbit, resolution_km):
+    """Sichtbarkeitsfeld aus dem Worker (nächste Starts, Standardauflösung), sonst gecacht berechnet"""
+    field = (read_precomputed("visibility_fields") or {}).get((launch.id, launch.net_epoch, orbit_type, resolution_km))
+    if field is None:
+        return get_launch_visibility_field(launch.coords, launch.net_epoch, target_orbit, resolution_km)
+    return field
+
+def build_launch_timeline(launch_coords, launch_epoch, target_orbit, days):
+    """Alle Sichtbarkeitsfenster eines Starts in den ersten days Tagen"""
+    launch_time_utc = datetime.fromtimestamp(launch_epoch, pytz.UTC)
+    return list(iter_visibility_windows(launch_coords, launch_time_utc, target_orbit, days))
+
+@st.cache_data(max_entries=32)
+def get_launch_timeline(launch_coords, launch_epoch, target_orbit, days):
+    """Fenster-Zeitplan je Start und Zeitraum gecacht (für Sitzungen)"""
+    return build_launch_timeline(launch_coords, launch_epoch, target_orbit, days)
+
+def get_current_launch_timeline(launch, orbit_type, target_orbit, days):
+    """Fenster-Zeitplan aus dem Worker (nächste Starts, Standardzeitraum), sonst gecacht berechnet"""
+    timeline = (read_precomputed("launch_timelines") or {}).get((launch.id, launch.net_epoch, orbit_type, days))
+    if timeline is None:
+        return get_launch_timeline(launch.coords, launch.net_epoch, target_orbit, days)
+    return timeline
+
+# Startort-Register aus rockets.sites, prozessweit je Version der Startdaten
+@st.cache_resource(max_entries=4)
+def _build_launch_site_registry(launch_table_version, _launches):
+    """Register einmal pro Version der Startdaten aufbauen"""
+    return LaunchSiteRegistry.from_sources(STATIC_LAUNCH_SITES, _launches)
+
+def get_launch_site_registry():
+    """Startort-Register aus statischer Liste und aktuellem Launch-Feed"""
+    launches = get_current_launch_table()
+    version = None if launches is None else launches.version
+    registry = read_precomputed("site_registry", version)
+    if registry is None:
+        registry = _build_launch_site_registry(version, launches)
+    return registry
 
 def get_next_iss_pass_time():
-    """Berechnet die nächste ISS-Sichtung (vereinfacht)"""
-    now = datetime.now(pytz.UTC)
-    
-    # Vereinfachte Berechnung: ISS ist etwa alle 90 Minuten sichtbar
-    # Suche den nächsten Zeitpunkt mit guter Sichtbarkeit
-    for minutes_ahead in range(10, 180, 10):  # Prüfe alle 10 Minuten für die nächsten 3 Stunden
-        future_time = now + timedelta(minutes=minutes_ahead)
-        
-        # Simuliere ISS-Position zu diesem Zeitpunkt
-        future_timestamp = future_time.timestamp()
-        iss_period = 92.68 * 60
-        progress = (future_timestamp % iss_period) / iss_period
-        
-        lat = math.sin(progress * 2 * math.pi) * 51.6
-        lon = (progress * 360 - (future_timestamp / 240) % 360) % 360
-        if lon > 180:
-            lon -= 360
-            
-        iss_coords = (lat, lon)
-        distance = geodesic(germany_coords, iss_coords).kilometers
-        elevation = math.degrees(math.atan(408 / distance)) if distance > 0 else 0
-        
-        visibility, _, _ = is_point_visible_from_germany(iss_coords, 408, future_time)
-        
-        if elevation > 10 and visibility > 30:  # Gute Sichtbarkeit
-            return future_time
+    """Berechnet den Beginn der nächsten gut sichtbaren ISS-Sichtung"""
+    for iss_pass in get_upcoming_iss_passes():
+        if iss_pass['visibility'] > 30:  # Gute Sichtbarkeit
+            return datetime.fromtimestamp(iss_pass['rise'], pytz.UTC)
     
-    # Fallback: In 2 Stunden
-    return now + timedelta(hours=2)
+    return None
+
+@st.cache_data(ttl=1800, show_spinner="Berechne Starlink-Überflüge...")
+def get_starlink_night_passes(catalog_version, night_start, night_end):
+    """Starlink-Überflüge einer Nacht, einmal pro Katalogversion und Nacht berechnet"""
+    catalog = get_satellite_catalog(STARLINK_TLE_PATH)
+    if catalog is None:
+        return []
+    return predict_constellation_passes(catalog, night_start, night_end)
+
+def get_current_starlink_passes(catalog, night_start, night_end):
+    """Starlink-Überflüge aus dem Worker (Schlüssel: Katalog und Nachtende, ohne bereits beendete), sonst direkt"""
+    passes = read_precomputed("starlink_passes", (catalog.version, night_end))
+    if passes is None:
+        return get_starlink_night_passes(catalog.version, night_start, night_end)
+    return [satellite_pass for satellite_pass in passes if satellite_pass['set'] > night_start]
 
 def create_iss_countdown(next_pass_time):
     """Erstellt Countdown zur nächsten ISS-Sichtung"""
@@ -1097,6 +659,7 @@ def create_iss_countdown(next_pass_time):
 
 def create_iss_live_map(iss_info):
     """Erstellt eine kleine Live-Karte mit ISS-Position"""
+    import folium
     
     # Karte zentriert auf ISS
     iss_map = folium.Map(
@@ -1123,9 +686,9 @@ def create_iss_live_map(iss_info):
         icon=folium.Icon(color="blue", icon="eye", prefix="fa")
     ).add_to(iss_map)
     
-    # Sichtbarkeitslinie falls ISS sichtbar
-    distance = geodesic(germany_coords, (iss_info['latitude'], iss_info['longitude'])).kilometers
-    if distance < 2000:
+    # Sichtbarkeitslinie falls ISS über dem Horizont (Schrägentfernung)
+    elevation, _, distance = look_angles_from_germany(iss_info['latitude'], iss_info['longitude'], iss_info['altitude'])
+    if elevation >= 0:
         folium.PolyLine(
             [germany_coords, [iss_info['latitude'], iss_info['longitude']]],
             color="green",
@@ -1153,91 +716,6 @@ def create_iss_live_map(iss_info):
     
     return iss_map
 
-def evaluate_reentry_visibility(trajectory_start, trajectory_end, predicted_location, reentry_time_utc):
-    """Bewertet die Sichtbarkeit eines Wiedereintritts von Deutschland aus"""
-    
-    # Berechne Entfernung der Trajektorie zu Deutschland
-    start_distance = geodesic(germany_coords, trajectory_start).kilometers
-    end_distance = geodesic(germany_coords, trajectory_end).kilometers
-    pred_distance = geodesic(germany_coords, predicted_location).kilometers
-    
-    # Minimale Entfernung zur Trajektorie
-    min_distance = min(start_distance, end_distance, pred_distance)
-    
-    # Tageszeit berücksichtigen (SEHR WICHTIG für Wiedereintritte!)
-    de_timezone = pytz.timezone('Europe/Berlin')
-    local_time = reentry_time_utc.astimezone(de_timezone)
-    hour = local_time.hour
-    
-    # Tageszeit-Faktor bestimmen
-    if 22 <= hour or hour <= 4:
-        time_factor = 1.0  # Nacht - beste Sichtbarkeit
-        time_rating = "🌙 Optimal (Nacht)"
-    elif (20 <= hour < 22) or (4 < hour <= 6):
-        time_factor = 0.8  # Dämmerung - gute Sichtbarkeit
-        time_rating = "🌅 Gut (Dämmerung)"
-    elif (18 <= hour < 20) or (6 < hour <= 8):
-        time_factor = 0.3  # Morgen/Abend-Dämmerung - mäßige Sichtbarkeit
-        time_rating = "🌅 Mäßig (Dämmerung)"
-    else:
-        time_factor = 0.0  # Tag - praktisch nicht sichtbar
-        time_rating = "☀️ Nicht sichtbar (Tag)"
-    
-    # Basis-Sichtbarkeitsbewertung basierend auf Entfernung
-    if min_distance <= 300:
-        base_rating = "Exzellent"
-        base_description = "Direkt über Deutschland - spektakuläre Sichtung"
-    elif min_distance <= 800:
-        base_rating = "Sehr gut"
-        base_description = "Sehr hohe Wahrscheinlichkeit einer beeindruckenden Sichtung"
-    elif min_distance <= 1500:
-        base_rating = "Gut"
-        base_description = "Gute Sichtbarkeitschancen bei klarem Himmel"
-    elif min_distance <= 2500:
-        base_rating = "Möglich"
-        base_description = "Sichtbarkeit nur bei optimalen Bedingungen"
-    else:
-        base_rating = "Unwahrscheinlich"
-        base_description = "Zu weit entfernt für gute Sichtbarkeit"
-    
-    # Finale Sichtbarkeitsbewertung mit Tageszeit-Korrektur
-    if time_factor == 0.0:
-        # Am Tag: Immer nicht sichtbar, egal wie nah
-        visibility_rating = "🔴 Nicht sichtbar"
-        description = f"Am Tag nicht sichtbar (Entfernung: {min_distance:.0f}km)"
-    elif time_factor >= 0.8:
-        # Nacht/frühe Dämmerung: Volle Bewertung
-        if base_rating == "Exzellent":
-            visibility_rating = "🟢 Exzellent"
-        elif base_rating == "Sehr gut":
-            visibility_rating = "🟢 Sehr gut"
-        elif base_rating == "Gut":
-            visibility_rating = "🟡 Gut"
-        elif base_rating == "Möglich":
-            visibility_rating = "🟠 Möglich"
-        else:
-            visibility_rating = "🔴 Unwahrscheinlich"
-        description = f"{base_description} bei {time_rating.lower()}"
-    else:
-        # Späte Dämmerung: Reduzierte Bewertung
-        if base_rating in ["Exzellent", "Sehr gut"]:
-            visibility_rating = "🟡 Mäßig"
-            description = f"Bei Dämmerung mäßig sichtbar (Entfernung: {min_distance:.0f}km)"
-        elif base_rating == "Gut":
-            visibility_rating = "🟠 Schwach"
-            description = f"Bei Dämmerung schwach sichtbar (Entfernung: {min_distance:.0f}km)"
-        else:
-            visibility_rating = "🔴 Unwahrscheinlich"
-            description = f"Auch bei Dämmerung kaum sichtbar (Entfernung: {min_distance:.0f}km)"
-    
-    return {
-        'visibility_rating': visibility_rating,
-        'description': description,
-        'time_rating': time_rating,
-        'distance': min_distance,
-        'time_factor': time_factor
-    }
-
 def create_reentry_countdown(reentry_time, title, uncertainty_hours):
     """Erstellt einen Countdown für Wiedereintritt"""
     countdown_html = f"""
@@ -1293,6 +771,7 @@ def create_reentry_countdown(reentry_time, title, uncertainty_hours):
 
 def create_reentry_trajectory_map(reentry_data):
     """Erstellt eine Karte mit der Wiedereintritts-Trajektorie"""
+    import folium
     
     # Karte zentriert auf die Trajektorie
     center_lat = (reentry_data['trajectory_start']['lat'] + reentry_data['trajectory_end']['lat']) / 2
@@ -1413,493 +892,287 @@ def create_reentry_trajectory_map(reentry_data):
     
     return reentry_map
 
-def calculate_reentry_observation_windows(reentry_data):
-    """Berechnet optimale Beobachtungsfenster für einen Wiedereintritt"""
-    
-    windows = []
-    de_timezone = pytz.timezone('Europe/Berlin')
-    
-    # Wiedereintritts-Trajectory in Segmente unterteilen
-    trajectory_points = []
-    for i in range(11):  # 11 Punkte für 10 Segmente
-        progress = i / 10
-        lat = reentry_data['trajectory_start']['lat'] + progress * (reentry_data['trajectory_end']['lat'] - reentry_data['trajectory_start']['lat'])
-        lon = reentry_data['trajectory_start']['lon'] + progress * (reentry_data['trajectory_end']['lon'] - reentry_data['trajectory_start']['lon'])
-        
-        # Höhe während Wiedereintritt (120km bis 0km)
-        altitude = 120 * (1 - progress)
-        
-        trajectory_points.append((lat, lon, altitude))
-    
-    # Zeitpunkte für jeden Punkt der Trajektorie
-    total_duration = reentry_data['visibility_duration_minutes']
-    
-    for i, (lat, lon, altitude) in enumerate(trajectory_points):
-        # Zeit für diesen Punkt
-        time_offset_minutes = (i / len(trajectory_points)) * total_duration
-        point_time = reentry_data['reentry_time'] + timedelta(minutes=time_offset_minutes - total_duration/2)
-        
-        # Sichtbarkeit für diesen Punkt berechnen
-        distance = geodesic(germany_coords, (lat, lon)).kilometers
-        
-        # Elevation berechnen (vereinfacht)
-        if distance > 0 and altitude > 0:
-            elevation_angle = math.degrees(math.atan(altitude / distance))
-        else:
-            elevation_angle = 0
-        
-        # Wiedereintritt-spezifische Sichtbarkeit (heller als normale Satelliten)
-        base_visibility = 0
-        
-        if distance <= 300:
-            base_visibility = 90
-        elif distance <= 800:
-            base_visibility = 75
-        elif distance <= 1500:
-            base_visibility = 60
-        elif distance <= 2500:
-            base_visibility = 40
-        else:
-            base_visibility = 15
-        
-        # Höhen-Bonus (höhere Objekte besser sichtbar)
-        altitude_bonus = min(20, altitude / 6)  # Bis zu 20% Bonus
-        
-        # Tageszeit-Faktor
-        local_time = point_time.astimezone(de_timezone)
-        hour = local_time.hour
-        
-        if 20 <= hour or hour <= 6:
-            time_factor = 1.0
-        elif 18 <= hour < 20 or 6 < hour <= 8:
-            time_factor = 0.8
-        else:
-            time_factor = 0.3
-        
-        # Gesamtsichtbarkeit
-        visibility = min(100, (base_visibility + altitude_bonus) * time_factor)
-        
-        # Nur signifikante Sichtbarkeiten speichern
-        if visibility > 20 and elevation_angle > 5:
-            phase = "Wiedereintritt"
-            if i < 3:
-                phase = "Wiedereintritt-Beginn"
-            elif i > 7:
-                phase = "Verglüh-Phase"
-            
-            windows.append({
-                'phase': phase,
-                'time_utc': point_time.strftime('%H:%M:%S'),
-                'time_de': local_time.strftime('%H:%M:%S'),
-                'coords': (lat, lon),
-                'altitude': altitude,
-                'visibility': visibility,
-                'distance': distance,
-                'elevation': elevation_angle
-            })
-    
-    # Nach Sichtbarkeit sortieren
-    windows = sorted(windows, key=lambda x: x['visibility'], reverse=True)
-    
-    return windows[:5]  # Top 5 Beobachtungsfenster
+# Wiedereintritts-Daten (simuliert, da echte APIs oft eingeschränkt sind)
+@st.cache_data(ttl=1800)  # 30 Minuten Cache
+def get_reentry_data():
+    return simulate_reentry_data()
 
-def find_next_visible_launch(launches):
-    """Findet den nächsten gut sichtbaren Start"""
-    
-    for launch in launches:
-        launch_time_str = launch['net']
-        launch_time_utc = datetime.fromisoformat(launch_time_str.replace('Z', '+00:00'))
-        
-        # Nur zukünftige Starts
-        if launch_time_utc <= datetime.now(pytz.UTC):
-            continue
-            
-        launch_pad = launch['pad']
-        launch_lat = float(launch_pad['latitude']) if launch_pad.get('latitude') else 0
-        launch_lon = float(launch_pad['longitude']) if launch_pad.get('longitude') else 0
-        launch_coords = (launch_lat, launch_lon)
-        
-        # Sichtbarkeitsbewertung
-        visibility_rating, description, time_rating, distance = evaluate_launch_visibility(launch_coords, launch_time_utc)
-        
-        # Suche nach gut sichtbaren Starts (Entfernung < 3500km)
-        if distance <= 3500:
-            return launch
-    
-    # Falls kein gut sichtbarer Start gefunden wird, nimm den ersten
-    return launches[0] if launches else None
+@st.cache_data(max_entries=4)
+def get_launch_analysis(launch_table_version, _launches):
+    """Analyse-Tabelle einmal pro Datenaktualisierung (Schlüssel: Version der LaunchTable)"""
+    return build_launch_analysis(_launches)
 
-def generate_historical_sightings():
-    """Generiert realistische historische Sichtungsdaten für die letzten 12 Monate"""
-    
-    import random
-    from datetime import datetime, timedelta
-    
-    sightings = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Bekannte reale Ereignisse 2025
-    real_events = [
-        {"date": "2025-03-24", "time": "21:30", "name": "SpaceX NROL-69 Spiral", "type": "SpaceX Spiral", "visibility": 85, "confirmed": True},
-        {"date": "2025-02-19", "time": "04:45", "name": "Falcon 9 Wiedereintritt", "type": "Wiedereintritt", "visibility": 92, "confirmed": True},
-        {"date": "2025-01-15", "time": "23:15", "name": "Blue Ghost Lunar Mission", "type": "SpaceX Start", "visibility": 45, "confirmed": False},
-        {"date": "2025-03-30", "time": "20:45", "name": "Isar Spectrum Test", "type": "Europäische Rakete", "visibility": 78, "confirmed": True},
-    ]
-    
-    # Reale Ereignisse hinzufügen
-    for event in real_events:
-        event_date = datetime.strptime(event["date"], "%Y-%m-%d")
-        sightings.append({
-            "date": event_date,
-            "name": event["name"],
-            "type": event["type"],
-            "time": event["time"],
-            "visibility": event["visibility"],
-            "confirmed": event["confirmed"],
-            "distance": random.randint(800, 3500),
-            "region": random.choice(["Norddeutschland", "Süddeutschland", "Westdeutschland", "Ostdeutschland", "Ganz Deutschland"]),
-            "quality": "Exzellent" if event["visibility"] > 80 else "Sehr gut" if event["visibility"] > 60 else "Gut",
-            "description": f"Sichtung von {event['name']} mit {event['visibility']}% Sichtbarkeit."
-        })
-    
-    # Zusätzliche simulierte Sichtungen generieren
-    event_types = [
-        {"name": "ISS-Überflug", "type": "ISS", "prob": 0.4, "vis_range": (30, 90)},
-        {"name": "Starlink-Kette", "type": "Starlink", "prob": 0.25, "vis_range": (40, 85)},
-        {"name": "SpaceX Falcon 9", "type": "SpaceX Start", "prob": 0.15, "vis_range": (20, 70)},
-        {"name": "Europäische Rakete", "type": "Europäische Rakete", "prob": 0.1, "vis_range": (50, 95)},
-        {"name": "Debris-Wiedereintritt", "type": "Wiedereintritt", "prob": 0.05, "vis_range": (60, 100)},
-        {"name": "Geheimer Satellit", "type": "Militär", "prob": 0.05, "vis_range": (10, 40)},
-    ]
-    
-    # Generiere 80-120 zusätzliche Sichtungen über 12 Monate
-    for _ in range(random.randint(80, 120)):
-        # Zufälliges Datum
-        days_ago = random.randint(1, 365)
-        event_date = datetime.now() - timedelta(days=days_ago)
-        
-        # Bevorzuge Nacht- und Dämmerungszeiten
-        if random.random() < 0.6:  # 60% nachts/Dämmerung
-            hour = random.choice([20, 21, 22, 23, 0, 1, 2, 3, 4, 5, 6])
-        else:  # 40% andere Zeiten
-            hour = random.randint(7, 19)
-        
-        minute = random.randint(0, 59)
-        time_str = f"{hour:02d}:{minute:02d}"
-        
-        # Wähle Event-Typ basierend auf Wahrscheinlichkeiten
-        rand = random.random()
-        cumulative_prob = 0
-        selected_event = event_types[0]  # Fallback
-        
-        for event_type in event_types:
-            cumulative_prob += event_type["prob"]
-            if rand <= cumulative_prob:
-                selected_event = event_type
-                break
-        
-        # Sichtbarkeit basierend auf Event-Typ und Tageszeit
-        base_visibility = random.randint(*selected_event["vis_range"])
-        
-        # Nacht-Bonus
-        if 22 <= hour or hour <= 4:
-            visibility = min(100, base_visibility + random.randint(0, 15))
-        elif 18 <= hour <= 21 or 5 <= hour <= 7:
-            visibility = min(100, base_visibility + random.randint(0, 10))
-        else:
-            visibility = max(10, base_visibility - random.randint(0, 20))
-        
-        sightings.append({
-            "date": event_date,
-            "name": selected_event["name"],
-            "type": selected_event["type"], 
-            "time": time_str,
-            "visibility": visibility,
-            "confirmed": random.random() < 0.7,  # 70% bestätigt
-            "distance": random.randint(500, 4000),
-            "region": random.choice(["Norddeutschland", "Süddeutschland", "Westdeutschland", "Ostdeutschland", "Ganz Deutschland"]),
-            "quality": "Exzellent" if visibility > 80 else "Sehr gut" if visibility > 60 else "Gut" if visibility > 40 else "Mäßig",
-            "description": f"Sichtung von {selected_event['name']} mit {visibility}% Sichtbarkeit um {time_str} Uhr."
-        })
-    
-    # Nach Datum sortieren
-    sightings.sort(key=lambda x: x["date"], reverse=True)
-    
-    return sightings
+# Aufgaben des Hintergrund-Workers im Server-Prozess: nur Funktionen ohne Streamlit-Caches,
+# die Ergebnisse landen ausschließlich im PrecomputeStore
+PRECOMPUTE_MAP_LAUNCHES = int(os.environ.get("ROCKETS_PRECOMPUTE_MAPS", "5"))  # Karten für die nächsten N Starts
 
-def get_best_sighting_month(historical_data):
-    """Ermittelt den Monat mit den meisten Sichtungen"""
-    month_counts = {}
-    month_names = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
-                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-    
-    for sighting in historical_data:
-        month = sighting["date"].month
-        month_name = month_names[month - 1]
-        month_counts[month_name] = month_counts.get(month_name, 0) + 1
-    
-    if month_counts:
-        return max(month_counts, key=month_counts.get)
-    return "N/A"
+def _precompute_launch_table(store):
+    """Startdaten nur neu parsen, wenn sich der Snapshot geändert hat (Schlüssel: fetched_at)"""
+    snapshot = load_launch_snapshot()
+    fetched_at = (snapshot or {}).get("fetched_at")
+    if fetched_at is None:
+        return
+    launches = store.get("launch_table", fetched_at)
+    if launches is None:
+        launches = launch_table_from_snapshot(snapshot)
+    store.put("launch_table", launches, key=fetched_at)
 
-def prepare_monthly_chart_data(historical_data):
-    """Bereitet Daten für das monatliche Chart vor"""
-    import pandas as pd
-    
-    month_counts = {}
-    month_names = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
-                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-    
-    # Initialisiere alle Monate mit 0
-    for month_name in month_names:
-        month_counts[month_name] = 0
-    
-    # Zähle Sichtungen pro Monat
-    for sighting in historical_data:
-        month = sighting["date"].month
-        month_name = month_names[month - 1]
-        month_counts[month_name] += 1
-    
-    # Erstelle DataFrame
-    data = []
-    for month, count in month_counts.items():
-        data.append({"month": month, "count": count})
-    
-    return pd.DataFrame(data)
+def _precompute_site_registry(store):
+    launches = store.get("launch_table")
+    version = None if launches is None else launches.version
+    registry = store.get("site_registry", version)
+    if registry is None:
+        registry = LaunchSiteRegistry.from_sources(STATIC_LAUNCH_SITES, launches)
+    store.put("site_registry", registry, key=version)
 
-def prepare_hourly_chart_data(historical_data):
-    """Bereitet Daten für das stündliche Chart vor"""
-    import pandas as pd
-    
-    hour_counts = {hour: 0 for hour in range(24)}
-    
-    for sighting in historical_data:
-        hour = int(sighting["time"].split(":")[0])
-        hour_counts[hour] += 1
-    
-    data = []
-    for hour, count in hour_counts.items():
-        data.append({"hour": hour, "count": count})
-    
-    return pd.DataFrame(data)
+def _precompute_launch_analysis(store):
+    launches = store.get("launch_table")
+    if launches is None:
+        return
+    # Unveränderte Version: nur den Zeitstempel erneuern
+    analysis = store.get("launch_analysis", launches.version)
+    if analysis is None:
+        analysis = build_launch_analysis(launches)
+    store.put("launch_analysis", analysis, key=launches.version)
 
-def analyze_best_sighting_times(historical_data):
-    """Analysiert die besten Sichtungszeiten"""
-    
-    night_count = 0
-    twilight_count = 0
-    day_count = 0
-    
-    night_hours = {}
-    twilight_hours = {}
-    
-    for sighting in historical_data:
-        hour = int(sighting["time"].split(":")[0])
-        
-        if 22 <= hour or hour <= 4:
-            night_count += 1
-            night_hours[hour] = night_hours.get(hour, 0) + 1
-        elif (18 <= hour <= 21) or (5 <= hour <= 7):
-            twilight_count += 1
-            twilight_hours[hour] = twilight_hours.get(hour, 0) + 1
-        else:
-            day_count += 1
-    
-    total = len(historical_data)
-    
-    best_night_hour = max(night_hours, key=night_hours.get) if night_hours else 23
-    best_twilight_hour = max(twilight_hours, key=twilight_hours.get) if twilight_hours else 20
-    
-    return {
-        "night": night_count,
-        "night_percent": (night_count / total * 100) if total > 0 else 0,
-        "twilight": twilight_count,
-        "twilight_percent": (twilight_count / total * 100) if total > 0 else 0,
-        "best_night_hour": best_night_hour,
-        "best_twilight_hour": best_twilight_hour
-    }
+def _precompute_manifest_analysis(store, cache):
+    launches = store.get("launch_table")
+    if launches is None:
+        return
+    analysis = store.get("manifest_analysis", launches.version)
+    if analysis is None:
+        analysis = analyze_launch_manifest(launches, cache=cache)
+    store.put("manifest_analysis", analysis, key=launches.version)
 
-def analyze_seasonal_patterns(historical_data):
-    """Analysiert saisonale Muster"""
-    
-    season_counts = {"Winter": 0, "Frühling": 0, "Sommer": 0, "Herbst": 0}
-    month_counts = {}
-    
-    for sighting in historical_data:
-        month = sighting["date"].month
-        month_counts[month] = month_counts.get(month, 0) + 1
-        
-        if month in [12, 1, 2]:
-            season_counts["Winter"] += 1
-        elif month in [3, 4, 5]:
-            season_counts["Frühling"] += 1
-        elif month in [6, 7, 8]:
-            season_counts["Sommer"] += 1
-        else:
-            season_counts["Herbst"] += 1
-    
-    month_names = {1: "Januar", 2: "Februar", 3: "März", 4: "April", 5: "Mai", 6: "Juni",
-                   7: "Juli", 8: "August", 9: "September", 10: "Oktober", 11: "November", 12: "Dezember"}
-    
-    if month_counts:
-        best_month_num = max(month_counts, key=month_counts.get)
-        worst_month_num = min(month_counts, key=month_counts.get)
-        best_month = month_names.get(best_month_num, "N/A")
-        worst_month = month_names.get(worst_month_num, "N/A")
-        best_count = month_counts[best_month_num]
-        worst_count = month_counts[worst_month_num]
-    else:
-        best_month = worst_month = "N/A"
-        best_count = worst_count = 0
-    
-    return {
-        "best_month": best_month,
-        "best_count": best_count,
-        "worst_month": worst_month,
-        "worst_count": worst_count,
-        "winter": season_counts["Winter"],
-        "spring": season_counts["Frühling"],
-        "summer": season_counts["Sommer"],
-        "autumn": season_counts["Herbst"]
-    }
+def _precompute_launch_maps(store):
+    """Karten-HTML, Sichtbarkeitsfeld und Fenster-Zeitplan der nächsten Starts; unveränderte Einträge
+    werden übernommen"""
+    launches = store.get("launch_table")
+    site_registry = store.get("site_registry")
+    if launches is None or site_registry is None:
+        return
+    previous_maps = store.get("launch_maps") or {}
+    previous_fields = store.get("visibility_fields") or {}
+    previous_timelines = store.get("launch_timelines") or {}
+    timeline_days = int(LAUNCH_TIMELINE_DAYS)
+    maps, fields, timelines = {}, {}, {}
+    for launch in launches[:PRECOMPUTE_MAP_LAUNCHES]:
+        orbit_type = determine_orbit_type(launch.orbit_name)
+        target_orbit = LAUNCH_ORBIT_PARAMS[orbit_type]
+        
+        map_key = trajectory_map_key(launch, orbit_type, MAP_RENDER_MODE, site_registry)
+        html = previous_maps.get(map_key)
+        if html is None:
+            html = render_map_html(create_trajectory_map(launch.coords, launch.net_utc, target_orbit, orbit_type,
+                                                         MAP_RENDER_MODE, site_registry,
+                                                         build_trajectory_visibility_overlay))
+        maps[map_key] = html
+        
+        field_key = (launch.id, launch.net_epoch, orbit_type, OBSERVER_GRID_KM)
+        field = previous_fields.get(field_key)
+        if field is None:
+            field = build_launch_visibility_field(launch.coords, launch.net_epoch, target_orbit, OBSERVER_GRID_KM)
+        fields[field_key] = field
+        
+        timeline_key = (launch.id, launch.net_epoch, orbit_type, timeline_days)
+        timeline = previous_timelines.get(timeline_key)
+        if timeline is None:
+            timeline = build_launch_timeline(launch.coords, launch.net_epoch, target_orbit, timeline_days)
+        timelines[timeline_key] = timeline
+    store.put("launch_maps", maps)
+    store.put("visibility_fields", fields)
+    store.put("launch_timelines", timelines)
 
-def prepare_sighting_types_data(historical_data):
-    """Bereitet Daten für das Sichtungsarten-Diagramm vor"""
-    import pandas as pd
-    
-    type_counts = {}
-    for sighting in historical_data:
-        sighting_type = sighting["type"]
-        type_counts[sighting_type] = type_counts.get(sighting_type, 0) + 1
-    
-    data = []
-    for sighting_type, count in type_counts.items():
-        data.append({"type": sighting_type, "count": count})
-    
-    return pd.DataFrame(data)
+def _precompute_iss_passes(store):
+    store.put("iss_passes", get_iss_passes())
 
-def get_notable_sightings(historical_data):
-    """Filtert bemerkenswerte Sichtungen heraus"""
-    
-    # Sortiere nach Sichtbarkeit und nimm die besten
-    notable = sorted(historical_data, key=lambda x: x["visibility"], reverse=True)[:10]
-    
-    # Formatiere für Anzeige
-    formatted = []
-    for sighting in notable:
-        formatted.append({
-            "date": sighting["date"].strftime("%d.%m.%Y"),
-            "time": sighting["time"],
-            "name": sighting["name"],
-            "type": sighting["type"],
-            "visibility": sighting["visibility"],
-            "distance": sighting["distance"],
-            "region": sighting["region"],
-            "quality": sighting["quality"],
-            "confirmed": sighting["confirmed"],
-            "description": sighting["description"]
-        })
-    
-    return formatted
+def _precompute_starlink_passes(store):
+    """Starlink-Überflüge der nächsten Nacht, neu nur bei neuem Katalog oder neuer Nacht"""
+    catalog = get_satellite_catalog(STARLINK_TLE_PATH)
+    if catalog is None:
+        return
+    night_start, night_end = get_next_night_window()
+    key = (catalog.version, night_end)
+    passes = store.get("starlink_passes", key)
+    if passes is None:
+        passes = predict_constellation_passes(catalog, night_start, night_end)
+    store.put("starlink_passes", passes, key=key)
 
-def generate_sighting_predictions():
-    """Generiert Vorhersagen für kommende Monate"""
-    import pandas as pd
-    from datetime import datetime, timedelta
-    
-    # Nächste 6 Monate
-    months = []
-    current_date = datetime.now()
-    
-    for i in range(6):
-        future_date = current_date + timedelta(days=30 * i)
-        month_name = future_date.strftime("%b %Y")
-        
-        # Basiere Vorhersage auf saisonalen Mustern und geplanten Starts
-        base_prediction = 8  # Basis pro Monat
-        
-        # Saisonale Anpassung
-        month_num = future_date.month
-        if month_num in [11, 12, 1, 2]:  # Winter - bessere Sichtbarkeit
-            seasonal_bonus = 3
-        elif month_num in [6, 7, 8]:  # Sommer - schlechtere Sichtbarkeit
-            seasonal_bonus = -2
-        else:
-            seasonal_bonus = 0
-        
-        # Geplante Starts berücksichtigen
-        planned_starts_bonus = random.randint(0, 4)
-        
-        predicted = max(2, base_prediction + seasonal_bonus + planned_starts_bonus)
-        
-        months.append({
-            "month": month_name,
-            "predicted_sightings": predicted
-        })
-    
-    return pd.DataFrame(months)
+def _precompute_reentries(store):
+    reentry_data = simulate_reentry_data()
+    windows = [calculate_reentry_observation_windows(reentry) for reentry in reentry_data['results']]
+    store.put("reentries", {"data": reentry_data, "windows": windows})
 
-# Bewertung der Sichtbarkeit eines Starts von Deutschland aus
-def evaluate_launch_visibility(launch_site_coords, launch_time_utc):
-    """Schnelle Bewertung, ob ein Start grundsätzlich von Deutschland sichtbar sein könnte"""
-    distance = geodesic(germany_coords, launch_site_coords).kilometers
-    
-    # Startorte kategorisieren
-    if distance <= 1000:
-        visibility_rating = "🟢 Sehr gut"
-        description = "Sehr hohe Wahrscheinlichkeit der Sichtbarkeit"
-    elif distance <= 2000:
-        visibility_rating = "🟡 Gut"
-        description = "Gute Sichtbarkeitschancen bei idealen Bedingungen"
-    elif distance <= 3500:
-        visibility_rating = "🟠 Möglich"
-        description = "Sichtbarkeit nur bei perfekten Bedingungen möglich"
-    else:
-        visibility_rating = "🔴 Unwahrscheinlich"
-        description = "Sichtbarkeit sehr unwahrscheinlich"
-    
-    # Tageszeit berücksichtigen
-    de_timezone = pytz.timezone('Europe/Berlin')
-    local_time = launch_time_utc.astimezone(de_timezone)
-    hour = local_time.hour
-    
-    if 22 <= hour or hour <= 4:
-        time_rating = "🌙 Optimal (Nacht)"
-    elif (20 <= hour < 22) or (4 < hour <= 6):
-        time_rating = "🌅 Gut (Dämmerung)"
-    else:
-        time_rating = "☀️ Ungünstig (Tag)"
-    
-    return visibility_rating, description, time_rating, distance
+@st.cache_resource
+def get_precompute_scheduler():
+    """Ein Hintergrund-Worker pro Serverprozess (None, wenn per ROCKETS_PRECOMPUTE=0 abgeschaltet)"""
+    if not PRECOMPUTE_ENABLED:
+        return None
+    analysis_cache = get_trajectory_analysis_cache()
+    # Läuft schon ein Worker (z.B. nach st.cache_resource.clear()), wird er ersetzt statt verdoppelt
+    return start_precompute_scheduler([
+        ("launch_table", 60, _precompute_launch_table),
+        ("site_registry", 60, _precompute_site_registry),
+        ("launch_analysis", 60, _precompute_launch_analysis),
+        ("manifest_analysis", 60, functools.partial(_precompute_manifest_analysis, cache=analysis_cache)),
+        ("launch_maps", 300, _precompute_launch_maps),
+        ("iss_passes", 600, _precompute_iss_passes),
+        ("starlink_passes", 1800, _precompute_starlink_passes),
+        ("reentries", 600, _precompute_reentries),
+    ])
+
+def read_precomputed(name, key=None):
+    """Vorberechnetes Ergebnis aus dem Hintergrund-Worker, None falls (noch) nicht vorhanden"""
+    scheduler = get_precompute_scheduler()
+    return None if scheduler is None else scheduler.read(name, key)
+
+def get_current_launch_table():
+    """Startdaten aus dem Worker, ohne Worker bzw. beim Kaltstart direkt aus dem Cache"""
+    launches = read_precomputed("launch_table")
+    return get_launch_table() if launches is None else launches
+
+def get_current_launch_analysis(launches):
+    analysis = read_precomputed("launch_analysis", launches.version)
+    return get_launch_analysis(launches.version, launches) if analysis is None else analysis
+
+def get_current_manifest_analysis(launches):
+    analysis = read_precomputed("manifest_analysis", launches.version)
+    return analyze_launch_manifest(launches) if analysis is None else analysis
+
+def get_upcoming_iss_passes():
+    """ISS-Überflüge aus dem Worker (ohne bereits beendete), sonst direkt berechnet"""
+    passes = read_precomputed("iss_passes")
+    if passes is None:
+        return get_iss_passes()
+    now = time.time()
+    return [iss_pass for iss_pass in passes if iss_pass['set'] > now]
+
+# Seitenkopf mit Hinweisen (beim Rendern aus main(), nicht beim Import des Moduls)
+def render_header():
+    # Seitentitel und Beschreibung
+    st.title("🚀 Raketenstarts - Sichtbarkeit von Deutschland")
+    st.markdown("""
+    ### Diese App zeigt kommende Raketenstarts und deren Sichtbarkeit von Deutschland aus
+    Erfahren Sie, wann und wo Sie Raketen und Satelliten am deutschen Himmel sehen können!
+    """)
+    
+    if not PLOTLY_AVAILABLE:
+        st.warning("⚠️ Plotly nicht verfügbar. Einige Charts werden nicht angezeigt. Installieren Sie mit: pip install plotly")
+    
+    # Aktuelle sichtbare Raketen/Ereignisse Übersicht
+    st.info("""
+    🌟 **AKTUELL SICHTBARE EREIGNISSE:**
+    • **ISS-Überflüge**: Täglich 2-5 mal sichtbar (hellster "Stern" am Himmel)
+    • **Starlink-Satelliten**: Einzelne Satelliten regelmäßig als bewegende Punkte
+    • **SpaceX Falcon 9**: Gelegentlich Spiralen nach Starts über Europa sichtbar
+    • **Europäische Raketen 2025**: Isar Spectrum (Norwegen), RFA One & Orbex (Schottland)
+    """)
+    
+    # Warnung über realistische Sichtbarkeit
+    st.warning("""
+    ⚠️ **WICHTIGER HINWEIS ZUR SICHTBARKEIT:**
+    - Raketen sind nur in **großer Höhe** (>100km) und bei **optimalen Bedingungen** sichtbar
+    - **Aufstieg**: Nur die ersten 5-15 Minuten, wenn Triebwerke brennen
+    - **Orbit**: Nur wenn Sonnenlicht reflektiert wird und über dem Horizont (>10° Elevation)
+    - **Wetter**: Klarer Himmel erforderlich, keine Wolken
+    - **Zeit**: Beste Sichtbarkeit in Dämmerung oder Nacht
+    - **Live-Countdown**: Zeigt Zeit bis zum nächsten Start in Echtzeit
+    """)
+
+# Sidebar für wichtige Informationen
+def render_sidebar():
+    st.sidebar.title("📍 Sichtbarkeit von Deutschland")
+    st.sidebar.info("""
+    **Aktuell von Deutschland sichtbare Raketen:**
+    - SpaceX Falcon 9 (bei passenden Bedingungen)
+    - Europäische Raketen (Ariane 6, Vega C)
+    - Isar Aerospace Spectrum (Norwegen) 
+    - Orbex Prime (Schottland)
+    - RFA One (Schottland)
+    
+    **Beste Sichtbarkeit (nach Sonnenhöhe, nicht Uhrzeit):**
+    - 🌙 Nacht: Sonne mehr als 12° unter dem Horizont
+    - 🌅 Nautische Dämmerung (Sonne 6-12° unter dem Horizont): sehr gut
+    - 🌆 Bürgerliche Dämmerung (Sonne 0-6° unter dem Horizont): nur helle Objekte
+    - ☀️ Tagsüber nicht sichtbar
+    - 🛰️ Satelliten und Raketenstufen leuchten nur, solange sie selbst noch im Sonnenlicht sind
+    """)
 
 # Hauptfunktion 
 def main():
+    render_header()
+    render_sidebar()
+    
+    # API-Status der Launch Library (Latenz, Drosselung, verbleibendes Kontingent)
+    with st.sidebar.expander("📡 API-Status"):
+        api_metrics = get_http_client("thespacedevs").get_metrics()
+        fixture_store = get_fixture_store()
+        if fixture_store.mode != "off":
+            st.write(f"**Fixture-Modus:** {fixture_store.mode} ({fixture_store.directory})")
+        st.write(f"**Anfragen:** {api_metrics['requests']} (Retries: {api_metrics['retries']}, Fehler: {api_metrics['errors']})")
+        st.write(f"**Gedrosselt (429):** {api_metrics['throttled']}, Kontingent erschöpft: {api_metrics['budget_exhausted']}")
+        st.write(f"**Verbleibendes Kontingent:** {api_metrics['budget_remaining']:.1f} Anfragen")
+        if 'latency_p50' in api_metrics:
+            st.write(f"**Latenz:** p50 {api_metrics['latency_p50'] * 1000:.0f} ms, p95 {api_metrics['latency_p95'] * 1000:.0f} ms")
+        # TLE-Daten für die SGP4-Bahnberechnung
+        satellite_catalog = get_satellite_catalog()
+        if satellite_catalog is not None:
+            tle_age_days = (time.time() - satellite_catalog.epochs.max()) / 86400
+            st.write(f"**TLE-Katalog:** {len(satellite_catalog)} Objekte, neueste Epoche vor {tle_age_days:.1f} Tagen")
+        elif not SGP4_AVAILABLE:
+            st.write("**TLE-Katalog:** sgp4 nicht installiert, ISS-Position genähert")
+        else:
+            st.write("**TLE-Katalog:** keine lokalen TLE-Daten, ISS-Position genähert")
+        if SGP4_AVAILABLE and st.button("🛰️ TLE-Daten von CelesTrak laden"):
+            try:
+                st.write(f"{download_tle_catalog()} Objekte geladen")
+                st.write(f"{download_tle_catalog('starlink', STARLINK_TLE_PATH)} Starlink-Satelliten geladen")
+            except (requests.exceptions.RequestException, ValueError, OSError) as e:
+                st.error(f"TLE-Daten konnten nicht geladen werden: {e}")
+        map_stats = get_map_html_cache().get_stats()
+        st.write(f"**Karten-Cache:** {map_stats['entries']} Karten, {map_stats['bytes'] / 1024 / 1024:.1f} MB "
+                 f"(Treffer: {map_stats['hits']}, Fehlschläge: {map_stats['misses']})")
+    
+    # Status des Hintergrund-Workers (Vorberechnung für alle Sitzungen)
+    scheduler = get_precompute_scheduler()
+    if scheduler is not None:
+        with st.sidebar.expander("⚙️ Hintergrund-Worker"):
+            scheduler_stats = scheduler.get_stats()
+            st.write(f"**Gelesen:** {scheduler_stats['hits']} Treffer, {scheduler_stats['misses']} direkt berechnet")
+            for name, status in scheduler.get_status().items():
+                if status["last_run"] is None:
+                    st.write(f"**{name}:** ausstehend")
+                elif status["error"]:
+                    st.write(f"**{name}:** ⚠️ {status['error']}")
+                else:
+                    st.write(f"**{name}:** vor {time.time() - status['last_run']:.0f} s ({status['duration'] * 1000:.0f} ms)")
+
     # Tab-System für bessere Navigation
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["🚀 Aktuelle Starts", "💫 Wiedereintritte", "📊 Sichtbarkeits-Übersicht", "📈 Historische Sichtungen", "ℹ️ Info & Tipps"])
     
     with tab1:
-        # Daten abrufen
-        launch_data = get_launch_data()
+        # Daten abrufen (einmal geparst und kompakt gecacht)
+        launches = get_current_launch_table()
         
-        if not launch_data:
+        if launches is None:
             return
         
-        launches = launch_data.get('results', [])
-        
-        if not launches:
+        if not len(launches):
             st.warning("Keine bevorstehenden Starts gefunden.")
             return
         
+        # Sichtbarkeitsanalyse aller Starts (einmal pro Datenaktualisierung, von allen Tabs genutzt)
+        launch_analysis = get_current_launch_analysis(launches)
+        
         # Live-Countdown für den nächsten SICHTBAREN Start
-        next_visible_launch = find_next_visible_launch(launches)
+        next_visible_launch = find_next_visible_launch(launches, launch_analysis)
         
         if next_visible_launch:
-            next_launch_time = datetime.fromisoformat(next_visible_launch['net'].replace('Z', '+00:00'))
-            launch_pad = next_visible_launch['pad']
-            launch_coords = (float(launch_pad['latitude']), float(launch_pad['longitude']))
-            distance = geodesic(germany_coords, launch_coords).kilometers
+            next_launch_time = next_visible_launch.net_utc
+            launch_coords = next_visible_launch.coords
+            distance = distance_from_germany_km(*launch_coords, ellipsoidal=True)
             
-            countdown_title = f"{next_visible_launch['name']} - {distance:.0f}km entfernt"
+            countdown_title = f"{next_visible_launch.name} - {distance:.0f}km entfernt"
             countdown_html = create_launch_countdown(next_launch_time, countdown_title)
             st.markdown(countdown_html, unsafe_allow_html=True)
             
@@ -1909,8 +1182,8 @@ def main():
                 st.info(f"ℹ️ Nächster gut sichtbarer Start wird gesucht... (Aktueller Start: {distance:.0f}km entfernt)")
         else:
             # Fallback zum ersten Start
-            next_launch_time = datetime.fromisoformat(launches[0]['net'].replace('Z', '+00:00'))
-            countdown_html = create_launch_countdown(next_launch_time, launches[0]['name'])
+            next_launch_time = launches[0].net_utc
+            countdown_html = create_launch_countdown(next_launch_time, launches[0].name)
             st.markdown(countdown_html, unsafe_allow_html=True)
         
         # Refresh-Button für aktuellen Countdown
@@ -1922,37 +1195,22 @@ def main():
         # Übersicht der nächsten Starts mit Sichtbarkeitsbewertung
         st.subheader("🔍 Kommende Raketenstarts - Schnellübersicht")
         
-        visibility_overview = []
-        for launch in launches[:10]:  # Nur die nächsten 10 Starts
-            launch_time_str = launch['net']
-            launch_time_utc = datetime.fromisoformat(launch_time_str.replace('Z', '+00:00'))
-            launch_pad = launch['pad']
-            launch_lat = float(launch_pad['latitude']) if launch_pad.get('latitude') else 0
-            launch_lon = float(launch_pad['longitude']) if launch_pad.get('longitude') else 0
-            launch_coords = (launch_lat, launch_lon)
-            
-            visibility_rating, description, time_rating, distance = evaluate_launch_visibility(launch_coords, launch_time_utc)
-            
-            de_timezone = pytz.timezone('Europe/Berlin')
-            launch_time_de = launch_time_utc.astimezone(de_timezone)
-            
-            visibility_overview.append({
-                'Start': launch['name'],
-                'Anbieter': launch['launch_service_provider']['name'],
-                'Zeit (DE)': launch_time_de.strftime('%d.%m.%Y %H:%M'),
-                'Startort': f"{launch_pad['location']['name']}",
-                'Entfernung': f"{distance:.0f} km",
-                'Sichtbarkeit': visibility_rating,
-                'Tageszeit': time_rating,
-                'Mission': launch['mission']['name'] if launch.get('mission') else 'Unbekannt'
-            })
-        
-        df_overview = pd.DataFrame(visibility_overview)
+        overview = launch_analysis.head(10)  # Nur die nächsten 10 Starts
+        df_overview = pd.DataFrame({
+            'Start': overview['name'],
+            'Anbieter': overview['provider'],
+            'Zeit (DE)': overview['time_utc'].dt.tz_convert('Europe/Berlin').dt.strftime('%d.%m.%Y %H:%M'),
+            'Startort': overview['location'],
+            'Entfernung': overview['distance_km'].map(lambda distance: f"{distance:.0f} km"),
+            'Sichtbarkeit': overview['visibility_rating'],
+            'Tageszeit': overview['time_rating'],
+            'Mission': overview['mission'].map(lambda mission: mission or 'Unbekannt')
+        })
         st.dataframe(df_overview, use_container_width=True)
         
         # Detailanalyse für ausgewählten Start
         st.subheader("🔬 Detailanalyse")
-        launch_names = [f"{launch['name']} ({launch['launch_service_provider']['name']})" for launch in launches]
+        launch_names = [f"{launch.name} ({launch.provider})" for launch in launches]
         selected_launch_index = st.selectbox("Wähle einen Raketenstart für die Detailanalyse:", 
                                            range(len(launch_names)), 
                                            format_func=lambda i: launch_names[i])
@@ -1964,33 +1222,31 @@ def main():
         
         with col1:
             st.write("**📋 Startdetails**")
-            st.write(f"**Mission:** {selected_launch['mission']['name'] if selected_launch.get('mission') else 'Keine Mission angegeben'}")
-            st.write(f"**Anbieter:** {selected_launch['launch_service_provider']['name']}")
+            st.write(f"**Mission:** {selected_launch.mission_name or 'Keine Mission angegeben'}")
+            st.write(f"**Anbieter:** {selected_launch.provider}")
             
-            launch_time_str = selected_launch['net']
-            launch_time_utc = datetime.fromisoformat(launch_time_str.replace('Z', '+00:00'))
+            launch_time_utc = selected_launch.net_utc
             de_timezone = pytz.timezone('Europe/Berlin')
             launch_time_de = launch_time_utc.astimezone(de_timezone)
             
             st.write(f"**Startzeit (UTC):** {launch_time_utc.strftime('%Y-%m-%d %H:%M:%S')}")
             st.write(f"**Startzeit (DE):** {launch_time_de.strftime('%Y-%m-%d %H:%M:%S')}")
             
-            launch_pad = selected_launch['pad']
-            st.write(f"**Startort:** {launch_pad['name']}, {launch_pad['location']['name']}")
+            st.write(f"**Startort:** {selected_launch.pad_name}, {selected_launch.location_name}")
             
-            mission_type = "LEO"
-            if selected_launch.get('mission') and selected_launch['mission'].get('orbit', {}).get('name'):
-                mission_type = selected_launch['mission']['orbit']['name']
+            mission_type = selected_launch.orbit_name or "LEO"
             
             st.write(f"**Orbit-Typ:** {mission_type}")
         
         with col2:
             st.write("**🎯 Sichtbarkeitsbewertung**")
-            launch_lat = float(launch_pad['latitude']) if launch_pad.get('latitude') else 0
-            launch_lon = float(launch_pad['longitude']) if launch_pad.get('longitude') else 0
-            launch_coords = (launch_lat, launch_lon)
+            launch_coords = selected_launch.coords
             
-            visibility_rating, description, time_rating, distance = evaluate_launch_visibility(launch_coords, launch_time_utc)
+            selected_analysis = launch_analysis.iloc[selected_launch_index]
+            visibility_rating = selected_analysis['visibility_rating']
+            description = selected_analysis['description']
+            time_rating = selected_analysis['time_rating']
+            distance = selected_analysis['distance_km']
             
             st.write(f"**Entfernung:** {distance:.0f} km")
             st.write(f"**Sichtbarkeit:** {visibility_rating}")
@@ -2022,6 +1278,7 @@ def main():
             - Länge: {current_iss_info['longitude']:.2f}°
             - Höhe: {current_iss_info['altitude']:.1f} km
             - Geschwindigkeit: {current_iss_info['velocity']:.1f} km/h
+            - Datenquelle: {current_iss_info['source']}
             """)
             
             # ISS Sichtbarkeit von Deutschland
@@ -2040,39 +1297,77 @@ def main():
                 - Nächste Sichtung: {iss_visibility['next_pass']}
                 - Grund: {iss_visibility['reason']}
                 """)
+            
+            # Countdown zum Beginn der nächsten gut sichtbaren Sichtung
+            next_iss_pass_time = get_next_iss_pass_time()
+            if next_iss_pass_time is not None:
+                st.markdown(create_iss_countdown(next_iss_pass_time), unsafe_allow_html=True)
+            
+            with st.expander("🛰️ ISS-Überflüge der nächsten Tage"):
+                iss_passes = [iss_pass for iss_pass in get_upcoming_iss_passes() if iss_pass['visibility'] > 30]
+                if iss_passes:
+                    de_timezone = pytz.timezone('Europe/Berlin')
+                    st.dataframe(pd.DataFrame([{
+                        'Aufgang (DE)': datetime.fromtimestamp(iss_pass['rise'], de_timezone).strftime('%d.%m. %H:%M:%S'),
+                        'Kulmination': datetime.fromtimestamp(iss_pass['culmination'], de_timezone).strftime('%H:%M:%S'),
+                        'Untergang': datetime.fromtimestamp(iss_pass['set'], de_timezone).strftime('%H:%M:%S'),
+                        'Max. Elevation': f"{iss_pass['max_elevation']:.0f}°",
+                        'Richtung': f"{azimuth_to_direction(iss_pass['rise_azimuth'])} → {azimuth_to_direction(iss_pass['set_azimuth'])}",
+                        'Sichtbarkeit': f"{iss_pass['visibility']:.0f}%"
+                    } for iss_pass in iss_passes[:10]]), use_container_width=True)
+                else:
+                    st.write(f"Keine gut sichtbaren Überflüge in den nächsten {ISS_PASS_HORIZON_DAYS:.0f} Tagen.")
         
         with col2:
             # ISS Live-Karte (kleiner Ausschnitt)
             st.write("**🗺️ ISS Live Position:**")
+            from streamlit_folium import folium_static
             iss_map = create_iss_live_map(current_iss_info)
             folium_static(iss_map, height=300)
         
+        # Starlink-Überflüge der kommenden Nacht
+        st.subheader("✨ Starlink-Sichtbarkeit heute Nacht")
+        starlink_catalog = get_satellite_catalog(STARLINK_TLE_PATH)
+        if not SGP4_AVAILABLE:
+            st.info("ℹ️ Für Starlink-Überflüge wird das Paket sgp4 benötigt (pip install sgp4).")
+        elif starlink_catalog is None:
+            st.info("ℹ️ Keine Starlink-TLE-Daten vorhanden. Sie können in der Seitenleiste unter \"API-Status\" geladen werden.")
+        else:
+            night_start, night_end = get_next_night_window()
+            # Auf volle 10 Minuten runden, damit der Cache über Reruns hinweg trifft
+            night_start = night_start - night_start % 600
+            de_timezone = pytz.timezone('Europe/Berlin')
+            st.caption(f"Beobachtungsnacht (Sonne unter {NIGHT_SUN_ELEVATION_DEG}°): "
+                       f"{datetime.fromtimestamp(night_start, de_timezone).strftime('%d.%m. %H:%M')} – "
+                       f"{datetime.fromtimestamp(night_end, de_timezone).strftime('%d.%m. %H:%M')} Uhr")
+            starlink_passes = get_current_starlink_passes(starlink_catalog, night_start, night_end)
+            good_passes = [satellite_pass for satellite_pass in starlink_passes if satellite_pass['visibility'] > 30]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Satelliten im Katalog", len(starlink_catalog))
+            with col2:
+                st.metric("Überflüge > 10°", len(starlink_passes))
+            with col3:
+                st.metric("Gut sichtbar", len(good_passes))
+            
+            if good_passes:
+                st.dataframe(pd.DataFrame([{
+                    'Satellit': satellite_pass['name'],
+                    'Aufgang (DE)': datetime.fromtimestamp(satellite_pass['rise'], de_timezone).strftime('%H:%M:%S'),
+                    'Dauer': f"{satellite_pass['duration'] / 60:.1f} Min",
+                    'Max. Elevation': f"{satellite_pass['max_elevation']:.0f}°",
+                    'Richtung': f"{azimuth_to_direction(satellite_pass['rise_azimuth'])} → {azimuth_to_direction(satellite_pass['set_azimuth'])}",
+                    'Sichtbarkeit': f"{satellite_pass['visibility']:.0f}%"
+                } for satellite_pass in good_passes[:10]]), use_container_width=True)
+        
         # Hauptkarte mit Aufstiegspfad und Orbits
         st.subheader("🗺️ Aufstiegspfad und Sichtbarkeitskarte")
         
-        # Parameter für Orbit basierend auf Mission definieren
-        orbit_params = {
-            "LEO": {"height": 400, "inclination": 51.6, "ascent_duration": 8},
-            "MEO": {"height": 20000, "inclination": 55, "ascent_duration": 25},
-            "GEO": {"height": 35786, "inclination": 0, "ascent_duration": 45},
-            "SSO": {"height": 600, "inclination": 97.8, "ascent_duration": 12},
-            "Polar": {"height": 500, "inclination": 90, "ascent_duration": 10}
-        }
-        
-        # Orbit-Typ bestimmen
-        orbit_type = "LEO"  # Standard
-        if selected_launch.get('mission') and selected_launch['mission'].get('orbit', {}).get('name'):
-            mission_orbit = selected_launch['mission']['orbit']['name'].upper()
-            if "GEO" in mission_orbit or "GEOSTATIONARY" in mission_orbit:
-                orbit_type = "GEO"
-            elif "SSO" in mission_orbit or "SUN-SYNCHRONOUS" in mission_orbit:
-                orbit_type = "SSO"
-            elif "POLAR" in mission_orbit:
-                orbit_type = "Polar"
-            elif "MEO" in mission_orbit:
-                orbit_type = "MEO"
-        
-        target_orbit = orbit_params[orbit_type]
+        # Orbit-Typ und Parameter basierend auf Mission bestimmen
+        orbit_type = determine_orbit_type(selected_launch.orbit_name)
+        
+        target_orbit = LAUNCH_ORBIT_PARAMS[orbit_type]
         
         # Informationen zur geplanten Flugbahn
         col1, col2, col3, col4 = st.columns(4)
@@ -2113,15 +1408,16 @@ def main():
         
         with col2:
             # Beste Startpositionen für Deutschland
-            best_positions = get_best_launch_positions_for_germany()
+            site_registry = get_launch_site_registry()
+            best_positions = get_best_launch_positions_for_germany(site_registry)
             st.success(f"""
             **🎯 Beste Startpositionen für Deutschland:**
             1. {best_positions[0]['name']} ({best_positions[0]['distance']:.0f} km)
             2. {best_positions[1]['name']} ({best_positions[1]['distance']:.0f} km)
             3. {best_positions[2]['name']} ({best_positions[2]['distance']:.0f} km)
             
-            **Aktueller Start:** {launch_pad['location']['name']} 
-            **Rang:** {get_launch_position_rank(launch_coords)}
+            **Aktueller Start:** {selected_launch.location_name} 
+            **Rang:** {get_launch_position_rank(launch_coords, site_registry)}
             """)
         
         # Erdrotations-Info
@@ -2131,17 +1427,61 @@ def main():
         """)
         
         # Berechne Flugbahn mit Zeitstempeln
-        st.write("**📍 Interaktive Karte:** Klicken Sie auf die Markierungen für detaillierte Zeitinformationen!")
-        trajectory_map = create_trajectory_map(launch_coords, launch_time_utc, target_orbit, orbit_type)
-        folium_static(trajectory_map)
+        map_mode_options = list(MAP_RENDER_MODES)
+        map_render_mode = st.radio("Kartendarstellung", map_mode_options, horizontal=True,
+                                   index=map_mode_options.index(MAP_RENDER_MODE) if MAP_RENDER_MODE in MAP_RENDER_MODES else 0,
+                                   format_func=lambda mode: MAP_RENDER_MODES[mode])
+        if map_render_mode == "markers":
+            st.write("**📍 Interaktive Karte:** Klicken Sie auf die Markierungen für detaillierte Zeitinformationen!")
+        else:
+            st.write("**🔥 Heatmap:** Die Farbe zeigt die Sichtbarkeit von Deutschland entlang der Flugbahn.")
+        show_map_html(get_trajectory_map_html(selected_launch, target_orbit, orbit_type, map_render_mode))
+        
+        # Sichtbarkeit für Beobachter in ganz Deutschland
+        st.subheader("🇩🇪 Sichtbarkeit nach Regionen")
+        grid_options = sorted({10.0, 15.0, 20.0, 25.0, OBSERVER_GRID_KM})
+        grid_resolution = st.select_slider("Rasterauflösung (km)", options=grid_options, value=OBSERVER_GRID_KM,
+                                           format_func=lambda km: f"{km:.0f} km")
+        visibility_field = get_current_visibility_field(selected_launch, orbit_type, target_orbit, grid_resolution)
+        region_summary = aggregate_visibility_by_region(visibility_field)
+        
+        region_columns = st.columns(len(region_summary))
+        for column, (region, row) in zip(region_columns, region_summary.iterrows()):
+            with column:
+                st.metric(f"{region}deutschland", f"{row['max_visibility']:.0f}%",
+                          help=f"Beste Sichtbarkeit in der Region, {row['good_share'] * 100:.0f}% der Fläche mit guter Sicht")
+        
+        de_timezone = pytz.timezone('Europe/Berlin')
+        st.dataframe(pd.DataFrame({
+            'Region': region_summary.index,
+            'Ø Sichtbarkeit': region_summary['mean_visibility'].map(lambda value: f"{value:.0f}%"),
+            'Beste Sichtbarkeit': region_summary['max_visibility'].map(lambda value: f"{value:.0f}%"),
+            'Fläche mit guter Sicht': region_summary['good_share'].map(lambda value: f"{value * 100:.0f}%"),
+            'Bester Ort': [f"{lat:.2f}°N, {lon:.2f}°E" for lat, lon in zip(region_summary['best_lat'], region_summary['best_lon'])],
+            'Beste Zeit (DE)': [datetime.fromtimestamp(epoch, de_timezone).strftime('%H:%M') for epoch in region_summary['best_time']],
+        }), use_container_width=True, hide_index=True)
+        st.caption(f"Raster: {len(visibility_field)} Beobachterpunkte à {grid_resolution:.0f} km über Deutschland")
         
         # Zeitplan der Sichtbarkeitsfenster
         st.subheader("⏰ Zeitplan der Sichtbarkeitsfenster")
         
-        visibility_schedule = calculate_visibility_schedule(launch_coords, launch_time_utc, target_orbit)
+        # Fenster je Start und Zeitraum nur einmal berechnet (Worker oder Cache), Seiten sind Ausschnitte
+        timeline_days_options = sorted({1, 3, 7, 14, int(LAUNCH_TIMELINE_DAYS)})
+        col1, col2 = st.columns(2)
+        with col1:
+            timeline_days = st.select_slider("Zeitraum ab Start (Tage)", options=timeline_days_options,
+                                             value=int(LAUNCH_TIMELINE_DAYS))
+        with col2:
+            timeline_page = st.number_input("Seite", min_value=1, value=1, step=1)
+        
+        page_start = (timeline_page - 1) * LAUNCH_TIMELINE_PAGE_SIZE
+        launch_timeline = get_current_launch_timeline(selected_launch, orbit_type, target_orbit, timeline_days)
+        visibility_schedule = launch_timeline[page_start:page_start + LAUNCH_TIMELINE_PAGE_SIZE]
+        has_next_page = len(launch_timeline) > page_start + LAUNCH_TIMELINE_PAGE_SIZE
         
         # Debug-Information anzeigen
-        st.write(f"**🔍 Gefundene Sichtbarkeitsfenster:** {len(visibility_schedule)}")
+        st.write(f"**🔍 Gefundene Sichtbarkeitsfenster:** {len(visibility_schedule)} auf Seite {timeline_page} "
+                 f"({timeline_days} Tage ab Start{', weitere auf der nächsten Seite' if has_next_page else ''})")
         
         if visibility_schedule:
             # Filter für verschiedene Qualitätsstufen
@@ -2177,23 +1517,27 @@ def main():
                         visibility_color = "🔴"
                         quality = "Schwach"
                     
-                    with st.expander(f"{visibility_color} {window['phase']} - {window['time_de']} (Sichtbarkeit: {window['visibility']:.1f}% - {quality})"):
+                    with st.expander(f"{visibility_color} {window['phase']} - {window['date_de']} {window['start_de']} bis {window['end_de']} "
+                                     f"({window['duration'] / 60:.1f} Min, Sichtbarkeit: {window['visibility']:.1f}% - {quality})"):
                         col1, col2 = st.columns(2)
                         
                         with col1:
-                            st.write(f"**🕐 Zeit (DE):** {window['time_de']}")
-                            st.write(f"**🌍 Zeit (UTC):** {window['time_utc']}")
-                            st.write(f"**📍 Position:** {window['coords'][0]:.1f}°N, {window['coords'][1]:.1f}°E")
+                            st.write(f"**🕐 Beginn / Höhepunkt / Ende (DE):** {window['start_de']} / {window['time_de']} / {window['end_de']}")
+                            st.write(f"**🌍 Höhepunkt (UTC):** {window['time_utc']}")
+                            st.write(f"**⏱️ Dauer:** {window['duration'] / 60:.1f} Min")
+                            st.write(f"**📍 Position (Höhepunkt):** {window['coords'][0]:.1f}°N, {window['coords'][1]:.1f}°E")
                         
                         with col2:
                             st.write(f"**🎯 Sichtbarkeit:** {window['visibility']:.1f}%")
                             st.write(f"**📏 Entfernung:** {window['distance']:.0f} km")
                             st.write(f"**🚀 Höhe:** {window['height']} km")
-                            if 'elevation' in window:
-                                st.write(f"**📐 Elevation:** {window['elevation']:.1f}°")
+                            st.write(f"**📐 Max. Elevation:** {window['elevation']:.1f}°")
                             
                         # Beobachtungstipp
-                        direction = calculate_direction_from_germany(window['coords'])
+                        if window['start_direction'] == window['end_direction']:
+                            direction = f"{window['start_direction']} 🧭"
+                        else:
+                            direction = f"{window['start_direction']} (Verlauf nach {window['end_direction']}) 🧭"
                         
                         if window['visibility'] > 30:
                             st.success(f"💡 **Beobachtungstipp:** Schauen Sie nach {direction}")
@@ -2215,7 +1559,7 @@ def main():
                 """)
                 
                 # Zusätzliche Info zur Entfernung
-                distance_to_launch = geodesic(germany_coords, launch_coords).kilometers
+                distance_to_launch = float(distance_from_germany_km(*launch_coords, ellipsoidal=True))
                 st.info(f"""
                 **📏 Entfernungsanalyse:**
                 - Entfernung zu Deutschland: {distance_to_launch:.0f} km
@@ -2238,7 +1582,7 @@ def main():
             """)
             
             # Debug-Information
-            distance_to_launch = geodesic(germany_coords, launch_coords).kilometers
+            distance_to_launch = float(distance_from_germany_km(*launch_coords, ellipsoidal=True))
             st.write(f"**🔍 Debug:** Entfernung zum Start: {distance_to_launch:.0f} km")
             st.write(f"**🔍 Debug:** Startzeit: {launch_time_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC")
             st.write(f"**🔍 Debug:** Orbit-Typ: {orbit_type}, Höhe: {target_orbit['height']} km")
@@ -2246,8 +1590,9 @@ def main():
     with tab2:
         st.subheader("💫 Bevorstehende Wiedereintritte")
         
-        # Wiedereintritts-Daten abrufen
-        reentry_data = get_reentry_data()
+        # Wiedereintritts-Daten abrufen (samt Beobachtungsfenstern aus dem Hintergrund-Worker)
+        precomputed_reentries = read_precomputed("reentries")
+        reentry_data = get_reentry_data() if precomputed_reentries is None else precomputed_reentries["data"]
         
         if not reentry_data:
             st.error("Keine Wiedereintritts-Daten verfügbar.")
@@ -2389,18 +1734,22 @@ def main():
                 st.metric("💫 Status", "Erfolgt")
         
         with col4:
-            trajectory_length = geodesic(traj_start, traj_end).kilometers
+            trajectory_length = float(great_circle_distance_km(*traj_start, *traj_end, ellipsoidal=True))
             st.metric("📏 Trajektorien-Länge", f"{trajectory_length:.0f} km")
         
         # Erstelle Wiedereintritts-Karte (nur eine Trajektorie)
         st.write("**📍 Interaktive Karte:** Die Trajektorie zeigt den vorhergesagten Wiedereintritts-Pfad")
+        from streamlit_folium import folium_static
         reentry_map = create_reentry_trajectory_map(selected_reentry)
         folium_static(reentry_map)
         
         # Zeitfenster für optimale Beobachtung
         st.subheader("⏰ Optimales Beobachtungsfenster")
         
-        observation_windows = calculate_reentry_observation_windows(selected_reentry)
+        if precomputed_reentries is not None and selected_reentry_index < len(precomputed_reentries["windows"]):
+            observation_windows = precomputed_reentries["windows"][selected_reentry_index]
+        else:
+            observation_windows = calculate_reentry_observation_windows(selected_reentry)
         
         if observation_windows:
             for window in observation_windows:
@@ -2417,7 +1766,7 @@ def main():
                         st.write(f"**📏 Entfernung:** {window['distance']:.0f} km")
                         st.write(f"**📐 Höhe:** {window['altitude']:.0f} km")
                     
-                    direction = calculate_direction_from_germany(window['coords'])
+                    direction = calculate_direction_from_germany(window['coords'], window['altitude'])
                     if window['visibility'] > 50:
                         st.success(f"💡 **Schauen Sie nach {direction}** - Sehr gute Sichtchance!")
                     else:
@@ -2430,84 +1779,69 @@ def main():
         
         # Daten abrufen falls noch nicht geschehen
         if 'launches' not in locals():
-            launch_data = get_launch_data()
-            if launch_data:
-                launches = launch_data.get('results', [])
-            else:
-                launches = []
+            launches = get_current_launch_table() or []
         
-        # Analyse aller kommenden Starts
-        if launches:
-            visible_launches = []
-            all_launches_analysis = []
+        # Analyse aller kommenden Starts (gemeinsame Tabelle aus Tab 1)
+        if len(launches):
+            all_launches_analysis = get_current_launch_analysis(launches)
+            distances = all_launches_analysis['distance_km']
+            visible_launches = all_launches_analysis[all_launches_analysis['potentially_visible']]
             
-            for launch in launches:
-                launch_time_str = launch['net']
-                launch_time_utc = datetime.fromisoformat(launch_time_str.replace('Z', '+00:00'))
-                launch_pad = launch['pad']
-                launch_lat = float(launch_pad['latitude']) if launch_pad.get('latitude') else 0
-                launch_lon = float(launch_pad['longitude']) if launch_pad.get('longitude') else 0
-                launch_coords = (launch_lat, launch_lon)
-                
-                visibility_rating, description, time_rating, distance = evaluate_launch_visibility(launch_coords, launch_time_utc)
-                
-                all_launches_analysis.append({
-                    'name': launch['name'],
-                    'provider': launch['launch_service_provider']['name'],
-                    'distance': distance,
-                    'visibility_rating': visibility_rating,
-                    'location': launch_pad['location']['name']
-                })
-                
-                if distance <= 3500:  # Potentiell sichtbar
-                    visible_launches.append({
-                        'name': launch['name'],
-                        'provider': launch['launch_service_provider']['name'],
-                        'distance': distance,
-                        'visibility_rating': visibility_rating,
-                        'time_utc': launch_time_utc,
-                        'location': launch_pad['location']['name']
-                    })
+            # Echte Sichtbarkeitsfenster aller Starts (Aufstieg und erste Umläufe)
+            with st.spinner("Analysiere Flugbahnen aller Starts..."):
+                trajectory_analysis = all_launches_analysis.merge(get_current_manifest_analysis(launches), on='id')
+            launches_with_windows = trajectory_analysis[trajectory_analysis['windows'] > 0]
             
             # Statistiken anzeigen
-            col1, col2, col3 = st.columns(3)
+            col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 st.metric("Gesamt Starts", len(all_launches_analysis))
             
             with col2:
-                potentially_visible = len([l for l in all_launches_analysis if l['distance'] <= 3500])
-                st.metric("Potentiell sichtbar", potentially_visible)
+                st.metric("Potentiell sichtbar", len(visible_launches), help="Nach Entfernung des Startplatzes")
             
             with col3:
-                very_good = len([l for l in all_launches_analysis if l['distance'] <= 1000])
-                st.metric("Sehr gute Chancen", very_good)
+                st.metric("Mit Sichtbarkeitsfenster", len(launches_with_windows),
+                          help=f"Aufstieg und erste {MANIFEST_ANALYSIS_ORBITS} Umläufe")
+            
+            with col4:
+                st.metric("Sehr gute Chancen", int((launches_with_windows['best_visibility'] > 70).sum()),
+                          help=">70% Sichtbarkeit im besten Fenster")
             
             # Diagramm der Sichtbarkeitsverteilung
             st.subheader("📈 Sichtbarkeitsverteilung")
             
             categories = {
-                "Sehr gut (≤1000km)": len([l for l in all_launches_analysis if l['distance'] <= 1000]),
-                "Gut (≤2000km)": len([l for l in all_launches_analysis if 1000 < l['distance'] <= 2000]),
-                "Möglich (≤3500km)": len([l for l in all_launches_analysis if 2000 < l['distance'] <= 3500]),
-                "Unwahrscheinlich (>3500km)": len([l for l in all_launches_analysis if l['distance'] > 3500])
+                "Sehr gut (≤1000km)": int((distances <= 1000).sum()),
+                "Gut (≤2000km)": int(((distances > 1000) & (distances <= 2000)).sum()),
+                "Möglich (≤3500km)": int(((distances > 2000) & (distances <= 3500)).sum()),
+                "Unwahrscheinlich (>3500km)": int((distances > 3500).sum())
             }
             
             chart_data = pd.DataFrame(list(categories.items()), columns=['Kategorie', 'Anzahl'])
             st.bar_chart(chart_data.set_index('Kategorie'))
             
-            # Liste der am besten sichtbaren Starts
-            if visible_launches:
-                st.subheader("⭐ Beste Sichtbarkeitschancen")
-                visible_df = pd.DataFrame(visible_launches)
-                visible_df = visible_df.sort_values('distance').head(10)
+            # Liste der am besten sichtbaren Starts, nach ihren echten Sichtbarkeitsfenstern
+            st.subheader("⭐ Beste Sichtbarkeitschancen")
+            if len(launches_with_windows):
+                de_timezone = pytz.timezone('Europe/Berlin')
+                ranked_df = launches_with_windows.sort_values(
+                    ['best_visibility', 'max_elevation', 'distance_km'], ascending=[False, False, True]
+                ).head(10)
                 
-                for _, launch in visible_df.iterrows():
-                    with st.expander(f"{launch['name']} - {launch['visibility_rating']}"):
+                for _, launch in ranked_df.iterrows():
+                    with st.expander(f"{launch['name']} - {launch['best_visibility']:.0f}% ({launch['windows']} Fenster)"):
                         st.write(f"**Anbieter:** {launch['provider']}")
-                        st.write(f"**Startort:** {launch['location']}")
-                        st.write(f"**Entfernung:** {launch['distance']:.0f} km")
+                        st.write(f"**Startort:** {launch['location']} ({launch['distance_km']:.0f} km, {launch['visibility_rating']})")
                         st.write(f"**Startzeit:** {launch['time_utc'].strftime('%d.%m.%Y %H:%M')} UTC")
+                        st.write(f"**Bestes Fenster:** {launch['best_phase']}, Höhepunkt "
+                                 f"{datetime.fromtimestamp(launch['best_peak'], de_timezone).strftime('%d.%m. %H:%M:%S')} (DE), "
+                                 f"{launch['best_direction']}")
+                        st.write(f"**Max. Elevation:** {launch['max_elevation']:.0f}° · "
+                                 f"**Sichtbar insgesamt:** {launch['total_minutes']:.1f} Min")
+            else:
+                st.info(f"ℹ️ Kein kommender Start ist während Aufstieg und der ersten {MANIFEST_ANALYSIS_ORBITS} Umläufe von Deutschland aus sichtbar.")
         else:
             st.warning("Keine Startdaten verfügbar für die Analyse.")
     
@@ -2516,6 +1850,8 @@ def main():
         
         # Generiere historische Daten
         historical_data = generate_historical_sightings()
+        if PLOTLY_AVAILABLE:
+            import plotly.express as px
         
         # Übersicht der letzten 12 Monate
         st.subheader("📊 Sichtungen der letzten 12 Monate")
@@ -2731,8 +2067,9 @@ def main():
         ### 🔭 Sichtbarkeitsfaktoren
         
         **Optimale Bedingungen:**
-        - 🌙 **Nachtzeit** (22:00 - 04:00 Uhr): Beste Sichtbarkeit
-        - 🌅 **Dämmerung** (20:00 - 22:00, 04:00 - 06:00 Uhr): Gute Sichtbarkeit
+        - 🌙 **Nacht** (Sonne mehr als 12° unter dem Horizont): Beste Sichtbarkeit
+        - 🌅 **Nautische Dämmerung** (Sonne 6-12° unter dem Horizont): Gute Sichtbarkeit
+        - 🌆 **Bürgerliche Dämmerung** (Sonne 0-6° unter dem Horizont): Nur helle Objekte
         - ☁️ **Klarer Himmel**: Keine Wolken
         - 🏙️ **Geringe Lichtverschmutzung**: Ländliche Gebiete bevorzugt
         
@@ -2768,4 +2105,4 @@ def main():
         """)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
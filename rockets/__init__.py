@@ -0,0 +1,10 @@
+"""Sichtbarkeit von Raketenstarts, Satelliten und Wiedereintritten von Deutschland aus, ohne Streamlit.
+
+Die Streamlit-Oberfläche liegt in Rocketnew.py, die Kommandozeile in rockets.cli
+(z.B. python -m rockets analyze --days 7 --json).
+"""
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Gemeinsames Cache-Verzeichnis aller Server-Prozesse (Startdaten, Anfrage-Kontingente)
+CACHE_DIR = os.environ.get("ROCKETS_CACHE_DIR", os.path.join(PROJECT_DIR, ".cache"))
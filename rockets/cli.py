@@ -0,0 +1,171 @@
+"""Kommandozeile: dieselben Berechnungen wie die App, ohne Streamlit (python -m rockets <befehl>)"""
+import argparse
+import json
+import math
+import sys
+import time
+from datetime import datetime
+
+import pytz
+
+from .geometry import azimuth_to_direction
+from .launches import LaunchTable, build_launch_analysis, load_launch_table
+from .reentry import calculate_reentry_observation_windows, evaluate_reentry_visibility, simulate_reentry_data
+from .satellites import ISS_PASS_HORIZON_DAYS, get_iss_passes
+from .startup import STARTUP_MODULES, measure_startup
+from .windows import MANIFEST_ANALYSIS_ORBITS, MANIFEST_ANALYSIS_WORKERS, analyze_launch_manifest
+
+DE_TIMEZONE = pytz.timezone('Europe/Berlin')
+
+def _isoformat(epoch):
+    """Epoch-Sekunden als ISO-8601 in UTC (None bleibt None)"""
+    if epoch is None or (isinstance(epoch, float) and math.isnan(epoch)):
+        return None
+    return datetime.fromtimestamp(epoch, pytz.UTC).isoformat()
+
+def _text(value):
+    """Fehlende Werte (NaN aus pandas) als None"""
+    return value if isinstance(value, str) else None
+
+def _local_time(epoch, fmt='%d.%m. %H:%M'):
+    return datetime.fromtimestamp(epoch, DE_TIMEZONE).strftime(fmt) if epoch is not None else "–"
+
+def analyze_upcoming_launches(days, num_orbits=MANIFEST_ANALYSIS_ORBITS, workers=MANIFEST_ANALYSIS_WORKERS):
+    """Bewertung und Fensteranalyse aller Starts der nächsten Tage, eine Zeile (dict) pro Start.
+
+    Liefert None, wenn keine Startdaten verfügbar sind.
+    """
+    launches = load_launch_table()
+    if launches is None:
+        return None
+    horizon = time.time() + days * 86400
+    launches = LaunchTable([launch for launch in launches if launch.net_epoch <= horizon])
+    if not len(launches):
+        return []
+
+    analysis = build_launch_analysis(launches).merge(
+        analyze_launch_manifest(launches, num_orbits=num_orbits, workers=workers), on='id')
+    return [{
+        'id': row['id'],
+        'name': row['name'],
+        'provider': row['provider'],
+        'location': row['location'],
+        'net': _isoformat(row['net_epoch']),
+        'distance_km': round(row['distance_km'], 1),
+        'visibility_rating': row['visibility_rating'],
+        'time_rating': row['time_rating'],
+        'orbit_type': row['orbit_type'],
+        'windows': int(row['windows']),
+        'best_visibility': round(float(row['best_visibility']), 1),
+        'max_elevation': round(float(row['max_elevation']), 1),
+        'total_minutes': round(float(row['total_minutes']), 1),
+        'first_start': _isoformat(row['first_start']),
+        'best_peak': _isoformat(row['best_peak']),
+        'best_phase': _text(row['best_phase']),
+        'best_direction': _text(row['best_direction']),
+    } for row in analysis.to_dict('records')]
+
+def _print_launches(rows):
+    for row in rows:
+        net_epoch = datetime.fromisoformat(row['net']).timestamp()
+        best = (f"{row['windows']} Fenster, beste Sichtbarkeit {row['best_visibility']:.0f}% "
+                f"({row['best_phase']}, {row['best_direction']})") if row['windows'] else "keine Fenster"
+        print(f"{_local_time(net_epoch)}  {row['name'][:48]:<48}  {row['distance_km']:>7.0f} km  "
+              f"{row['orbit_type']:<5}  {best}")
+
+def command_analyze(args):
+    rows = analyze_upcoming_launches(args.days, args.orbits, args.workers)
+    if rows is None:
+        print("Startdaten sind derzeit nicht verfügbar.", file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump(rows, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        _print_launches(rows)
+    return 0
+
+def command_iss(args):
+    passes = [iss_pass for iss_pass in get_iss_passes(days=args.days) if iss_pass['visibility'] >= args.min_visibility]
+    if args.json:
+        json.dump([dict(iss_pass, rise_utc=_isoformat(iss_pass['rise']), set_utc=_isoformat(iss_pass['set']))
+                   for iss_pass in passes], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    for iss_pass in passes:
+        print(f"{_local_time(iss_pass['rise'], '%d.%m. %H:%M:%S')}  {iss_pass['duration'] / 60:4.1f} Min  "
+              f"max. {iss_pass['max_elevation']:3.0f}°  "
+              f"{azimuth_to_direction(iss_pass['rise_azimuth'])} → {azimuth_to_direction(iss_pass['set_azimuth'])}  "
+              f"Sichtbarkeit {iss_pass['visibility']:.0f}%")
+    return 0
+
+def command_reentries(args):
+    rows = []
+    for reentry in simulate_reentry_data()['results']:
+        visibility = evaluate_reentry_visibility(
+            (reentry['trajectory_start']['lat'], reentry['trajectory_start']['lon']),
+            (reentry['trajectory_end']['lat'], reentry['trajectory_end']['lon']),
+            (reentry['predicted_location']['lat'], reentry['predicted_location']['lon']),
+            reentry['reentry_time'])
+        rows.append(dict(reentry, reentry_time=reentry['reentry_time'].isoformat(),
+                         visibility=visibility, observation_windows=calculate_reentry_observation_windows(reentry)))
+    if args.json:
+        json.dump(rows, sys.stdout, ensure_ascii=False, indent=2, default=float)
+        print()
+        return 0
+    for row in rows:
+        reentry_epoch = datetime.fromisoformat(row['reentry_time']).timestamp()
+        print(f"{_local_time(reentry_epoch)}  {row['name'][:40]:<40}  ±{row['uncertainty_hours']} h  "
+              f"{row['visibility']['distance']:>6.0f} km  {row['visibility']['visibility_rating']}")
+    return 0
+
+def command_startup(args):
+    reports = [measure_startup(module) for module in args.modules]
+    if args.json:
+        json.dump(reports, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    for report in reports:
+        if "error" in report:
+            print(f"{report['module']}: Import fehlgeschlagen {report['error']}")
+            continue
+        rss = f", {report['rss_mb']:.0f} MB" if report['rss_mb'] is not None else ""
+        print(f"{report['module']}: {report['seconds']:.2f} s{rss}")
+        for package, seconds in list(report['packages'].items())[:args.top]:
+            print(f"  {seconds:6.3f} s  {package}")
+        print(f"  Schwere Module geladen: {', '.join(report['heavy_loaded']) or 'keine'}")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="rockets", description="Sichtbarkeit von Raketenstarts, ISS und "
+                                                                  "Wiedereintritten von Deutschland aus")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser("analyze", help="Sichtbarkeitsfenster aller kommenden Starts")
+    analyze.add_argument("--days", type=float, default=7, help="Starts der nächsten N Tage (Standard: 7)")
+    analyze.add_argument("--orbits", type=int, default=MANIFEST_ANALYSIS_ORBITS, help="Umläufe je Start")
+    analyze.add_argument("--workers", type=int, default=MANIFEST_ANALYSIS_WORKERS, help="Worker-Prozesse")
+    analyze.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    analyze.set_defaults(handler=command_analyze)
+
+    iss = subparsers.add_parser("iss", help="ISS-Überflüge über Deutschland")
+    iss.add_argument("--days", type=float, default=ISS_PASS_HORIZON_DAYS, help="Zeitraum in Tagen")
+    iss.add_argument("--min-visibility", type=float, default=30, help="Mindest-Sichtbarkeit in %% (Standard: 30)")
+    iss.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    iss.set_defaults(handler=command_iss)
+
+    reentries = subparsers.add_parser("reentries", help="Bevorstehende Wiedereintritte mit Beobachtungsfenstern")
+    reentries.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    reentries.set_defaults(handler=command_reentries)
+
+    startup = subparsers.add_parser("startup", help="Startzeit-Bericht: Importzeit und Speicher je Modul")
+    startup.add_argument("modules", nargs="*", default=list(STARTUP_MODULES),
+                         help="Zu messende Module (Standard: App und Worker-Module)")
+    startup.add_argument("--top", type=int, default=10, help="Teuerste Pakete je Modul (Standard: 10)")
+    startup.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    startup.set_defaults(handler=command_startup)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,172 @@
+"""Geometrie-Kern: Erdmodelle, Entfernungen, Koordinatentransformationen und Blickwinkel von Deutschland aus"""
+from datetime import datetime
+
+import numpy as np
+
+# Deutschland-Koordinaten
+germany_coords = (51.1657, 10.4515)
+
+# Erdmodelle für die Entfernungsberechnung
+EARTH_MEAN_RADIUS_KM = 6371.0088  # mittlerer Erdradius (IUGG)
+WGS84_A_KM = 6378.137  # große Halbachse WGS84
+WGS84_F = 1 / 298.257223563  # Abplattung WGS84
+
+# Vektorisierte Großkreis-Entfernung (einziges Entfernungsmodell des Pakets und der App)
+def great_circle_distance_km(lat1, lon1, lat2, lon2, ellipsoidal=False):
+    """Berechnet Entfernungen in km für beliebig viele Punktpaare (NumPy-Broadcasting).
+
+    Standard ist die Haversine-Formel auf der Kugel mit mittlerem Erdradius. Gegenüber
+    geopy.geodesic (Karney, WGS84) beträgt der Fehler höchstens ca. 0,52 % (weltweit
+    max. ~38 km, innerhalb 4000 km um Deutschland max. ~19 km). Mit ellipsoidal=True
+    wird die Andoyer-Lambert-Näherung auf dem WGS84-Ellipsoid verwendet: Fehler
+    innerhalb 4000 km max. ~40 m, weltweit max. ~1,1 km (nahe antipodaler Punkte).
+    """
+
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    half_dlon = np.radians(np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float)) / 2
+
+    if not ellipsoidal:
+        half_dlat = (lat2 - lat1) / 2
+        a = np.sin(half_dlat)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(half_dlon)**2
+        return 2 * EARTH_MEAN_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    # Andoyer-Lambert: Kugelentfernung mit Abplattungskorrektur erster Ordnung
+    f = (lat1 + lat2) / 2
+    g = (lat1 - lat2) / 2
+    sin2_g, cos2_g = np.sin(g)**2, np.cos(g)**2
+    sin2_f, cos2_f = np.sin(f)**2, np.cos(f)**2
+    sin2_l, cos2_l = np.sin(half_dlon)**2, np.cos(half_dlon)**2
+
+    s = sin2_g * cos2_l + cos2_f * sin2_l
+    c = cos2_g * cos2_l + sin2_f * sin2_l
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        omega = np.arctan(np.sqrt(s / c))
+        r = np.sqrt(s * c) / omega
+        d = 2 * omega * WGS84_A_KM
+        h1 = (3 * r - 1) / (2 * c)
+        h2 = (3 * r + 1) / (2 * s)
+        distance = d * (1 + WGS84_F * h1 * sin2_f * cos2_g - WGS84_F * h2 * cos2_f * sin2_g)
+
+    # Identische Punkte (s = 0) und exakt antipodale Punkte (c = 0) abfangen
+    return np.where(s == 0, 0.0, np.where(c == 0, d, distance))
+
+# Vektorisierte Anfangspeilung (Großkreis) in Grad, 0° = Norden, im Uhrzeigersinn
+def initial_bearing_deg(lat1, lon1, lat2, lon2):
+    """Berechnet die Peilung von Punkt 1 zu Punkt 2 für beliebig viele Punktpaare"""
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlon = np.radians(np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float))
+    x = np.sin(dlon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    return np.degrees(np.arctan2(x, y)) % 360
+
+# Geometrie-Kern: Beobachter und Ziele im erdfesten System (ECEF), daraus echte Himmelspositionen
+def geodetic_to_ecef(lat, lon, alt_km=0.0):
+    """Geodätische Koordinaten (Grad, km über WGS84) nach ECEF (km), letzte Achse = x, y, z"""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    alt_km = np.asarray(alt_km, dtype=float)
+    e2 = WGS84_F * (2 - WGS84_F)
+    n = WGS84_A_KM / np.sqrt(1 - e2 * np.sin(lat)**2)
+    return np.stack([(n + alt_km) * np.cos(lat) * np.cos(lon),
+                     (n + alt_km) * np.cos(lat) * np.sin(lon),
+                     (n * (1 - e2) + alt_km) * np.sin(lat)], axis=-1)
+
+def look_angles(observer_lat, observer_lon, targets_ecef, observer_alt_km=0.0):
+    """Elevation, Azimut (Grad, 0° = Norden) und Schrägentfernung (km) von Zielen aus Sicht von Beobachtern.
+    
+    Beobachter (Grad) und Ziele (ECEF, letzte Achse x, y, z) werden gegeneinander gebroadcastet,
+    z.B. Beobachter der Form (N, 1) gegen Ziele (M, 3) ergibt (N, M)-Arrays.
+    """
+    observer = geodetic_to_ecef(observer_lat, observer_lon, observer_alt_km)
+    rho = np.asarray(targets_ecef, dtype=float) - observer
+    x, y, z = rho[..., 0], rho[..., 1], rho[..., 2]
+    
+    # Lokales Ost-Nord-Oben-System (ENU) des Beobachters
+    lat = np.radians(np.asarray(observer_lat, dtype=float))
+    lon = np.radians(np.asarray(observer_lon, dtype=float))
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+    east = -sin_lon * x + cos_lon * y
+    north = -sin_lat * cos_lon * x - sin_lat * sin_lon * y + cos_lat * z
+    up = cos_lat * cos_lon * x + cos_lat * sin_lon * y + sin_lat * z
+    
+    range_km = np.sqrt(x * x + y * y + z * z)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        elevation = np.degrees(np.arcsin(np.clip(np.where(range_km > 0, up / range_km, 1.0), -1, 1)))
+    azimuth = np.degrees(np.arctan2(east, north)) % 360
+    return elevation, azimuth, range_km
+
+def look_angles_from_germany(lats, lons, heights=0.0):
+    """Elevation, Azimut und Schrägentfernung von Punkten (Grad, km Höhe) vom Mittelpunkt Deutschlands aus"""
+    return look_angles(germany_coords[0], germany_coords[1], geodetic_to_ecef(lats, lons, heights))
+
+def distance_from_germany_km(lats, lons, ellipsoidal=False):
+    """Entfernung(en) von Deutschland in km, für Skalare oder Arrays"""
+    distance = great_circle_distance_km(germany_coords[0], germany_coords[1], lats, lons, ellipsoidal)
+    return float(distance) if np.ndim(distance) == 0 else distance
+
+# Zeitpunkte (datetime, Liste von datetimes oder Epoch-Sekunden) in ein Epoch-Array umwandeln
+def to_epoch_seconds(times_utc):
+    """Wandelt einen oder mehrere UTC-Zeitpunkte in ein float-Array von Epoch-Sekunden um"""
+    if isinstance(times_utc, datetime):
+        return np.array([times_utc.timestamp()])
+    times = np.asarray(times_utc)
+    if times.dtype == object:
+        return np.array([t.timestamp() for t in times.ravel()]).reshape(times.shape)
+    return times.astype(float)
+
+def calculate_direction_from_germany(coords, height=0.0):
+    """Berechnet die Himmelsrichtung von Deutschland aus zu den gegebenen Koordinaten (über den Azimut)"""
+    
+    _, azimuth, _ = look_angles_from_germany(coords[0], coords[1], height)
+    return f"{azimuth_to_direction(float(azimuth))} 🧭"
+
+def gmst_radians(epoch_seconds):
+    """Greenwich Mean Sidereal Time (IAU 1982, UT1 ≈ UTC) für beliebig viele Zeitpunkte"""
+    t = (np.asarray(epoch_seconds, dtype=float) / 86400.0 + 2440587.5 - 2451545.0) / 36525.0
+    gmst_seconds = 67310.54841 + (876600.0 * 3600 + 8640184.812866) * t + 0.093104 * t**2 - 6.2e-6 * t**3
+    return (gmst_seconds % 86400.0) / 86400.0 * 2 * np.pi
+
+def teme_to_ecef(positions, epoch_seconds):
+    """Dreht TEME-Positionen (..., n_t, 3) über GMST ins erdfeste System (Polbewegung vernachlässigt)"""
+    gmst = gmst_radians(epoch_seconds)
+    cos_g, sin_g = np.cos(gmst), np.sin(gmst)
+    x, y, z = positions[..., 0], positions[..., 1], positions[..., 2]
+    return np.stack([cos_g * x + sin_g * y, -sin_g * x + cos_g * y, z], axis=-1)
+
+def ecef_to_geodetic(positions):
+    """ECEF (km) nach geodätischer Breite/Länge (Grad) und Höhe (km) über WGS84 (Bowring)"""
+    x, y, z = positions[..., 0], positions[..., 1], positions[..., 2]
+    e2 = WGS84_F * (2 - WGS84_F)
+    b = WGS84_A_KM * (1 - WGS84_F)
+    ep2 = e2 / (1 - e2)
+    
+    p = np.hypot(x, y)
+    theta = np.arctan2(z * WGS84_A_KM, p * b)
+    lat = np.arctan2(z + ep2 * b * np.sin(theta)**3, p - e2 * WGS84_A_KM * np.cos(theta)**3)
+    lon = np.arctan2(y, x)
+    sin_lat = np.sin(lat)
+    alt = p * np.cos(lat) + z * sin_lat - WGS84_A_KM * np.sqrt(1 - e2 * sin_lat**2)
+    return np.degrees(lat), np.degrees(lon), alt
+
+def julian_dates(epoch_seconds):
+    """Unix-Zeitpunkte als (ganzzahliges Julianisches Datum, Tagesbruchteil) für sgp4"""
+    days = np.atleast_1d(np.asarray(epoch_seconds, dtype=float)) / 86400.0
+    whole_days = np.floor(days)
+    return whole_days + 2440587.5, days - whole_days
+
+def unit_vectors(lats, lons):
+    """Einheitsvektoren (N, 3) auf der Kugel zu Breiten/Längen in Grad"""
+    lats = np.radians(np.asarray(lats, dtype=float))
+    lons = np.radians(np.asarray(lons, dtype=float))
+    return np.stack([np.cos(lats) * np.cos(lons), np.cos(lats) * np.sin(lons), np.sin(lats)], axis=-1)
+
+# Himmelsrichtung (8 Sektoren) zu einem Azimut
+COMPASS_DIRECTIONS = ["Norden", "Nordosten", "Osten", "Südosten", "Süden", "Südwesten", "Westen", "Nordwesten"]
+
+def azimuth_to_direction(azimuth):
+    """Ordnet einem Azimut in Grad (0° = Norden) die Himmelsrichtung zu"""
+    return COMPASS_DIRECTIONS[int(((azimuth + 22.5) % 360) // 45)]
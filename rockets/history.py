@@ -0,0 +1,312 @@
+"""Historische Sichtungen und Vorhersagen (simulierte Daten) samt Auswertungen für die Diagramme"""
+import random
+
+def generate_historical_sightings():
+    """Generiert realistische historische Sichtungsdaten für die letzten 12 Monate"""
+    
+    import random
+    from datetime import datetime, timedelta
+    
+    sightings = []
+    base_date = datetime.now() - timedelta(days=365)
+    
+    # Bekannte reale Ereignisse 2025
+    real_events = [
+        {"date": "2025-03-24", "time": "21:30", "name": "SpaceX NROL-69 Spiral", "type": "SpaceX Spiral", "visibility": 85, "confirmed": True},
+        {"date": "2025-02-19", "time": "04:45", "name": "Falcon 9 Wiedereintritt", "type": "Wiedereintritt", "visibility": 92, "confirmed": True},
+        {"date": "2025-01-15", "time": "23:15", "name": "Blue Ghost Lunar Mission", "type": "SpaceX Start", "visibility": 45, "confirmed": False},
+        {"date": "2025-03-30", "time": "20:45", "name": "Isar Spectrum Test", "type": "Europäische Rakete", "visibility": 78, "confirmed": True},
+    ]
+    
+    # Reale Ereignisse hinzufügen
+    for event in real_events:
+        event_date = datetime.strptime(event["date"], "%Y-%m-%d")
+        sightings.append({
+            "date": event_date,
+            "name": event["name"],
+            "type": event["type"],
+            "time": event["time"],
+            "visibility": event["visibility"],
+            "confirmed": event["confirmed"],
+            "distance": random.randint(800, 3500),
+            "region": random.choice(["Norddeutschland", "Süddeutschland", "Westdeutschland", "Ostdeutschland", "Ganz Deutschland"]),
+            "quality": "Exzellent" if event["visibility"] > 80 else "Sehr gut" if event["visibility"] > 60 else "Gut",
+            "description": f"Sichtung von {event['name']} mit {event['visibility']}% Sichtbarkeit."
+        })
+    
+    # Zusätzliche simulierte Sichtungen generieren
+    event_types = [
+        {"name": "ISS-Überflug", "type": "ISS", "prob": 0.4, "vis_range": (30, 90)},
+        {"name": "Starlink-Kette", "type": "Starlink", "prob": 0.25, "vis_range": (40, 85)},
+        {"name": "SpaceX Falcon 9", "type": "SpaceX Start", "prob": 0.15, "vis_range": (20, 70)},
+        {"name": "Europäische Rakete", "type": "Europäische Rakete", "prob": 0.1, "vis_range": (50, 95)},
+        {"name": "Debris-Wiedereintritt", "type": "Wiedereintritt", "prob": 0.05, "vis_range": (60, 100)},
+        {"name": "Geheimer Satellit", "type": "Militär", "prob": 0.05, "vis_range": (10, 40)},
+    ]
+    
+    # Generiere 80-120 zusätzliche Sichtungen über 12 Monate
+    for _ in range(random.randint(80, 120)):
+        # Zufälliges Datum
+        days_ago = random.randint(1, 365)
+        event_date = datetime.now() - timedelta(days=days_ago)
+        
+        # Bevorzuge Nacht- und Dämmerungszeiten
+        if random.random() < 0.6:  # 60% nachts/Dämmerung
+            hour = random.choice([20, 21, 22, 23, 0, 1, 2, 3, 4, 5, 6])
+        else:  # 40% andere Zeiten
+            hour = random.randint(7, 19)
+        
+        minute = random.randint(0, 59)
+        time_str = f"{hour:02d}:{minute:02d}"
+        
+        # Wähle Event-Typ basierend auf Wahrscheinlichkeiten
+        rand = random.random()
+        cumulative_prob = 0
+        selected_event = event_types[0]  # Fallback
+        
+        for event_type in event_types:
+            cumulative_prob += event_type["prob"]
+            if rand <= cumulative_prob:
+                selected_event = event_type
+                break
+        
+        # Sichtbarkeit basierend auf Event-Typ und Tageszeit
+        base_visibility = random.randint(*selected_event["vis_range"])
+        
+        # Nacht-Bonus
+        if 22 <= hour or hour <= 4:
+            visibility = min(100, base_visibility + random.randint(0, 15))
+        elif 18 <= hour <= 21 or 5 <= hour <= 7:
+            visibility = min(100, base_visibility + random.randint(0, 10))
+        else:
+            visibility = max(10, base_visibility - random.randint(0, 20))
+        
+        sightings.append({
+            "date": event_date,
+            "name": selected_event["name"],
+            "type": selected_event["type"], 
+            "time": time_str,
+            "visibility": visibility,
+            "confirmed": random.random() < 0.7,  # 70% bestätigt
+            "distance": random.randint(500, 4000),
+            "region": random.choice(["Norddeutschland", "Süddeutschland", "Westdeutschland", "Ostdeutschland", "Ganz Deutschland"]),
+            "quality": "Exzellent" if visibility > 80 else "Sehr gut" if visibility > 60 else "Gut" if visibility > 40 else "Mäßig",
+            "description": f"Sichtung von {selected_event['name']} mit {visibility}% Sichtbarkeit um {time_str} Uhr."
+        })
+    
+    # Nach Datum sortieren
+    sightings.sort(key=lambda x: x["date"], reverse=True)
+    
+    return sightings
+
+def get_best_sighting_month(historical_data):
+    """Ermittelt den Monat mit den meisten Sichtungen"""
+    month_counts = {}
+    month_names = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
+                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
+    
+    for sighting in historical_data:
+        month = sighting["date"].month
+        month_name = month_names[month - 1]
+        month_counts[month_name] = month_counts.get(month_name, 0) + 1
+    
+    if month_counts:
+        return max(month_counts, key=month_counts.get)
+    return "N/A"
+
+def prepare_monthly_chart_data(historical_data):
+    """Bereitet Daten für das monatliche Chart vor"""
+    import pandas as pd
+    
+    month_counts = {}
+    month_names = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
+                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
+    
+    # Initialisiere alle Monate mit 0
+    for month_name in month_names:
+        month_counts[month_name] = 0
+    
+    # Zähle Sichtungen pro Monat
+    for sighting in historical_data:
+        month = sighting["date"].month
+        month_name = month_names[month - 1]
+        month_counts[month_name] += 1
+    
+    # Erstelle DataFrame
+    data = []
+    for month, count in month_counts.items():
+        data.append({"month": month, "count": count})
+    
+    return pd.DataFrame(data)
+
+def prepare_hourly_chart_data(historical_data):
+    """Bereitet Daten für das stündliche Chart vor"""
+    import pandas as pd
+    
+    hour_counts = {hour: 0 for hour in range(24)}
+    
+    for sighting in historical_data:
+        hour = int(sighting["time"].split(":")[0])
+        hour_counts[hour] += 1
+    
+    data = []
+    for hour, count in hour_counts.items():
+        data.append({"hour": hour, "count": count})
+    
+    return pd.DataFrame(data)
+
+def analyze_best_sighting_times(historical_data):
+    """Analysiert die besten Sichtungszeiten"""
+    
+    night_count = 0
+    twilight_count = 0
+    day_count = 0
+    
+    night_hours = {}
+    twilight_hours = {}
+    
+    for sighting in historical_data:
+        hour = int(sighting["time"].split(":")[0])
+        
+        if 22 <= hour or hour <= 4:
+            night_count += 1
+            night_hours[hour] = night_hours.get(hour, 0) + 1
+        elif (18 <= hour <= 21) or (5 <= hour <= 7):
+            twilight_count += 1
+            twilight_hours[hour] = twilight_hours.get(hour, 0) + 1
+        else:
+            day_count += 1
+    
+    total = len(historical_data)
+    
+    best_night_hour = max(night_hours, key=night_hours.get) if night_hours else 23
+    best_twilight_hour = max(twilight_hours, key=twilight_hours.get) if twilight_hours else 20
+    
+    return {
+        "night": night_count,
+        "night_percent": (night_count / total * 100) if total > 0 else 0,
+        "twilight": twilight_count,
+        "twilight_percent": (twilight_count / total * 100) if total > 0 else 0,
+        "best_night_hour": best_night_hour,
+        "best_twilight_hour": best_twilight_hour
+    }
+
+def analyze_seasonal_patterns(historical_data):
+    """Analysiert saisonale Muster"""
+    
+    season_counts = {"Winter": 0, "Frühling": 0, "Sommer": 0, "Herbst": 0}
+    month_counts = {}
+    
+    for sighting in historical_data:
+        month = sighting["date"].month
+        month_counts[month] = month_counts.get(month, 0) + 1
+        
+        if month in [12, 1, 2]:
+            season_counts["Winter"] += 1
+        elif month in [3, 4, 5]:
+            season_counts["Frühling"] += 1
+        elif month in [6, 7, 8]:
+            season_counts["Sommer"] += 1
+        else:
+            season_counts["Herbst"] += 1
+    
+    month_names = {1: "Januar", 2: "Februar", 3: "März", 4: "April", 5: "Mai", 6: "Juni",
+                   7: "Juli", 8: "August", 9: "September", 10: "Oktober", 11: "November", 12: "Dezember"}
+    
+    if month_counts:
+        best_month_num = max(month_counts, key=month_counts.get)
+        worst_month_num = min(month_counts, key=month_counts.get)
+        best_month = month_names.get(best_month_num, "N/A")
+        worst_month = month_names.get(worst_month_num, "N/A")
+        best_count = month_counts[best_month_num]
+        worst_count = month_counts[worst_month_num]
+    else:
+        best_month = worst_month = "N/A"
+        best_count = worst_count = 0
+    
+    return {
+        "best_month": best_month,
+        "best_count": best_count,
+        "worst_month": worst_month,
+        "worst_count": worst_count,
+        "winter": season_counts["Winter"],
+        "spring": season_counts["Frühling"],
+        "summer": season_counts["Sommer"],
+        "autumn": season_counts["Herbst"]
+    }
+
+def prepare_sighting_types_data(historical_data):
+    """Bereitet Daten für das Sichtungsarten-Diagramm vor"""
+    import pandas as pd
+    
+    type_counts = {}
+    for sighting in historical_data:
+        sighting_type = sighting["type"]
+        type_counts[sighting_type] = type_counts.get(sighting_type, 0) + 1
+    
+    data = []
+    for sighting_type, count in type_counts.items():
+        data.append({"type": sighting_type, "count": count})
+    
+    return pd.DataFrame(data)
+
+def get_notable_sightings(historical_data):
+    """Filtert bemerkenswerte Sichtungen heraus"""
+    
+    # Sortiere nach Sichtbarkeit und nimm die besten
+    notable = sorted(historical_data, key=lambda x: x["visibility"], reverse=True)[:10]
+    
+    # Formatiere für Anzeige
+    formatted = []
+    for sighting in notable:
+        formatted.append({
+            "date": sighting["date"].strftime("%d.%m.%Y"),
+            "time": sighting["time"],
+            "name": sighting["name"],
+            "type": sighting["type"],
+            "visibility": sighting["visibility"],
+            "distance": sighting["distance"],
+            "region": sighting["region"],
+            "quality": sighting["quality"],
+            "confirmed": sighting["confirmed"],
+            "description": sighting["description"]
+        })
+    
+    return formatted
+
+def generate_sighting_predictions():
+    """Generiert Vorhersagen für kommende Monate"""
+    import pandas as pd
+    from datetime import datetime, timedelta
+    
+    # Nächste 6 Monate
+    months = []
+    current_date = datetime.now()
+    
+    for i in range(6):
+        future_date = current_date + timedelta(days=30 * i)
+        month_name = future_date.strftime("%b %Y")
+        
+        # Basiere Vorhersage auf saisonalen Mustern und geplanten Starts
+        base_prediction = 8  # Basis pro Monat
+        
+        # Saisonale Anpassung
+        month_num = future_date.month
+        if month_num in [11, 12, 1, 2]:  # Winter - bessere Sichtbarkeit
+            seasonal_bonus = 3
+        elif month_num in [6, 7, 8]:  # Sommer - schlechtere Sichtbarkeit
+            seasonal_bonus = -2
+        else:
+            seasonal_bonus = 0
+        
+        # Geplante Starts berücksichtigen
+        planned_starts_bonus = random.randint(0, 4)
+        
+        predicted = max(2, base_prediction + seasonal_bonus + planned_starts_bonus)
+        
+        months.append({
+            "month": month_name,
+            "predicted_sightings": predicted
+        })
+    
+    return pd.DataFrame(months)
@@ -0,0 +1,300 @@
+"""HTTP-Client mit Rate-Budget, Retries und Fixture-Store für alle externen Datenquellen"""
+import base64
+import contextlib
+import functools
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import requests
+
+from . import CACHE_DIR, PROJECT_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: Dateisperre entfällt, das Kontingent gilt dann nur pro Prozess
+    fcntl = None
+
+# Gemeinsamer HTTP-Client für alle externen Datenquellen
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """Das Anfrage-Kontingent einer API ist aufgebraucht"""
+
+class RateBudget:
+    """Thread-sicherer Token-Bucket für das Anfrage-Kontingent einer API.
+    
+    Mit state_path liegt der Füllstand in einer Datei, die alle Prozesse unter einer
+    Dateisperre (fcntl.flock) lesen und schreiben; das Kontingent gilt dann für alle
+    Server-Prozesse zusammen. Ohne state_path (oder ohne fcntl) gilt es nur pro Prozess.
+    """
+    
+    def __init__(self, capacity, period_seconds, state_path=None):
+        self.capacity = capacity
+        self.refill_rate = capacity / period_seconds  # Tokens pro Sekunde
+        self.tokens = float(capacity)
+        self.updated = time.time()  # Wanduhr statt monotonic, damit der Stand prozessübergreifend gilt
+        self.state_path = state_path
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.time()
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.refill_rate)
+        self.updated = now
+    
+    @contextlib.contextmanager
+    def _locked_state(self):
+        """Sperrt den Bucket (Thread und, falls möglich, Datei), lädt und speichert den Füllstand"""
+        with self.lock:
+            state_file = None
+            if self.state_path is not None and fcntl is not None:
+                try:
+                    os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+                    state_file = open(self.state_path, "a+", encoding="utf-8")
+                except OSError:
+                    state_file = None  # Nicht beschreibbar: Kontingent nur im eigenen Prozess
+            if state_file is None:
+                self._refill()
+                yield
+                return
+            
+            with state_file:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+                state_file.seek(0)
+                try:
+                    state = json.loads(state_file.read())
+                    self.tokens, self.updated = float(state["tokens"]), float(state["updated"])
+                except (ValueError, TypeError, KeyError):
+                    pass  # Neue oder beschädigte Datei: eigenen Stand übernehmen
+                self._refill()
+                yield
+                state_file.seek(0)
+                state_file.truncate()
+                json.dump({"tokens": self.tokens, "updated": self.updated}, state_file)
+                state_file.flush()
+    
+    def try_acquire(self):
+        with self._locked_state():
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+    
+    def drain(self, seconds):
+        """Sperrt das Kontingent für die angegebene Zeit (z.B. nach einem 429 mit Retry-After)"""
+        with self._locked_state():
+            self.tokens = min(self.tokens, -seconds * self.refill_rate)
+    
+    def remaining(self):
+        with self._locked_state():
+            return max(0.0, self.tokens)
+
+class HttpClient:
+    """HTTP-Client mit Verbindungs-Pool, Retries mit Backoff/Jitter, Rate-Budget und Metriken"""
+    
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    
+    def __init__(self, name, rate_budget=None, max_retries=3, backoff_base=0.5, backoff_max=8.0,
+                 timeout=10, pool_size=10):
+        self.name = name
+        self.rate_budget = rate_budget
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        
+        # Keep-Alive über einen gemeinsamen Session-Pool
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.metrics_lock = threading.Lock()
+        self.metrics = {"requests": 0, "retries": 0, "errors": 0, "throttled": 0,
+                        "budget_exhausted": 0, "status": {}}
+        self.latencies = deque(maxlen=500)
+        self.fixture_store = None
+    
+    def _count(self, key, amount=1):
+        with self.metrics_lock:
+            self.metrics[key] += amount
+    
+    def _backoff(self, attempt, retry_after=None):
+        """Exponentielles Backoff mit Full Jitter, Retry-After des Servers hat Vorrang"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+    
+    def get(self, url, headers=None, timeout=None):
+        """GET mit begrenzten Retries. Wirft RateLimitExceeded, wenn das Kontingent leer ist.
+        
+        Im Replay-Modus des Fixture-Stores wird nicht auf das Netzwerk zugegriffen, im
+        Record-Modus wird jede vollständige Antwort zusätzlich aufgezeichnet.
+        """
+        store = self.fixture_store
+        if store is not None and store.mode == "replay":
+            return store.replay(self.name, url)
+        
+        if store is not None and store.mode == "record":
+            # Bedingte Header weglassen, damit immer vollständige Antworten aufgezeichnet werden
+            headers = {k: v for k, v in (headers or {}).items() if k not in CONDITIONAL_HEADERS}
+            response = self._get_live(url, headers, timeout)
+            store.record(self.name, url, response)
+            return response
+        
+        return self._get_live(url, headers, timeout)
+    
+    def _get_live(self, url, headers=None, timeout=None):
+        for attempt in range(self.max_retries + 1):
+            if self.rate_budget is not None and not self.rate_budget.try_acquire():
+                self._count("budget_exhausted")
+                raise RateLimitExceeded(f"Anfrage-Kontingent für {self.name} aufgebraucht")
+            
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._count("errors")
+                if attempt == self.max_retries:
+                    raise
+                self._count("retries")
+                time.sleep(self._backoff(attempt))
+                continue
+            finally:
+                self._count("requests")
+                with self.metrics_lock:
+                    self.latencies.append(time.perf_counter() - start)
+            
+            with self.metrics_lock:
+                self.metrics["status"][response.status_code] = self.metrics["status"].get(response.status_code, 0) + 1
+            
+            if response.status_code not in self.RETRY_STATUS:
+                return response
+            
+            retry_after = None
+            if response.status_code == 429:
+                self._count("throttled")
+                try:
+                    retry_after = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    retry_after = None
+                # Längere Sperren nicht abwarten, sondern das Kontingent entsprechend leeren
+                if retry_after is not None and retry_after > self.backoff_max:
+                    if self.rate_budget is not None:
+                        self.rate_budget.drain(retry_after)
+                    return response
+            
+            if attempt == self.max_retries:
+                return response
+            self._count("retries")
+            time.sleep(self._backoff(attempt, retry_after))
+    
+    def get_metrics(self):
+        """Liefert Zähler sowie Latenz-Perzentile (Sekunden) der letzten Anfragen"""
+        with self.metrics_lock:
+            metrics = dict(self.metrics, status=dict(self.metrics["status"]))
+            latencies = np.array(self.latencies)
+        if latencies.size:
+            metrics["latency_p50"] = float(np.percentile(latencies, 50))
+            metrics["latency_p95"] = float(np.percentile(latencies, 95))
+        if self.rate_budget is not None:
+            metrics["budget_remaining"] = self.rate_budget.remaining()
+        return metrics
+
+# Aufzeichnung/Wiedergabe externer Antworten (Benchmarks, Lasttests, Offline-Betrieb)
+FIXTURE_MODE = os.environ.get("ROCKETS_FIXTURE_MODE", "off")  # off | record | replay
+FIXTURE_DIR = os.environ.get("ROCKETS_FIXTURE_DIR", os.path.join(PROJECT_DIR, "fixtures"))
+FIXTURE_LATENCY_MS = float(os.environ.get("ROCKETS_FIXTURE_LATENCY_MS", "0"))
+FIXTURE_STORE_VERSION = 1
+CONDITIONAL_HEADERS = {"If-None-Match", "If-Modified-Since"}
+
+class FixtureMissing(requests.exceptions.ConnectionError):
+    """Im Replay-Modus existiert keine Aufzeichnung für die angefragte URL"""
+
+class FixtureResponse:
+    """Minimale, zu requests.Response kompatible Antwort aus einer Aufzeichnung"""
+    
+    def __init__(self, status_code, headers, content, url):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+    
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+    
+    def json(self):
+        return json.loads(self.content)
+
+class FixtureStore:
+    """Versionierter Snapshot-Speicher für externe Antworten, ein gzip-JSON pro Quelle und URL"""
+    
+    def __init__(self, directory, mode="off", latency_ms=0.0):
+        self.directory = os.path.join(directory, f"v{FIXTURE_STORE_VERSION}")
+        self.mode = mode
+        self.latency_ms = latency_ms
+    
+    def _path(self, source, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, source, key + ".json.gz")
+    
+    def record(self, source, url, response):
+        """Speichert eine erfolgreiche Antwort (nur 2xx) atomar im Store.
+        
+        Drosselungen (429), Serverfehler und 304 werden nicht aufgezeichnet, sonst würde
+        der Replay-Modus sie dauerhaft ausliefern.
+        """
+        if not 200 <= response.status_code < 300:
+            return
+        path = self._path(source, url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "url": url,
+            "recorded_at": time.time(),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    
+    def replay(self, source, url):
+        """Liefert die aufgezeichnete Antwort, optional mit künstlicher Latenz"""
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        try:
+            with gzip.open(self._path(source, url), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            raise FixtureMissing(f"Keine Aufzeichnung für {url} (Quelle: {source})")
+        return FixtureResponse(entry["status_code"], entry["headers"],
+                               base64.b64decode(entry["content"]), entry["url"])
+
+@functools.lru_cache(maxsize=None)
+def get_fixture_store():
+    """Liefert den prozessweit geteilten Fixture-Store gemäß ROCKETS_FIXTURE_MODE"""
+    return FixtureStore(FIXTURE_DIR, FIXTURE_MODE, FIXTURE_LATENCY_MS)
+
+# Anfrage-Kontingente der Datenquellen (Anfragen, Zeitraum in Sekunden), gemeinsam für alle
+# Prozesse mit demselben Cache-Verzeichnis
+RATE_BUDGET_DIR = os.path.join(CACHE_DIR, "rate_budget")
+HTTP_RATE_LIMITS = {
+    "thespacedevs": (int(os.environ.get("ROCKETS_SPACEDEVS_RATE", "15")), 3600),
+    "celestrak": (int(os.environ.get("ROCKETS_CELESTRAK_RATE", "6")), 3600),
+}
+
+@functools.lru_cache(maxsize=None)
+def get_http_client(name):
+    """Liefert den prozessweit geteilten HTTP-Client für eine Datenquelle"""
+    rate_limit = HTTP_RATE_LIMITS.get(name)
+    rate_budget = RateBudget(*rate_limit, state_path=os.path.join(RATE_BUDGET_DIR, f"{name}.json")) if rate_limit else None
+    client = HttpClient(name, rate_budget=rate_budget)
+    client.fixture_store = get_fixture_store()
+    return client
@@ -0,0 +1,404 @@
+"""Start-Manifest der Launch Library: Festplatten-Cache, inkrementeller Abgleich und kompakte Datensätze"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pytz
+import requests
+
+from . import CACHE_DIR
+from .geometry import distance_from_germany_km, germany_coords, initial_bearing_deg
+from .http_client import get_http_client
+from .sun import TIME_RATING_SCHEMES, get_light_categories, get_time_rating, sun_elevation_deg
+
+# Persistenter Cache für Startdaten (von allen Server-Prozessen gemeinsam genutzt)
+LAUNCH_API_URL = "https://ll.thespacedevs.com/2.2.0/launch/upcoming/"
+LAUNCH_PAGE_SIZE = 100  # Maximum der Launch Library pro Seite
+LAUNCH_ID_BATCH_SIZE = 50  # IDs pro Detail-Anfrage (id__in), hält die URL unter ca. 2 KB
+MAX_UPCOMING_LAUNCHES = int(os.environ.get("ROCKETS_MAX_LAUNCHES", "300"))
+LAUNCH_CACHE_NAME = "launch_manifest"
+LAUNCH_CACHE_TTL = 3600  # Sekunden, danach wird im Hintergrund aktualisiert
+REFRESH_LOCK_TIMEOUT = 120  # Sekunden, danach gilt eine Sperre als verwaist
+REFRESH_RETRY_SECONDS = 300  # Wartezeit nach einem fehlgeschlagenen Abgleich, verdoppelt sich je Fehlschlag
+
+def _cache_path(name, suffix=".json.gz"):
+    return os.path.join(CACHE_DIR, name + suffix)
+
+def read_cache_snapshot(name):
+    """Liest einen komprimierten Cache-Snapshot von der Festplatte (None, falls nicht vorhanden)"""
+    try:
+        with gzip.open(_cache_path(name), "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_cache_snapshot(name, snapshot):
+    """Schreibt einen Snapshot atomar (temporäre Datei + os.replace), sicher für parallele Prozesse"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = _cache_path(f"{name}.{os.getpid()}.{threading.get_ident()}", ".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, _cache_path(name))
+
+def _acquire_refresh_lock(name):
+    """Prozessübergreifende Sperre, damit nur ein Worker gleichzeitig die API abfragt"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    lock_path = _cache_path(name, ".lock")
+    try:
+        if time.time() - os.path.getmtime(lock_path) > REFRESH_LOCK_TIMEOUT:
+            os.remove(lock_path)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        return False
+
+def _release_refresh_lock(name):
+    try:
+        os.remove(_cache_path(name, ".lock"))
+    except OSError:
+        pass
+
+def _get_json_conditional(url, cached_page=None):
+    """GET mit If-None-Match/If-Modified-Since. Liefert (Statuscode, JSON oder None, Header)"""
+    headers = {"Accept": "application/json"}
+    if cached_page:
+        if cached_page.get("etag"):
+            headers["If-None-Match"] = cached_page["etag"]
+        if cached_page.get("last_modified"):
+            headers["If-Modified-Since"] = cached_page["last_modified"]
+    
+    response = get_http_client("thespacedevs").get(url, headers=headers)
+    if response.status_code == 200:
+        return 200, response.json(), response.headers
+    if response.status_code == 304 and cached_page:
+        return 304, None, response.headers
+    raise requests.exceptions.HTTPError(f"Fehler beim Abrufen der Daten: {response.status_code}")
+
+def _sync_launch_index(manifest):
+    """Blättert die schlanke Listenansicht durch und liefert {id: last_updated} aller kommenden Starts.
+    
+    Im Manifest bleiben nur die Seiten dieses Durchlaufs gespeichert, ältere Seiten (z.B.
+    hintere Offsets, deren Starts nicht mehr gelistet sind) werden verworfen.
+    """
+    pages = manifest.get("pages") or {}
+    visited_pages = {}
+    index = {}
+    url = f"{LAUNCH_API_URL}?mode=list&limit={LAUNCH_PAGE_SIZE}&offset=0"
+    
+    while url and len(index) < MAX_UPCOMING_LAUNCHES:
+        cached_page = pages.get(url)
+        status, data, headers = _get_json_conditional(url, cached_page)
+        if status == 304:
+            visited_pages[url] = cached_page
+            entries, next_url = cached_page["entries"], cached_page["next"]
+        else:
+            entries = [[launch["id"], launch.get("last_updated")] for launch in data.get("results", [])]
+            next_url = data.get("next")
+            visited_pages[url] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "entries": entries,
+                "next": next_url,
+            }
+        
+        for launch_id, last_updated in entries:
+            index[launch_id] = last_updated
+        url = next_url
+    
+    manifest["pages"] = visited_pages
+    return dict(list(index.items())[:MAX_UPCOMING_LAUNCHES])
+
+def _fetch_changed_launches(changed_ids):
+    """Lädt Detaildaten gezielt für die geänderten Starts (id__in, in Blöcken von LAUNCH_ID_BATCH_SIZE)"""
+    launches = {}
+    ids = sorted(changed_ids)
+    for start in range(0, len(ids), LAUNCH_ID_BATCH_SIZE):
+        batch = ids[start:start + LAUNCH_ID_BATCH_SIZE]
+        url = f"{LAUNCH_API_URL}?mode=detailed&limit={len(batch)}&offset=0&id__in={','.join(batch)}"
+        while url:
+            _, data, _ = _get_json_conditional(url)
+            for launch in data.get("results", []):
+                if launch["id"] in changed_ids:
+                    launches[launch["id"]] = launch
+            url = data.get("next")
+    
+    return launches
+
+def sync_launch_manifest(manifest=None):
+    """Inkrementeller Abgleich des lokalen Start-Manifests (Schlüssel: Start-ID).
+    
+    Zuerst wird die Listenansicht (bedingt) abgefragt, danach werden nur Starts mit neuem
+    oder geändertem last_updated in der Detailansicht nachgeladen. Nicht mehr kommende
+    Starts werden entfernt.
+    """
+    manifest = manifest or {"launches": {}, "pages": {}}
+    launches = manifest["launches"] = manifest.get("launches") or {}  # Fehler-Snapshot ohne Daten
+    
+    index = _sync_launch_index(manifest)
+    changed_ids = {
+        launch_id for launch_id, last_updated in index.items()
+        if launch_id not in launches or last_updated is None
+        or launches[launch_id].get("last_updated") != last_updated
+    }
+    
+    if changed_ids:
+        launches.update(_fetch_changed_launches(changed_ids))
+    
+    # Abgelaufene bzw. nicht mehr gelistete Starts entfernen
+    for launch_id in list(launches):
+        if launch_id not in index:
+            del launches[launch_id]
+    
+    manifest["fetched_at"] = time.time()
+    manifest["changed"] = len(changed_ids)
+    for key in ("last_error", "last_error_at", "failures", "retry_after"):
+        manifest.pop(key, None)
+    return manifest
+
+def refresh_due(snapshot, now=None):
+    """Ist ein Abgleich fällig? Nein, solange der Snapshot frisch ist oder nach einem Fehler gewartet wird"""
+    now = time.time() if now is None else now
+    if snapshot is None:
+        return True
+    if now < snapshot.get("retry_after", 0):
+        return False
+    return snapshot.get("fetched_at") is None or now - snapshot["fetched_at"] > LAUNCH_CACHE_TTL
+
+def refresh_launch_cache():
+    """Gleicht das Start-Manifest inkrementell ab und speichert es als Snapshot.
+    
+    Bei Fehlern bleibt der letzte gute Snapshot erhalten; Fehler und Zeitpunkt des nächsten
+    Versuchs (retry_after, mit wachsendem Abstand) werden im Snapshot gespeichert, damit
+    nicht jeder Prozess und jeder Lauf sofort erneut die API abfragt. Liefert den aktuellen
+    Snapshot (launches ist None, falls noch nie Daten geladen wurden).
+    """
+    snapshot = read_cache_snapshot(LAUNCH_CACHE_NAME)
+    
+    if not _acquire_refresh_lock(LAUNCH_CACHE_NAME):
+        return snapshot  # Ein anderer Worker aktualisiert bereits
+    
+    try:
+        # Nach dem Sperren erneut lesen: ein anderer Worker kann gerade fertig geworden sein
+        snapshot = read_cache_snapshot(LAUNCH_CACHE_NAME)
+        if not refresh_due(snapshot):
+            return snapshot
+        try:
+            snapshot = sync_launch_manifest(snapshot)
+        except requests.exceptions.RequestException as e:
+            error = str(e) if isinstance(e, requests.exceptions.HTTPError) else f"Verbindungsfehler: {str(e)}"
+            snapshot = read_cache_snapshot(LAUNCH_CACHE_NAME) or {"fetched_at": None, "launches": None}
+            failures = snapshot.get("failures", 0) + 1
+            now = time.time()
+            snapshot.update(last_error=error, last_error_at=now, failures=failures,
+                            retry_after=now + min(LAUNCH_CACHE_TTL, REFRESH_RETRY_SECONDS * 2 ** (failures - 1)))
+            write_cache_snapshot(LAUNCH_CACHE_NAME, snapshot)
+            return snapshot
+        
+        write_cache_snapshot(LAUNCH_CACHE_NAME, snapshot)
+        return snapshot
+    finally:
+        _release_refresh_lock(LAUNCH_CACHE_NAME)
+
+def _refresh_launch_cache_in_background():
+    threading.Thread(target=refresh_launch_cache, name="launch-cache-refresh", daemon=True).start()
+
+# Startdaten aus dem Festplatten-Cache (Rohdaten der Launch Library)
+def get_launch_snapshot():
+    """Liefert den Snapshot sofort und aktualisiert ihn bei Bedarf im Hintergrund (None, falls nie geladen)"""
+    snapshot = read_cache_snapshot(LAUNCH_CACHE_NAME)
+    
+    if not refresh_due(snapshot):
+        return snapshot
+    if snapshot is None or snapshot.get("launches") is None:
+        # Noch keine Daten: einmalig blockierend laden
+        snapshot = refresh_launch_cache()
+    else:
+        # Stale-while-revalidate: alte Daten sofort liefern, im Hintergrund aktualisieren
+        _refresh_launch_cache_in_background()
+    return snapshot
+
+# Kompakter, einmal geparster Startdatensatz (statt wiederholt die Roh-JSON-Dicts zu lesen)
+class LaunchRecord:
+    """Ein kommender Start mit bereits geparster Startzeit und Startplatz-Koordinaten"""
+    
+    __slots__ = ("id", "name", "net_epoch", "pad_lat", "pad_lon", "pad_name", "location_name",
+                 "provider", "mission_name", "orbit_name", "last_updated")
+    
+    def __init__(self, id, name, net_epoch, pad_lat, pad_lon, pad_name, location_name,
+                 provider, mission_name, orbit_name, last_updated):
+        self.id = id
+        self.name = name
+        self.net_epoch = net_epoch
+        self.pad_lat = pad_lat
+        self.pad_lon = pad_lon
+        self.pad_name = pad_name
+        self.location_name = location_name
+        self.provider = provider
+        self.mission_name = mission_name
+        self.orbit_name = orbit_name
+        self.last_updated = last_updated
+    
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+    
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+    
+    @property
+    def net_utc(self):
+        return datetime.fromtimestamp(self.net_epoch, pytz.UTC)
+    
+    @property
+    def coords(self):
+        return (self.pad_lat, self.pad_lon)
+    
+    @classmethod
+    def from_api(cls, launch):
+        """Parst einen Roh-Datensatz der Launch Library (mode=detailed)"""
+        launch_pad = launch['pad']
+        mission = launch.get('mission') or {}
+        return cls(
+            id=launch.get('id'),
+            name=launch['name'],
+            net_epoch=datetime.fromisoformat(launch['net'].replace('Z', '+00:00')).timestamp(),
+            pad_lat=float(launch_pad['latitude']) if launch_pad.get('latitude') else 0.0,
+            pad_lon=float(launch_pad['longitude']) if launch_pad.get('longitude') else 0.0,
+            pad_name=launch_pad.get('name'),
+            location_name=launch_pad['location']['name'],
+            provider=launch['launch_service_provider']['name'],
+            mission_name=mission.get('name'),
+            orbit_name=(mission.get('orbit') or {}).get('name'),
+            last_updated=launch.get('last_updated'),
+        )
+
+class LaunchTable:
+    """Alle kommenden Starts als Liste kompakter Datensätze plus NumPy-Spalten für Batch-Berechnungen"""
+    
+    __slots__ = ("records", "net_epoch", "pad_lat", "pad_lon", "version")
+    
+    def __init__(self, records):
+        self.records = records
+        self.net_epoch = np.array([record.net_epoch for record in records], dtype=float)
+        self.pad_lat = np.array([record.pad_lat for record in records], dtype=float)
+        self.pad_lon = np.array([record.pad_lon for record in records], dtype=float)
+        # Versionsschlüssel für nachgelagerte Caches (ändert sich mit jedem geänderten Start)
+        version_source = "|".join(f"{r.id}:{r.last_updated}:{r.net_epoch}" for r in records)
+        self.version = hashlib.sha1(version_source.encode("utf-8")).hexdigest()[:16]
+    
+    def __getstate__(self):
+        return self.records
+    
+    def __setstate__(self, records):
+        self.__init__(records)
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+    
+    def __getitem__(self, index):
+        return self.records[index]
+
+def launch_table_from_snapshot(snapshot):
+    """Parst alle Starts eines Snapshots, nach Startzeit sortiert (None, falls keine Daten vorliegen)"""
+    if not snapshot or snapshot.get("launches") is None:
+        return None
+    results = sorted(snapshot["launches"].values(), key=lambda launch: launch['net'])
+    return LaunchTable([LaunchRecord.from_api(launch) for launch in results])
+
+def load_launch_snapshot():
+    """Snapshot für Hintergrund-Worker und CLI: lesen und bei Bedarf blockierend aktualisieren"""
+    snapshot = read_cache_snapshot(LAUNCH_CACHE_NAME)
+    if refresh_due(snapshot):
+        snapshot = refresh_launch_cache()
+    return snapshot
+
+def load_launch_table():
+    """Startdaten für Hintergrund-Worker und CLI (None, falls keine Daten vorliegen)"""
+    return launch_table_from_snapshot(load_launch_snapshot())
+
+def find_next_visible_launch(launches, analysis):
+    """Findet den nächsten gut sichtbaren Start anhand der Analyse-Tabelle"""
+    
+    if not len(launches):
+        return None
+    
+    # Nur zukünftige Starts mit Entfernung <= 3500km
+    candidates = np.flatnonzero((analysis['net_epoch'].to_numpy() > time.time())
+                                & analysis['potentially_visible'].to_numpy())
+    
+    if candidates.size:
+        return launches[candidates[0]]
+    
+    # Falls kein gut sichtbarer Start gefunden wird, nimm den ersten
+    return launches[0]
+
+# Entfernungsstufen der Start-Sichtbarkeit (Obergrenze in km, Bewertung, Beschreibung)
+LAUNCH_DISTANCE_RATINGS = [
+    (1000, "🟢 Sehr gut", "Sehr hohe Wahrscheinlichkeit der Sichtbarkeit"),
+    (2000, "🟡 Gut", "Gute Sichtbarkeitschancen bei idealen Bedingungen"),
+    (3500, "🟠 Möglich", "Sichtbarkeit nur bei perfekten Bedingungen möglich"),
+    (np.inf, "🔴 Unwahrscheinlich", "Sichtbarkeit sehr unwahrscheinlich"),
+]
+
+# Bewertung der Sichtbarkeit eines Starts von Deutschland aus
+def evaluate_launch_visibility(launch_site_coords, launch_time_utc):
+    """Schnelle Bewertung, ob ein Start grundsätzlich von Deutschland sichtbar sein könnte"""
+    distance = distance_from_germany_km(launch_site_coords[0], launch_site_coords[1], ellipsoidal=True)
+    
+    # Startorte kategorisieren
+    visibility_rating, description = next(
+        (rating, text) for threshold, rating, text in LAUNCH_DISTANCE_RATINGS if distance <= threshold
+    )
+    
+    # Tageszeit berücksichtigen
+    time_rating = get_time_rating(launch_time_utc, "launch")
+    
+    return visibility_rating, description, time_rating, distance
+
+# Sichtbarkeitsbewertung aller Starts auf einmal (eine Zeile pro Start)
+def build_launch_analysis(launches):
+    """Erstellt die Analyse-Tabelle aller Starts (Entfernung, Peilung, Bewertung, Tageszeit).
+    
+    Liefert dieselben Bewertungen wie evaluate_launch_visibility, aber für die ganze
+    LaunchTable in einem vektorisierten Durchlauf.
+    """
+    import pandas as pd
+    
+    distances = distance_from_germany_km(launches.pad_lat, launches.pad_lon, ellipsoidal=True)
+    bearings = initial_bearing_deg(germany_coords[0], germany_coords[1], launches.pad_lat, launches.pad_lon)
+    
+    # Erste passende Entfernungsstufe je Start
+    thresholds = np.array([threshold for threshold, _, _ in LAUNCH_DISTANCE_RATINGS])
+    rating_index = np.searchsorted(thresholds, distances, side='left')
+    ratings = np.array([rating for _, rating, _ in LAUNCH_DISTANCE_RATINGS])[rating_index]
+    descriptions = np.array([description for _, _, description in LAUNCH_DISTANCE_RATINGS])[rating_index]
+    
+    categories = get_light_categories(sun_elevation_deg(launches.net_epoch))
+    time_ratings = np.array(TIME_RATING_SCHEMES["launch"])[categories]
+    
+    return pd.DataFrame({
+        'id': [launch.id for launch in launches],
+        'name': [launch.name for launch in launches],
+        'provider': [launch.provider for launch in launches],
+        'location': [launch.location_name for launch in launches],
+        'mission': [launch.mission_name for launch in launches],
+        'net_epoch': launches.net_epoch,
+        'time_utc': pd.to_datetime(launches.net_epoch, unit='s', utc=True),
+        'distance_km': distances,
+        'bearing_deg': bearings,
+        'visibility_rating': ratings,
+        'description': descriptions,
+        'time_rating': time_ratings,
+        'potentially_visible': distances <= 3500,
+    })
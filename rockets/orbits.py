@@ -0,0 +1,140 @@
+"""Vereinfachtes Bahnmodell: Standard-Orbits, Bodenspuren sowie Aufstieg und erster Umlauf eines Starts"""
+import math
+
+import numpy as np
+
+# Verbesserte Umlaufzeitberechnung mit Höhenprofil
+def calculate_orbit_period(orbit_height, current_height=None):
+    earth_radius = 6371  # km
+    gravitational_parameter = 3.986004418e14  # m³/s²
+    
+    effective_height = current_height if current_height is not None else orbit_height
+    orbit_radius = (earth_radius + effective_height) * 1000  # m
+    
+    orbit_period_seconds = 2 * math.pi * math.sqrt(orbit_radius**3 / gravitational_parameter)
+    return orbit_period_seconds / 60  # Minuten
+
+# Verbesserte Orbit-Pfad-Berechnung für realistische Umlaufbahnen (Kompatibilitätsfunktion)
+def calculate_orbit_path(launch_site_coords, inclination=51.6, orbit_height=300, num_points=200):
+    """Vereinfachte Orbit-Berechnung ohne Zeitverschiebung für Kompatibilität"""
+    return calculate_orbit_path_with_time(launch_site_coords, inclination, orbit_height, 
+                                        time_offset_minutes=0, num_points=num_points)
+
+# Vektorisierte Bodenspur-Berechnung (viele Umläufe / viele Starts in einem NumPy-Durchlauf)
+def calculate_ground_tracks(launch_lats, launch_lons, inclinations, theta, time_offsets_minutes=0):
+    """Berechnet Bodenspuren (Breite/Länge in Grad) für beliebig viele Bahnpunkte auf einmal.
+
+    Alle Argumente werden per NumPy-Broadcasting kombiniert: z.B. Startorte/Inklinationen
+    der Form (M, 1) mit Bahnwinkeln theta (Radiant) der Form (N,) ergeben Arrays (M, N).
+    time_offsets_minutes (Minuten seit dem Start) ist der Zeitpunkt jedes Bahnpunkts, als
+    Skalar oder Array pro Punkt; um diese Zeit hat sich die Erde unter der im Raum festen
+    Bahn nach Osten gedreht, die Bodenspur wandert also je Umlauf nach Westen. Die Bahnhöhe
+    kürzt sich in diesem Modell heraus und wird nicht benötigt.
+    """
+
+    earth_rotation_rate = 2 * np.pi / (24 * 60)  # Radiant pro Minute (15°/Stunde)
+
+    launch_lon_rad = np.radians(launch_lons)
+    inclination_rad = np.radians(inclinations)
+    theta = np.asarray(theta, dtype=float)
+
+    # Bahn im Inertialsystem: Drehung in der Bahnebene und um die x-Achse (Inklination)
+    angle = theta + launch_lon_rad + np.pi / 2
+    x_final = np.cos(angle)
+    y_rotated = np.sin(angle)
+    y_final = y_rotated * np.cos(inclination_rad)
+    z_final = y_rotated * np.sin(inclination_rad)
+
+    # Der Startort geht nur über die Länge ein, für das Broadcasting aber mitführen
+    launch_lats = np.asarray(launch_lats, dtype=float)
+    x_final, y_final, z_final, _ = np.broadcast_arrays(x_final, y_final, z_final, launch_lats)
+
+    lat = np.degrees(np.arcsin(np.clip(z_final, -1.0, 1.0)))
+    # Erdrotation erst nach der Inklinationsdrehung: Drehung um die Erdachse, nur die Länge ändert sich
+    rotation_offset = earth_rotation_rate * np.asarray(time_offsets_minutes, dtype=float)
+    lon = np.degrees(np.arctan2(y_final, x_final) - rotation_offset)
+
+    # Normalisierung der Longitude
+    lon = (lon + 180) % 360 - 180
+
+    return lat, lon
+
+# Verbesserte Orbit-Pfad-Berechnung mit Erdrotation
+def calculate_orbit_path_with_time(launch_site_coords, inclination=51.6, orbit_height=300,
+                                  launch_time_utc=None, time_offset_minutes=0, num_points=200):
+    """Berechnet Umlaufbahn unter Berücksichtigung der Erdrotation (ab time_offset_minutes nach dem Start)"""
+
+    theta = np.arange(num_points) * (2 * np.pi / num_points)
+    minutes = time_offset_minutes + theta / (2 * np.pi) * calculate_orbit_period(orbit_height)
+    lat, lon = calculate_ground_tracks(launch_site_coords[0], launch_site_coords[1],
+                                       inclination, theta, minutes)
+
+    return list(zip(lat.tolist(), lon.tolist()))
+
+# Aufstiegspfad-Berechnung
+def calculate_ascent_path(launch_site_coords, target_orbit, ascent_duration=10, num_points=20):
+    start_lat, start_lon = launch_site_coords
+    orbit_path = calculate_orbit_path(launch_site_coords, target_orbit["inclination"], target_orbit["height"], 100)
+    target_point = orbit_path[0]
+    
+    ascent_path = []
+    for i in range(num_points):
+        progress = i / (num_points - 1)
+        current_height = target_orbit["height"] * (1 - math.exp(-5 * progress))
+        current_lat = start_lat + progress * (target_point[0] - start_lat)
+        current_lon = start_lon + progress * (target_point[1] - start_lon)
+        ascent_path.append(((current_lat, current_lon), current_height))
+    
+    return ascent_path
+
+def build_launch_trajectory(launch_coords, launch_time_utc, target_orbit, points_per_orbit=120):
+    """Aufstieg (minütlich) und erster Umlauf als Arrays (lat, lon, Höhe, Epoch-Sekunden)"""
+    launch_epoch = launch_time_utc.timestamp()
+    ascent_duration = target_orbit["ascent_duration"]
+    
+    # Vereinfachter Aufstieg wie im Zeitplan der Sichtbarkeitsfenster
+    minutes = np.arange(0, ascent_duration + 1)
+    progress = minutes / ascent_duration
+    inclination_rad = math.radians(target_orbit["inclination"])
+    lat_offset = progress * 2 * math.cos(inclination_rad)
+    lon_offset = progress * 4 * math.sin(inclination_rad) if target_orbit["inclination"] > 0 else progress * 4
+    ascent_heights = target_orbit["height"] * (1 - np.exp(-3 * progress))
+    
+    # Erster Umlauf nach Brennschluss
+    orbit_period = calculate_orbit_period(target_orbit["height"])
+    theta = np.arange(points_per_orbit) * (2 * np.pi / points_per_orbit)
+    orbit_minutes = ascent_duration + theta / (2 * np.pi) * orbit_period
+    orbit_lats, orbit_lons = calculate_ground_tracks(
+        launch_coords[0], launch_coords[1], target_orbit["inclination"], theta, orbit_minutes
+    )
+    
+    return (np.concatenate([launch_coords[0] + lat_offset, orbit_lats]),
+            np.concatenate([launch_coords[1] + lon_offset, orbit_lons]),
+            np.concatenate([ascent_heights, np.full(points_per_orbit, float(target_orbit["height"]))]),
+            launch_epoch + np.concatenate([minutes, orbit_minutes]) * 60)
+
+# Orbit-Typ aus dem Orbit-Namen der Launch Library ableiten
+# Parameter der Standard-Orbits (Höhe in km, Inklination in Grad, Aufstiegsdauer in Minuten)
+LAUNCH_ORBIT_PARAMS = {
+    "LEO": {"height": 400, "inclination": 51.6, "ascent_duration": 8},
+    "MEO": {"height": 20000, "inclination": 55, "ascent_duration": 25},
+    "GEO": {"height": 35786, "inclination": 0, "ascent_duration": 45},
+    "SSO": {"height": 600, "inclination": 97.8, "ascent_duration": 12},
+    "Polar": {"height": 500, "inclination": 90, "ascent_duration": 10}
+}
+
+def determine_orbit_type(orbit_name):
+    """Ordnet einen Orbit-Namen einem der Standard-Orbits zu (Standard: LEO)"""
+    if not orbit_name:
+        return "LEO"
+    
+    mission_orbit = orbit_name.upper()
+    if "GEO" in mission_orbit or "GEOSTATIONARY" in mission_orbit:
+        return "GEO"
+    elif "SSO" in mission_orbit or "SUN-SYNCHRONOUS" in mission_orbit:
+        return "SSO"
+    elif "POLAR" in mission_orbit:
+        return "Polar"
+    elif "MEO" in mission_orbit:
+        return "MEO"
+    return "LEO"
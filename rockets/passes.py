@@ -0,0 +1,107 @@
+"""Intervall-Suche (grober Scan, Bisektion, Goldener Schnitt) und Überflugvorhersage für einzelne Objekte"""
+import math
+
+import numpy as np
+
+# Überflugvorhersage: grober Elevations-Scan, danach Nullstellen- und Maximumsuche
+PASS_SCAN_STEP_SECONDS = 30
+PASS_TIME_TOLERANCE_SECONDS = 0.5
+PASS_MIN_ELEVATION_DEG = 10  # darunter ist ein Überflug praktisch nicht beobachtbar
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+def bisect_crossings(function, lower, upper, tolerance):
+    """Vektorisierte Bisektion: function(lower) und function(upper) haben verschiedene Vorzeichen"""
+    lower_positive = function(lower) > 0
+    while lower.size and np.max(upper - lower) > tolerance:
+        middle = (lower + upper) / 2
+        same_side = (function(middle) > 0) == lower_positive
+        lower = np.where(same_side, middle, lower)
+        upper = np.where(same_side, upper, middle)
+    return (lower + upper) / 2
+
+def golden_section_maximum(function, lower, upper, tolerance):
+    """Vektorisierte Goldener-Schnitt-Suche nach dem Maximum je Intervall"""
+    inner_lower = upper - GOLDEN_RATIO * (upper - lower)
+    inner_upper = lower + GOLDEN_RATIO * (upper - lower)
+    value_lower, value_upper = function(inner_lower), function(inner_upper)
+    while lower.size and np.max(upper - lower) > tolerance:
+        move_up = value_lower < value_upper
+        lower = np.where(move_up, inner_lower, lower)
+        upper = np.where(move_up, upper, inner_upper)
+        
+        # Ein innerer Punkt bleibt erhalten, nur der andere wird neu ausgewertet
+        new_points = np.where(move_up, lower + GOLDEN_RATIO * (upper - lower), upper - GOLDEN_RATIO * (upper - lower))
+        new_values = function(new_points)
+        inner_lower, inner_upper = np.where(move_up, inner_upper, new_points), np.where(move_up, new_points, inner_lower)
+        value_lower, value_upper = np.where(move_up, value_upper, new_values), np.where(move_up, new_values, value_lower)
+    return (lower + upper) / 2
+
+def find_intervals(indicator, start_epoch, end_epoch, step_seconds, tolerance_seconds):
+    """Findet alle Zeitintervalle, in denen indicator(epoch_seconds) > 0 ist.
+    
+    Grober vektorisierter Scan, danach werden alle Ränder gemeinsam per Bisektion verfeinert.
+    Intervalle, die zu Beginn oder am Ende noch laufen, werden an start_epoch bzw. end_epoch
+    abgeschnitten. Liefert (Anfänge, Enden, offen am Anfang, offen am Ende) als Arrays.
+    """
+    scan_times = np.arange(start_epoch, end_epoch + step_seconds, step_seconds, dtype=float)
+    scan_times[-1] = end_epoch
+    inside = indicator(scan_times) > 0
+    
+    # Vorzeichenwechsel zwischen zwei Scan-Zeitpunkten
+    start_index = np.flatnonzero(~inside[:-1] & inside[1:])
+    end_index = np.flatnonzero(inside[:-1] & ~inside[1:])
+    starts = bisect_crossings(indicator, scan_times[start_index], scan_times[start_index + 1], tolerance_seconds)
+    ends = bisect_crossings(indicator, scan_times[end_index], scan_times[end_index + 1], tolerance_seconds)
+    
+    open_start = np.zeros(starts.size, dtype=bool)
+    if inside[0]:
+        starts = np.concatenate([[float(start_epoch)], starts])
+        open_start = np.concatenate([[True], open_start])
+    open_end = np.zeros(ends.size, dtype=bool)
+    if inside[-1]:
+        ends = np.concatenate([ends, [float(end_epoch)]])
+        open_end = np.concatenate([open_end, [True]])
+    return starts, ends, open_start, open_end
+
+def predict_passes(look_angle_function, start_epoch, end_epoch, step_seconds=PASS_SCAN_STEP_SECONDS,
+                   tolerance_seconds=PASS_TIME_TOLERANCE_SECONDS):
+    """Sagt Überflüge (Aufgang, Kulmination, Untergang am mathematischen Horizont) vorher.
+    
+    look_angle_function(epoch_seconds) liefert (Elevation, Azimut, Entfernung) als Arrays.
+    Alle Überflüge werden gemeinsam verfeinert, Aufgang/Untergang per Bisektion und die
+    Kulmination per Goldener-Schnitt-Suche. Ein zu Beginn bereits laufender Überflug
+    beginnt bei start_epoch, ein am Ende noch laufender wird verworfen.
+    """
+    def elevation(epoch_seconds):
+        return look_angle_function(epoch_seconds)[0]
+    
+    rises, sets, open_start, open_end = find_intervals(elevation, start_epoch, end_epoch, step_seconds,
+                                                       tolerance_seconds)
+    in_progress = bool(open_start[:1].any())
+    rises, sets = rises[~open_end], sets[~open_end]
+    if not rises.size:
+        return []
+    
+    culminations = golden_section_maximum(elevation, rises, sets, tolerance_seconds)
+    
+    # Blickwinkel an allen Ereignissen in einem Aufruf
+    events = np.concatenate([rises, culminations, sets])
+    event_elevation, event_azimuth, event_range = look_angle_function(events)
+    count = rises.size
+    
+    passes = []
+    for i in range(count):
+        passes.append({
+            'rise': float(rises[i]),
+            'culmination': float(culminations[i]),
+            'set': float(sets[i]),
+            'duration': float(sets[i] - rises[i]),
+            'max_elevation': float(event_elevation[count + i]),
+            'rise_azimuth': float(event_azimuth[i]),
+            'culmination_azimuth': float(event_azimuth[count + i]),
+            'set_azimuth': float(event_azimuth[2 * count + i]),
+            'min_range': float(event_range[count + i]),
+            'in_progress': in_progress and i == 0,
+        })
+    return passes
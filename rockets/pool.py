@@ -0,0 +1,65 @@
+"""Gemeinsamer Prozess-Pool für rechenintensive Blöcke (Starlink-Überflüge, Fensteranalyse der Starts)"""
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import pickle
+import threading
+
+# Worker nicht per fork starten: der Streamlit-Server und der Hintergrund-Worker sind
+# multithreaded, fork würde gerade gehaltene Sperren (Logging, Verbindungs-Pool, Caches)
+# in die Kind-Prozesse kopieren
+WORKER_START_METHOD = os.environ.get(
+    "ROCKETS_WORKER_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+POOL_WORKERS = int(os.environ.get("ROCKETS_POOL_WORKERS", str(os.cpu_count() or 1)))
+# Der Forkserver lädt die Rechenmodule einmal vor, neue Worker starten dann ohne Importe
+POOL_PRELOAD_MODULES = ["rockets.windows", "rockets.starlink"]
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_process_pool():
+    """Prozessweit geteilter Pool, beim ersten Bedarf erzeugt"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context(WORKER_START_METHOD)
+            if WORKER_START_METHOD == "forkserver":
+                context.set_forkserver_preload(POOL_PRELOAD_MODULES)
+            _pool = concurrent.futures.ProcessPoolExecutor(max_workers=POOL_WORKERS, mp_context=context)
+        return _pool
+
+def _discard_process_pool(pool):
+    """Verwirft einen defekten Pool, der nächste Aufruf erzeugt einen neuen"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def map_chunks(function, chunk_args, workers):
+    """Wendet function(*args) auf alle Blöcke an und liefert die Ergebnisse in Reihenfolge.
+
+    Bei workers > 1 und mehreren Blöcken laufen höchstens workers Blöcke gleichzeitig auf
+    dem gemeinsamen Pool, sonst (oder wenn der Pool ausfällt) im aktuellen Prozess.
+    """
+    if workers > 1 and len(chunk_args) > 1:
+        pool = get_process_pool()
+        try:
+            results = [None] * len(chunk_args)
+            queued = enumerate(chunk_args)
+            pending = {pool.submit(function, *args): index
+                       for index, args in itertools.islice(queued, workers)}
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+                    for index, args in itertools.islice(queued, 1):
+                        pending[pool.submit(function, *args)] = index
+            return results
+        except concurrent.futures.process.BrokenProcessPool:
+            _discard_process_pool(pool)
+        except (pickle.PicklingError, OSError):
+            pass  # Ohne Worker-Prozesse im aktuellen Prozess rechnen
+    return [function(*args) for args in chunk_args]
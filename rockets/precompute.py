@@ -0,0 +1,128 @@
+"""Hintergrund-Worker: führt Aufgaben periodisch aus und legt die Ergebnisse in einem gemeinsamen Speicher ab"""
+import os
+import threading
+import time
+
+# Hintergrund-Worker: Feeds aktualisieren und Ergebnisse vorberechnen, Sitzungen lesen nur noch
+PRECOMPUTE_ENABLED = os.environ.get("ROCKETS_PRECOMPUTE", "1") != "0"
+PRECOMPUTE_TICK_SECONDS = 5
+
+PRECOMPUTE_MAX_AGE_FACTOR = 3  # Ergebnisse älter als 3 Intervalle gelten als verwaist (Worker hängt)
+PRECOMPUTE_THREAD_NAME = "rockets-precompute"
+
+class PrecomputeStore:
+    """Thread-sicherer Ergebnisspeicher des Hintergrund-Workers: pro Name das letzte Ergebnis mit Schlüssel und Zeitpunkt"""
+    
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+    
+    def get(self, name, key=None, max_age=None):
+        """Liefert das Ergebnis, falls der Schlüssel passt (None: beliebig) und es nicht zu alt ist, sonst None"""
+        with self.lock:
+            entry = self.entries.get(name)
+        if entry is None or (key is not None and entry[0] != key):
+            return None
+        if max_age is not None and time.time() - entry[2] > max_age:
+            return None
+        return entry[1]
+    
+    def put(self, name, value, key=None):
+        with self.lock:
+            self.entries[name] = (key, value, time.time())
+
+class PrecomputeScheduler:
+    """Daemon-Thread, der Aufgaben (Name, Intervall, Funktion) fällig ausführt und in einen PrecomputeStore schreibt"""
+    
+    def __init__(self, tasks, tick=PRECOMPUTE_TICK_SECONDS, store=None):
+        self.store = store or PrecomputeStore()
+        self.tasks = tasks
+        self.intervals = {name: interval for name, interval, _ in tasks}
+        self.tick = tick
+        self.status = {name: {"runs": 0, "last_run": None, "duration": None, "error": None} for name, _, _ in tasks}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name=PRECOMPUTE_THREAD_NAME, daemon=True)
+        self.thread.start()
+    
+    def stop(self, timeout=None):
+        """Beendet den Worker nach der laufenden Aufgabe (wartet höchstens timeout Sekunden)"""
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+    
+    def run_due(self):
+        """Führt alle fälligen Aufgaben der Reihe nach aus (Reihenfolge = Abhängigkeiten)"""
+        now = time.time()
+        for name, interval, task in self.tasks:
+            if self.stop_event.is_set():
+                return
+            with self.lock:
+                last_run = self.status[name]["last_run"]
+            if last_run is not None and now - last_run < interval:
+                continue
+            started = time.time()
+            try:
+                task(self.store)
+                error = None
+            except Exception as e:  # Eine fehlerhafte Aufgabe darf den Worker nicht beenden
+                error = f"{type(e).__name__}: {e}"
+            with self.lock:
+                self.status[name].update(runs=self.status[name]["runs"] + 1, last_run=started,
+                                         duration=time.time() - started, error=error)
+    
+    def _run(self):
+        while not self.stop_event.is_set():
+            self.run_due()
+            self.stop_event.wait(self.tick)
+    
+    def read(self, name, key=None):
+        """Liest ein Ergebnis für eine Sitzung, höchstens PRECOMPUTE_MAX_AGE_FACTOR Intervalle alt"""
+        value = self.store.get(name, key, self.intervals.get(name, 0) * PRECOMPUTE_MAX_AGE_FACTOR or None)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+    
+    def get_status(self):
+        with self.lock:
+            return {name: dict(status) for name, status in self.status.items()}
+    
+    def get_stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "errors": sum(status["error"] is not None for status in self.status.values())}
+
+# Höchstens ein Worker pro Prozess, auch wenn der Aufrufer (z.B. st.cache_resource) neu startet
+_active_scheduler = None
+_active_scheduler_lock = threading.Lock()
+
+def start_precompute_scheduler(tasks, tick=PRECOMPUTE_TICK_SECONDS):
+    """Startet den Hintergrund-Worker des Prozesses.
+    
+    Ein bereits laufender Worker wird beendet, sein Ergebnisspeicher geht an den neuen über,
+    damit Sitzungen nach einem Neustart nicht alles direkt berechnen müssen.
+    """
+    global _active_scheduler
+    with _active_scheduler_lock:
+        previous = _active_scheduler
+        if previous is not None:
+            previous.stop(timeout=tick)
+        _active_scheduler = PrecomputeScheduler(tasks, tick, store=previous.store if previous else None)
+        _active_scheduler.start()
+        return _active_scheduler
+
+def stop_precompute_scheduler(timeout=None):
+    """Beendet den laufenden Hintergrund-Worker, falls vorhanden"""
+    global _active_scheduler
+    with _active_scheduler_lock:
+        if _active_scheduler is not None:
+            _active_scheduler.stop(timeout)
+            _active_scheduler = None
@@ -0,0 +1,108 @@
+"""Sichtbarkeits-Heatmap: Flugbahnen als eingefärbtes Web-Mercator-Raster statt Einzelmarkern"""
+import math
+from datetime import datetime
+
+import numpy as np
+import pytz
+
+from .geometry import EARTH_MEAN_RADIUS_KM, look_angles_from_germany
+from .orbits import build_launch_trajectory
+from .visibility import is_point_visible_from_germany_batch
+from .windows import LAUNCH_WINDOW_MIN_ELEVATION_DEG, LAUNCH_WINDOW_MIN_VISIBILITY
+
+# Heatmap-Darstellung: Sichtbarkeit entlang der Flugbahn als PNG-Overlay statt Einzelmarkern
+RASTER_PIXEL_DEG = 0.25
+RASTER_SPLAT_KM = 60  # Radius, mit dem jeder Bahnpunkt ins Raster eingetragen wird
+RASTER_DENSIFY = 16  # Zwischenpunkte je Bahnsegment, damit die Spur lückenlos ist
+# Farbverlauf der Sichtbarkeit (Wert in %, R, G, B), unterhalb der ersten Stufe transparent
+VISIBILITY_COLOR_STOPS = np.array([
+    [20, 220, 50, 30],
+    [40, 255, 140, 0],
+    [60, 255, 230, 0],
+    [80, 120, 220, 60],
+    [100, 0, 170, 80],
+], dtype=float)
+
+def densify_path(lats, lons, heights, epochs, substeps=RASTER_DENSIFY):
+    """Fügt zwischen aufeinanderfolgenden Bahnpunkten Zwischenpunkte ein (über die Datumsgrenze hinweg)"""
+    base = np.arange(len(lats))
+    fine = np.linspace(0, len(lats) - 1, (len(lats) - 1) * substeps + 1)
+    lons_unwrapped = np.degrees(np.unwrap(np.radians(lons)))
+    return (np.interp(fine, base, lats),
+            (np.interp(fine, base, lons_unwrapped) + 180) % 360 - 180,
+            np.interp(fine, base, heights),
+            np.interp(fine, base, epochs))
+
+def visibility_colors(scores):
+    """RGBA-Farben (uint8) für Sichtbarkeitswerte in %"""
+    stops = VISIBILITY_COLOR_STOPS
+    rgba = np.zeros(scores.shape + (4,), dtype=np.uint8)
+    for channel in range(3):
+        rgba[..., channel] = np.interp(scores, stops[:, 0], stops[:, channel + 1])
+    rgba[..., 3] = np.where(scores >= stops[0, 0], 200, 0)
+    return rgba
+
+def render_visibility_raster(lats, lons, scores, pixel_deg=RASTER_PIXEL_DEG, splat_km=RASTER_SPLAT_KM):
+    """Rastert bewertete Bahnpunkte zu einem RGBA-Bild mit Zeilen in Web-Mercator.
+    
+    Jeder Punkt wird mit seinem Wert als Scheibe eingetragen, je Pixel zählt der höchste
+    Wert. Liefert (rgba, [[Süd, West], [Nord, Ost]]) oder None ohne sichtbare Punkte.
+    """
+    visible = scores >= VISIBILITY_COLOR_STOPS[0, 0]
+    if not visible.any():
+        return None
+    lats, lons, scores = lats[visible], lons[visible], scores[visible]
+    
+    # Ausschnitt um alle sichtbaren Punkte (in Deutschlands Umgebung, also ohne Datumsgrenze)
+    pad = math.degrees(splat_km / EARTH_MEAN_RADIUS_KM) + pixel_deg
+    north = min(lats.max() + pad, 85.0)
+    south = max(lats.min() - pad, -85.0)
+    lon_pad = pad / math.cos(math.radians(max(abs(north), abs(south))))
+    west = lons.min() - lon_pad
+    
+    # Quadratische Pixel in Web-Mercator, damit Leaflet das Bild unverzerrt darstellt
+    pixel_rad = math.radians(pixel_deg)
+    def mercator(lat):
+        return np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+    top = mercator(north)
+    height = max(int(math.ceil((top - mercator(south)) / pixel_rad)), 1)
+    width = max(int(math.ceil((lons.max() + lon_pad - west) / pixel_deg)), 1)
+    south = math.degrees(2 * math.atan(math.exp(top - height * pixel_rad)) - math.pi / 2)
+    east = west + width * pixel_deg
+    
+    rows = np.clip(((top - mercator(lats)) / pixel_rad).astype(int), 0, height - 1)
+    cols = np.clip(((lons - west) / pixel_deg).astype(int), 0, width - 1)
+    raster = np.zeros((height, width))
+    np.maximum.at(raster, (rows, cols), scores)
+    
+    # Punkte zu Scheiben verbreitern (Maximum über verschobene Kopien)
+    radius = max(int(round(splat_km / (pixel_deg * 111.2 * math.cos(math.radians((north + south) / 2))))), 0)
+    spread = raster.copy()
+    padded = np.pad(raster, radius)
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if 0 < dx * dx + dy * dy <= radius * radius:
+                np.maximum(spread, padded[radius + dy:radius + dy + height, radius + dx:radius + dx + width], out=spread)
+    
+    return visibility_colors(spread), [[float(south), float(west)], [float(north), float(east)]]
+
+def compute_trajectory_visibility_raster(launch_coords, launch_epoch, target_orbit):
+    """Sichtbarkeits-Raster (RGBA, Bildgrenzen) für Aufstieg und ersten Umlauf oder None ohne sichtbare Punkte"""
+    launch_time_utc = datetime.fromtimestamp(launch_epoch, pytz.UTC)
+    lats, lons, heights, epochs = build_launch_trajectory(launch_coords, launch_time_utc, target_orbit)
+    
+    # Aufstieg und Umlauf getrennt verdichten, der Übergang ist kein durchgehender Bahnabschnitt
+    ascent_points = target_orbit["ascent_duration"] + 1
+    ascent = densify_path(lats[:ascent_points], lons[:ascent_points], heights[:ascent_points], epochs[:ascent_points])
+    orbit = densify_path(lats[ascent_points:], lons[ascent_points:], heights[ascent_points:], epochs[ascent_points:])
+    lats, lons, heights, epochs = (np.concatenate(parts) for parts in zip(ascent, orbit))
+    in_ascent = np.arange(len(lats)) < len(ascent[0])
+    
+    scores, _, _ = is_point_visible_from_germany_batch(np.column_stack([lats, lons]), heights, epochs)
+    
+    # Gleiche Schwellen wie die Sichtbarkeitsfenster (windows), im Aufstieg zusätzlich erst über 100 km Höhe
+    elevations, _, _ = look_angles_from_germany(lats, lons, heights)
+    shown = ((scores >= LAUNCH_WINDOW_MIN_VISIBILITY) & (elevations >= LAUNCH_WINDOW_MIN_ELEVATION_DEG)
+             & (~in_ascent | (heights > 100)))
+    
+    return render_visibility_raster(lats, lons, np.where(shown, scores, 0.0))
@@ -0,0 +1,255 @@
+"""Wiedereintritte: simulierte Vorhersagen, Sichtbarkeitsbewertung und Beobachtungsfenster"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytz
+
+from .geometry import distance_from_germany_km, look_angles_from_germany, to_epoch_seconds
+from .sun import get_time_factors, get_time_rating
+
+# Funktion zum Simulieren von Wiedereintritts-Daten (da echte APIs oft eingeschränkt sind)
+def simulate_reentry_data():
+    """Simuliert Wiedereintritts-Daten basierend auf realistischen Szenarien"""
+    
+    current_time = datetime.now(pytz.UTC)
+    reentries = []
+    
+    # Bekannte/wahrscheinliche Wiedereintritte der nächsten Wochen
+    simulated_reentries = [
+        {
+            "name": "SpaceX Falcon 9 Upper Stage",
+            "object_type": "Rocket Body",
+            "origin": "Starlink Mission",
+            "mass_kg": 4000,
+            "size": "12m x 3.7m",
+            "reentry_time": current_time + timedelta(days=2, hours=14, minutes=23),
+            "uncertainty_hours": 6,
+            "predicted_location": {"lat": 52.0, "lon": 12.0},
+            "trajectory_start": {"lat": 58.0, "lon": -5.0},
+            "trajectory_end": {"lat": 45.0, "lon": 25.0},
+            "visibility_duration_minutes": 4,
+            "risk_level": "Low",
+            "debris_survival": "Minimal"
+        },
+        {
+            "name": "Chinese Long March 5B Core Stage",
+            "object_type": "Rocket Body", 
+            "origin": "Tiangong Station Mission",
+            "mass_kg": 21000,
+            "size": "33m x 5m",
+            "reentry_time": current_time + timedelta(days=5, hours=8, minutes=45),
+            "uncertainty_hours": 12,
+            "predicted_location": {"lat": 47.0, "lon": 8.0},
+            "trajectory_start": {"lat": 55.0, "lon": -10.0},
+            "trajectory_end": {"lat": 38.0, "lon": 30.0},
+            "visibility_duration_minutes": 6,
+            "risk_level": "Medium",
+            "debris_survival": "Possible small fragments"
+        },
+        {
+            "name": "Progress Cargo Spacecraft",
+            "object_type": "Spacecraft",
+            "origin": "ISS Resupply Mission",
+            "mass_kg": 7000,
+            "size": "7m x 2.7m",
+            "reentry_time": current_time + timedelta(days=8, hours=21, minutes=12),
+            "uncertainty_hours": 3,
+            "predicted_location": {"lat": 49.0, "lon": 15.0},
+            "trajectory_start": {"lat": 60.0, "lon": -2.0},
+            "trajectory_end": {"lat": 35.0, "lon": 35.0},
+            "visibility_duration_minutes": 3,
+            "risk_level": "Low",
+            "debris_survival": "Complete burnup expected"
+        },
+        {
+            "name": "Starlink Satellite (Deorbited)",
+            "object_type": "Satellite",
+            "origin": "Starlink Constellation",
+            "mass_kg": 260,
+            "size": "2.8m x 1.65m",
+            "reentry_time": current_time + timedelta(days=12, hours=3, minutes=56),
+            "uncertainty_hours": 2,
+            "predicted_location": {"lat": 53.0, "lon": 9.0},
+            "trajectory_start": {"lat": 62.0, "lon": -8.0},
+            "trajectory_end": {"lat": 42.0, "lon": 28.0},
+            "visibility_duration_minutes": 2,
+            "risk_level": "Very Low",
+            "debris_survival": "Complete burnup"
+        },
+        {
+            "name": "ESA Upper Stage (AVUM)",
+            "object_type": "Rocket Body",
+            "origin": "Vega-C Mission",
+            "mass_kg": 1200,
+            "size": "2.6m x 1.9m", 
+            "reentry_time": current_time + timedelta(days=15, hours=16, minutes=34),
+            "uncertainty_hours": 4,
+            "predicted_location": {"lat": 50.0, "lon": 6.0},
+            "trajectory_start": {"lat": 57.0, "lon": -12.0},
+            "trajectory_end": {"lat": 41.0, "lon": 22.0},
+            "visibility_duration_minutes": 3,
+            "risk_level": "Low",
+            "debris_survival": "Minimal fragments possible"
+        }
+    ]
+    
+    return {"results": simulated_reentries}
+
+def evaluate_reentry_visibility(trajectory_start, trajectory_end, predicted_location, reentry_time_utc):
+    """Bewertet die Sichtbarkeit eines Wiedereintritts von Deutschland aus"""
+    # Berechne Entfernung der Trajektorie zu Deutschland
+    start_distance, end_distance, pred_distance = distance_from_germany_km(
+        *np.array([trajectory_start, trajectory_end, predicted_location], dtype=float).T, ellipsoidal=True).tolist()
+    
+    # Minimale Entfernung zur Trajektorie
+    min_distance = min(start_distance, end_distance, pred_distance)
+    
+    # Tageszeit berücksichtigen (SEHR WICHTIG für Wiedereintritte!)
+    # Nach Sonnenhöhe: Nacht 1.0, nautische Dämmerung 0.8, bürgerliche Dämmerung 0.3, Tag 0.0 (praktisch nicht sichtbar)
+    _, time_factors = get_time_factors(reentry_time_utc.timestamp(), "reentry")
+    time_factor = float(time_factors)
+    time_rating = get_time_rating(reentry_time_utc, "reentry")
+    
+    # Basis-Sichtbarkeitsbewertung basierend auf Entfernung
+    if min_distance <= 300:
+        base_rating = "Exzellent"
+        base_description = "Direkt über Deutschland - spektakuläre Sichtung"
+    elif min_distance <= 800:
+        base_rating = "Sehr gut"
+        base_description = "Sehr hohe Wahrscheinlichkeit einer beeindruckenden Sichtung"
+    elif min_distance <= 1500:
+        base_rating = "Gut"
+        base_description = "Gute Sichtbarkeitschancen bei klarem Himmel"
+    elif min_distance <= 2500:
+        base_rating = "Möglich"
+        base_description = "Sichtbarkeit nur bei optimalen Bedingungen"
+    else:
+        base_rating = "Unwahrscheinlich"
+        base_description = "Zu weit entfernt für gute Sichtbarkeit"
+    
+    # Finale Sichtbarkeitsbewertung mit Tageszeit-Korrektur
+    if time_factor == 0.0:
+        # Am Tag: Immer nicht sichtbar, egal wie nah
+        visibility_rating = "🔴 Nicht sichtbar"
+        description = f"Am Tag nicht sichtbar (Entfernung: {min_distance:.0f}km)"
+    elif time_factor >= 0.8:
+        # Nacht/frühe Dämmerung: Volle Bewertung
+        if base_rating == "Exzellent":
+            visibility_rating = "🟢 Exzellent"
+        elif base_rating == "Sehr gut":
+            visibility_rating = "🟢 Sehr gut"
+        elif base_rating == "Gut":
+            visibility_rating = "🟡 Gut"
+        elif base_rating == "Möglich":
+            visibility_rating = "🟠 Möglich"
+        else:
+            visibility_rating = "🔴 Unwahrscheinlich"
+        description = f"{base_description} bei {time_rating.lower()}"
+    else:
+        # Späte Dämmerung: Reduzierte Bewertung
+        if base_rating in ["Exzellent", "Sehr gut"]:
+            visibility_rating = "🟡 Mäßig"
+            description = f"Bei Dämmerung mäßig sichtbar (Entfernung: {min_distance:.0f}km)"
+        elif base_rating == "Gut":
+            visibility_rating = "🟠 Schwach"
+            description = f"Bei Dämmerung schwach sichtbar (Entfernung: {min_distance:.0f}km)"
+        else:
+            visibility_rating = "🔴 Unwahrscheinlich"
+            description = f"Auch bei Dämmerung kaum sichtbar (Entfernung: {min_distance:.0f}km)"
+    
+    return {
+        'visibility_rating': visibility_rating,
+        'description': description,
+        'time_rating': time_rating,
+        'distance': min_distance,
+        'time_factor': time_factor
+    }
+
+def calculate_reentry_observation_windows(reentry_data):
+    """Berechnet optimale Beobachtungsfenster für einen Wiedereintritt"""
+    
+    windows = []
+    de_timezone = pytz.timezone('Europe/Berlin')
+    
+    # Wiedereintritts-Trajectory in Segmente unterteilen
+    trajectory_points = []
+    for i in range(11):  # 11 Punkte für 10 Segmente
+        progress = i / 10
+        lat = reentry_data['trajectory_start']['lat'] + progress * (reentry_data['trajectory_end']['lat'] - reentry_data['trajectory_start']['lat'])
+        lon = reentry_data['trajectory_start']['lon'] + progress * (reentry_data['trajectory_end']['lon'] - reentry_data['trajectory_start']['lon'])
+        
+        # Höhe während Wiedereintritt (120km bis 0km)
+        altitude = 120 * (1 - progress)
+        
+        trajectory_points.append((lat, lon, altitude))
+    
+    # Zeitpunkte für jeden Punkt der Trajektorie
+    total_duration = reentry_data['visibility_duration_minutes']
+    
+    point_times = [
+        reentry_data['reentry_time'] + timedelta(minutes=(i / len(trajectory_points)) * total_duration - total_duration/2)
+        for i in range(len(trajectory_points))
+    ]
+    
+    # Entfernungen und Tageszeit-Faktoren aller Trajektorienpunkte in einem Aufruf
+    point_array = np.array(trajectory_points)
+    distances = distance_from_germany_km(point_array[:, 0], point_array[:, 1]).tolist()
+    elevations = look_angles_from_germany(point_array[:, 0], point_array[:, 1], point_array[:, 2])[0].tolist()
+    _, time_factors = get_time_factors(to_epoch_seconds(point_times), "reentry_window")
+    
+    for i, (lat, lon, altitude) in enumerate(trajectory_points):
+        # Zeit für diesen Punkt
+        point_time = point_times[i]
+        
+        # Sichtbarkeit für diesen Punkt berechnen
+        distance = distances[i]
+        
+        # Elevation über dem Horizont
+        elevation_angle = elevations[i] if altitude > 0 else 0
+        
+        # Wiedereintritt-spezifische Sichtbarkeit (heller als normale Satelliten)
+        base_visibility = 0
+        
+        if distance <= 300:
+            base_visibility = 90
+        elif distance <= 800:
+            base_visibility = 75
+        elif distance <= 1500:
+            base_visibility = 60
+        elif distance <= 2500:
+            base_visibility = 40
+        else:
+            base_visibility = 15
+        
+        # Höhen-Bonus (höhere Objekte besser sichtbar)
+        altitude_bonus = min(20, altitude / 6)  # Bis zu 20% Bonus
+        
+        # Tageszeit-Faktor (Nacht/Dämmerung 1.0, Morgen/Abend 0.8, Tag 0.3)
+        time_factor = float(time_factors[i])
+        
+        # Gesamtsichtbarkeit
+        visibility = min(100, (base_visibility + altitude_bonus) * time_factor)
+        
+        # Nur signifikante Sichtbarkeiten speichern
+        if visibility > 20 and elevation_angle > 5:
+            phase = "Wiedereintritt"
+            if i < 3:
+                phase = "Wiedereintritt-Beginn"
+            elif i > 7:
+                phase = "Verglüh-Phase"
+            
+            windows.append({
+                'phase': phase,
+                'time_utc': point_time.strftime('%H:%M:%S'),
+                'time_de': point_time.astimezone(de_timezone).strftime('%H:%M:%S'),
+                'coords': (lat, lon),
+                'altitude': altitude,
+                'visibility': visibility,
+                'distance': distance,
+                'elevation': elevation_angle
+            })
+    
+    # Nach Sichtbarkeit sortieren
+    windows = sorted(windows, key=lambda x: x['visibility'], reverse=True)
+    
+    return windows[:5]  # Top 5 Beobachtungsfenster
@@ -0,0 +1,329 @@
+"""TLE-Katalog mit SGP4-Propagation, ISS-Bahn, aktuelle ISS-Sichtbarkeit und ISS-Überflüge"""
+import functools
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from urllib.parse import quote
+
+import numpy as np
+import pytz
+import requests
+
+from . import PROJECT_DIR
+from .geometry import (azimuth_to_direction, ecef_to_geodetic, geodetic_to_ecef, germany_coords,
+                       great_circle_distance_km, julian_dates, look_angles, look_angles_from_germany, teme_to_ecef)
+from .http_client import get_http_client
+from .passes import PASS_MIN_ELEVATION_DEG, predict_passes
+from .visibility import is_point_visible_from_germany, is_point_visible_from_germany_batch
+
+# SGP4 für echte Bahnberechnung aus TLE-Daten (ohne sgp4 wird die ISS-Näherung verwendet)
+try:
+    from sgp4.api import Satrec, SatrecArray
+    SGP4_AVAILABLE = True
+except ImportError:
+    SGP4_AVAILABLE = False
+
+# Bahnberechnung mit SGP4 aus einem lokalen TLE-Katalog
+TLE_DIR = os.environ.get("ROCKETS_TLE_DIR", os.path.join(PROJECT_DIR, "data", "tle"))
+TLE_PATH = os.environ.get("ROCKETS_TLE_PATH", os.path.join(TLE_DIR, "stations.tle"))
+CELESTRAK_GP_URL = "https://celestrak.org/NORAD/elements/gp.php?GROUP={group}&FORMAT=tle"
+ISS_NORAD_ID = 25544
+ISS_MEAN_ALTITUDE_KM = 408.0
+ISS_MEAN_VELOCITY_KMH = 27600.0
+TLE_MAX_AGE_DAYS = 30  # ältere Bahndaten sind für LEO-Objekte zu ungenau
+
+def parse_tle_text(text):
+    """Zerlegt TLE-Text (2- oder 3-Zeilen-Format) in Einträge (Name, Zeile 1, Zeile 2)"""
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    entries = []
+    i = 0
+    while i < len(lines) - 1:
+        if lines[i].startswith("1 ") and lines[i + 1].startswith("2 "):
+            name, line1, line2 = lines[i][2:7].strip(), lines[i], lines[i + 1]
+            i += 2
+        elif i + 2 < len(lines) and lines[i + 1].startswith("1 ") and lines[i + 2].startswith("2 "):
+            name, line1, line2 = lines[i].lstrip("0 ").strip(), lines[i + 1], lines[i + 2]
+            i += 3
+        else:
+            i += 1
+            continue
+        entries.append((name, line1, line2))
+    return entries
+
+class SatelliteCatalog:
+    """TLE-Katalog mit vektorisierter SGP4-Propagation über Satelliten × Zeitpunkte"""
+    
+    def __init__(self, entries):
+        self.names = []
+        self.satrecs = []
+        self.lines = []
+        for name, line1, line2 in entries:
+            try:
+                satrec = Satrec.twoline2rv(line1, line2)
+            except ValueError:
+                continue  # Fehlerhafte TLE überspringen
+            self.names.append(name)
+            self.satrecs.append(satrec)
+            self.lines.append((line1, line2))
+        
+        self.norad_ids = np.array([satrec.satnum for satrec in self.satrecs], dtype=np.int64)
+        self.index = {norad_id: i for i, norad_id in enumerate(self.norad_ids.tolist())}
+        self.epochs = np.array([(satrec.jdsatepoch - 2440587.5 + satrec.jdsatepochF) * 86400.0
+                                for satrec in self.satrecs])
+        self.satrec_array = SatrecArray(self.satrecs) if self.satrecs else None
+        self.version = hashlib.sha1(json.dumps(self.lines).encode("utf-8")).hexdigest()[:16]
+    
+    def __len__(self):
+        return len(self.satrecs)
+    
+    def propagate_teme(self, epoch_seconds, indices=None):
+        """SGP4 für alle (oder ausgewählte) Satelliten zu allen Zeitpunkten.
+        
+        Liefert Positionen und Geschwindigkeiten (n_sat, n_t, 3) in km bzw. km/s im
+        TEME-System sowie eine Maske der fehlerfrei berechneten Werte.
+        """
+        jd, fr = julian_dates(epoch_seconds)
+        satrec_array = self.satrec_array if indices is None else SatrecArray([self.satrecs[i] for i in indices])
+        errors, positions, velocities = satrec_array.sgp4(jd, fr)
+        return positions, velocities, errors == 0
+    
+    def propagate_geodetic(self, epoch_seconds, indices=None):
+        """Wie propagate_teme, aber als Breite, Länge, Höhe und Geschwindigkeit (km/h)"""
+        epoch_seconds = np.atleast_1d(np.asarray(epoch_seconds, dtype=float))
+        positions, velocities, ok = self.propagate_teme(epoch_seconds, indices)
+        lat, lon, alt = ecef_to_geodetic(teme_to_ecef(positions, epoch_seconds))
+        speed_kmh = np.linalg.norm(velocities, axis=-1) * 3600.0
+        return lat, lon, alt, speed_kmh, ok
+
+@functools.lru_cache(maxsize=4)
+def _load_satellite_catalog(path, modified):
+    """Liest und parst eine TLE-Datei einmal pro Dateiversion (Pfad, Änderungszeit)"""
+    with open(path, encoding="utf-8") as tle_file:
+        entries = parse_tle_text(tle_file.read())
+    return SatelliteCatalog(entries) if entries else None
+
+def get_satellite_catalog(path=TLE_PATH):
+    """Liefert den SGP4-Katalog einer lokalen TLE-Datei oder None (keine Datei/kein sgp4)"""
+    if not SGP4_AVAILABLE:
+        return None
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _load_satellite_catalog(path, modified)
+
+def download_tle_catalog(group="stations", path=TLE_PATH):
+    """Lädt eine TLE-Gruppe von CelesTrak und ersetzt die lokale Datei atomar"""
+    response = get_http_client("celestrak").get(CELESTRAK_GP_URL.format(group=quote(group)))
+    if response.status_code != 200:
+        raise requests.exceptions.HTTPError(f"Fehler beim Abrufen der TLE-Daten: {response.status_code}")
+    
+    entries = parse_tle_text(response.text)
+    if not entries:
+        raise ValueError(f"Keine TLE-Daten in der Antwort für {group}")
+    
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as tle_file:
+        for name, line1, line2 in entries:
+            tle_file.write(f"{name}\n{line1}\n{line2}\n")
+    os.replace(tmp_path, path)
+    return len(entries)
+
+def approximate_iss_positions(epoch_seconds):
+    """Näherung der ISS-Bahn ohne TLE-Daten (Sinus-Bahn mit fester Umlaufzeit)"""
+    iss_inclination = 51.6  # Grad
+    iss_period = 92.68  # Minuten
+    
+    # Referenzzeitpunkt (approximiert)
+    epoch = datetime(2025, 1, 1, tzinfo=pytz.UTC).timestamp()
+    minutes_since_epoch = (np.asarray(epoch_seconds, dtype=float) - epoch) / 60
+    
+    # Grad im aktuellen Orbit
+    current_orbit_progress = ((minutes_since_epoch / iss_period) % 1) * 360
+    lat = np.sin(np.radians(current_orbit_progress)) * iss_inclination
+    
+    # Longitude mit Erdrotation
+    earth_rotation_since_epoch = minutes_since_epoch * (360 / (24 * 60))
+    lon = (current_orbit_progress - earth_rotation_since_epoch) % 360
+    lon = np.where(lon > 180, lon - 360, lon)
+    return lat, lon
+
+def select_iss_model(start_epoch, end_epoch):
+    """Wählt das ISS-Bahnmodell einmal für einen ganzen Zeitraum.
+    
+    Liefert (Quelle, Ende): SGP4, falls die TLE zu Beginn gültig ist, dann endet der Zeitraum
+    spätestens mit der TLE-Gültigkeit; sonst die Näherung für den ganzen Zeitraum. So rechnen
+    grober Scan und Verfeinerung einer Überflugvorhersage immer mit derselben Bahn.
+    """
+    catalog = get_satellite_catalog()
+    if catalog is not None and ISS_NORAD_ID in catalog.index:
+        tle_epoch = catalog.epochs[catalog.index[ISS_NORAD_ID]]
+        if abs(start_epoch - tle_epoch) <= TLE_MAX_AGE_DAYS * 86400:
+            return "SGP4", min(end_epoch, tle_epoch + TLE_MAX_AGE_DAYS * 86400)
+    return "Näherung", end_epoch
+
+def get_iss_track(epoch_seconds, model=None):
+    """ISS-Bahn zu beliebig vielen Zeitpunkten.
+    
+    Liefert Breite, Länge, Höhe (km), Geschwindigkeit (km/h) und die Quelle der Daten:
+    SGP4 aus dem lokalen TLE-Katalog, sonst die Näherung. Mit model (aus select_iss_model)
+    wird das Modell nicht je Aufruf neu gewählt.
+    """
+    epoch_seconds = np.atleast_1d(np.asarray(epoch_seconds, dtype=float))
+    
+    catalog = get_satellite_catalog()
+    if model != "Näherung" and catalog is not None and ISS_NORAD_ID in catalog.index:
+        iss_index = catalog.index[ISS_NORAD_ID]
+        lat, lon, alt, speed_kmh, ok = catalog.propagate_geodetic(epoch_seconds, [iss_index])
+        tle_age_days = np.abs(epoch_seconds - catalog.epochs[iss_index]) / 86400
+        if model == "SGP4" or (ok.all() and (tle_age_days <= TLE_MAX_AGE_DAYS).all()):
+            return lat[0], lon[0], alt[0], speed_kmh[0], "SGP4"
+    
+    lat, lon = approximate_iss_positions(epoch_seconds)
+    return (lat, lon, np.full(lat.shape, ISS_MEAN_ALTITUDE_KM),
+            np.full(lat.shape, ISS_MEAN_VELOCITY_KMH), "Näherung")
+
+def get_iss_data_version():
+    """Kennung der aktuell genutzten ISS-Bahndaten (für Cache-Schlüssel)"""
+    catalog = get_satellite_catalog()
+    if catalog is not None and ISS_NORAD_ID in catalog.index:
+        return catalog.version
+    return "approx"
+
+def get_iss_position_approximation(time_utc):
+    """ISS-Position zu einem gegebenen Zeitpunkt (SGP4, falls TLE-Daten vorhanden)"""
+    lat, lon, _, _, _ = get_iss_track(time_utc.timestamp())
+    return (float(lat[0]), float(lon[0]))
+
+def get_iss_visibility_info(launch_time_utc, launch_coords):
+    """Berechnet ISS-Sichtbarkeitsinformationen für einen Start"""
+    lat, lon, alt, _, _ = get_iss_track(launch_time_utc.timestamp())
+    iss_position = (float(lat[0]), float(lon[0]))
+    
+    # Entfernung ISS zu Startplatz
+    distance_to_launch = float(great_circle_distance_km(*iss_position, *launch_coords, ellipsoidal=True))
+    
+    # ISS-Sichtbarkeit von Deutschland
+    iss_visibility_from_germany, _, _ = is_point_visible_from_germany(
+        iss_position, float(alt[0]), launch_time_utc
+    )
+    
+    # Kann ISS den Start sehen? (vereinfachte Berechnung)
+    # ISS kann etwa 2000km weit sehen
+    iss_can_see_launch = "Ja ✅" if distance_to_launch < 2000 else "Nein ❌"
+    
+    visibility_text = "Sehr gut ✅" if iss_visibility_from_germany > 70 else \
+                     "Gut ⭐" if iss_visibility_from_germany > 40 else \
+                     "Möglich 🟡" if iss_visibility_from_germany > 10 else "Nicht sichtbar ❌"
+    
+    return {
+        'approx_position': f"{iss_position[0]:.1f}°N, {iss_position[1]:.1f}°E",
+        'visibility_from_germany': visibility_text,
+        'distance_to_launch': distance_to_launch,
+        'iss_can_see_launch': iss_can_see_launch
+    }
+
+def get_current_iss_info():
+    """Holt aktuelle ISS-Position und -Daten"""
+    lat, lon, alt, speed_kmh, source = get_iss_track(time.time())
+    
+    return {
+        'latitude': float(lat[0]),
+        'longitude': float(lon[0]),
+        'altitude': float(alt[0]),
+        'velocity': float(speed_kmh[0]),
+        'source': source
+    }
+
+def get_iss_visibility_from_germany():
+    """Berechnet aktuelle ISS-Sichtbarkeit von Deutschland"""
+    current_time = datetime.now(pytz.UTC)
+    iss_info = get_current_iss_info()
+    iss_coords = (iss_info['latitude'], iss_info['longitude'])
+    
+    # Elevation über Horizont und Azimut aus den ECEF-Vektoren
+    elevation, azimuth, _ = look_angles_from_germany(iss_coords[0], iss_coords[1], iss_info['altitude'])
+    elevation, azimuth = float(elevation), float(azimuth)
+    
+    if elevation < 0:  # ISS hinter dem Horizont
+        return {
+            'is_visible': False,
+            'reason': 'ISS zu weit entfernt',
+            'next_pass': 'In ~45 Minuten',
+            'elevation': 0,
+            'azimuth': 0,
+            'direction': 'N/A',
+            'visibility_quality': 'Nicht sichtbar'
+        }
+    
+    # Richtung bestimmen
+    direction = azimuth_to_direction(azimuth)
+    
+    # Sichtbarkeit prüfen
+    visibility, _, _ = is_point_visible_from_germany(iss_coords, iss_info['altitude'], current_time)
+    
+    if elevation < 10:
+        return {
+            'is_visible': False,
+            'reason': 'Unter dem Horizont',
+            'next_pass': 'In ~20-90 Minuten',
+            'elevation': elevation,
+            'azimuth': azimuth,
+            'direction': direction,
+            'visibility_quality': 'Nicht sichtbar'
+        }
+    
+    if visibility < 30:
+        return {
+            'is_visible': False,
+            'reason': 'Ungünstige Lichtverhältnisse',
+            'next_pass': 'Bei Dämmerung/Nacht',
+            'elevation': elevation,
+            'azimuth': azimuth,
+            'direction': direction,
+            'visibility_quality': 'Schlecht'
+        }
+    
+    # ISS ist sichtbar!
+    quality = "Exzellent" if visibility > 80 else "Sehr gut" if visibility > 60 else "Gut"
+    
+    return {
+        'is_visible': True,
+        'elevation': elevation,
+        'azimuth': azimuth,
+        'direction': direction,
+        'visibility_quality': quality,
+        'next_pass': 'Jetzt sichtbar!',
+        'reason': 'Optimal sichtbar'
+    }
+
+ISS_PASS_HORIZON_DAYS = float(os.environ.get("ROCKETS_ISS_PASS_DAYS", "7"))
+
+def iss_look_angles(epoch_seconds, observer=germany_coords, model=None):
+    """Elevation, Azimut und Entfernung der ISS von einem Beobachter aus zu beliebig vielen Zeitpunkten"""
+    lat, lon, alt, _, _ = get_iss_track(epoch_seconds, model)
+    return look_angles(observer[0], observer[1], geodetic_to_ecef(lat, lon, alt))
+
+def get_iss_passes(start_epoch=None, days=ISS_PASS_HORIZON_DAYS, min_elevation=PASS_MIN_ELEVATION_DEG):
+    """ISS-Überflüge über Deutschland im gewählten Zeitraum, mit Sichtbarkeitsbewertung zur Kulmination.
+    
+    Mit SGP4 endet der Zeitraum spätestens mit der Gültigkeit der TLE (TLE_MAX_AGE_DAYS).
+    """
+    start_epoch = time.time() if start_epoch is None else start_epoch
+    model, end_epoch = select_iss_model(start_epoch, start_epoch + days * 86400)
+    look_angle_function = functools.partial(iss_look_angles, model=model)
+    passes = predict_passes(look_angle_function, start_epoch, end_epoch) if end_epoch > start_epoch else []
+    passes = [iss_pass for iss_pass in passes if iss_pass['max_elevation'] >= min_elevation]
+    if not passes:
+        return []
+    
+    # Lichtverhältnisse zur Kulmination (ein Batch für alle Überflüge)
+    culminations = np.array([iss_pass['culmination'] for iss_pass in passes])
+    lats, lons, alts, _, _ = get_iss_track(culminations, model)
+    visibility, _, _ = is_point_visible_from_germany_batch(np.column_stack([lats, lons]), alts, culminations)
+    for iss_pass, score in zip(passes, visibility.tolist()):
+        iss_pass['visibility'] = score
+    return passes
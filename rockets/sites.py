@@ -0,0 +1,184 @@
+"""Register aller bekannten Startorte mit räumlichem Index und Bewertung der Startpositionen"""
+import hashlib
+import json
+import math
+
+import numpy as np
+
+from .geometry import EARTH_MEAN_RADIUS_KM, distance_from_germany_km, germany_coords, unit_vectors
+
+# Register aller bekannten Startorte mit räumlichem Index
+STATIC_LAUNCH_SITES = [
+    {"name": "SaxaVord Spaceport (Schottland)", "coords": (60.7, -0.8), "active": True},
+    {"name": "Andøya Spaceport (Norwegen)", "coords": (69.3, 16.0), "active": True},
+    {"name": "Sutherland Spaceport (Schottland)", "coords": (58.4, -4.2), "active": True},
+    {"name": "Plesetsk (Russland)", "coords": (62.9, 40.6), "active": True},
+    {"name": "Vandenberg (Kalifornien)", "coords": (34.6, -120.6), "active": True},
+    {"name": "Cape Canaveral (Florida)", "coords": (28.6, -80.6), "active": True},
+    {"name": "Kourou (Franz. Guayana)", "coords": (5.2, -52.8), "active": True},
+    {"name": "Baikonur (Kasachstan)", "coords": (45.9, 63.3), "active": True},
+    {"name": "Wallops (Virginia)", "coords": (37.8, -75.5), "active": True},
+    {"name": "Rocket Lab Mahia (Neuseeland)", "coords": (-39.3, 177.9), "active": True}
+]
+LAUNCH_SITE_MERGE_KM = 50  # Startorte näher beieinander gelten als derselbe Ort
+SITE_GRID_CELL_DEG = 10
+
+class LaunchSiteRegistry:
+    """Startorte mit vorberechneten Einheitsvektoren und einem Breiten/Längen-Gitter als Index.
+    
+    Umkreis- und k-nächste-Nachbarn-Abfragen prüfen nur die Gitterzellen, die den
+    Suchkreis berühren, und vergleichen dort per Skalarprodukt.
+    """
+    
+    def __init__(self, sites):
+        self.sites = sites
+        self.lats = np.array([site["coords"][0] for site in sites], dtype=float)
+        self.lons = np.array([site["coords"][1] for site in sites], dtype=float)
+        self.vectors = unit_vectors(self.lats, self.lons)
+        self.version = hashlib.sha1(json.dumps([(site["name"], site["coords"]) for site in sites]).encode("utf-8")).hexdigest()[:16]
+        
+        self.lat_cells = int(math.ceil(180 / SITE_GRID_CELL_DEG))
+        self.lon_cells = int(math.ceil(360 / SITE_GRID_CELL_DEG))
+        grid = {}
+        for i, cell in enumerate(zip(*self._cell_of(self.lats, self.lons))):
+            grid.setdefault(cell, []).append(i)
+        self.grid = {cell: np.array(indices) for cell, indices in grid.items()}
+    
+    @classmethod
+    def from_sources(cls, static_sites, launches=None):
+        """Baut das Register aus der statischen Liste und allen Startorten des Launch-Feeds"""
+        sites = [dict(site) for site in static_sites]
+        
+        # Startrampen je Startort zusammenfassen (Mittelpunkt aller Rampen)
+        locations = {}
+        for launch in launches or []:
+            if launch.pad_lat == 0.0 and launch.pad_lon == 0.0:
+                continue  # Rampe ohne Koordinaten
+            locations.setdefault(launch.location_name, []).append(launch.coords)
+        
+        vectors = unit_vectors([site["coords"][0] for site in sites], [site["coords"][1] for site in sites])
+        merge_cos = math.cos(LAUNCH_SITE_MERGE_KM / EARTH_MEAN_RADIUS_KM)
+        for name, pad_coords in sorted(locations.items()):
+            coords = tuple(np.mean(pad_coords, axis=0).tolist())
+            vector = unit_vectors(*coords)
+            # Bereits bekannte Orte (z.B. aus der statischen Liste) nicht doppelt aufnehmen
+            if vectors.size and np.max(vectors @ vector) >= merge_cos:
+                continue
+            sites.append({"name": name, "coords": coords, "active": True})
+            vectors = np.vstack([vectors, vector]) if vectors.size else vector[None, :]
+        return cls(sites)
+    
+    def __len__(self):
+        return len(self.sites)
+    
+    def _cell_of(self, lats, lons):
+        lat_cell = np.clip(np.floor((np.asarray(lats) + 90) / SITE_GRID_CELL_DEG), 0, self.lat_cells - 1).astype(int)
+        lon_cell = (np.floor((np.asarray(lons) + 180) / SITE_GRID_CELL_DEG) % self.lon_cells).astype(int)
+        return lat_cell.tolist(), lon_cell.tolist()
+    
+    def _candidates(self, lat, lon, radius_km):
+        """Indizes aller Startorte in Gitterzellen, die den Suchkreis berühren"""
+        radius_deg = math.degrees(radius_km / EARTH_MEAN_RADIUS_KM)
+        lat_min, lat_max = lat - radius_deg, lat + radius_deg
+        
+        lat_range = range(int(max(0, math.floor((lat_min + 90) / SITE_GRID_CELL_DEG))),
+                          int(min(self.lat_cells - 1, math.floor((lat_max + 90) / SITE_GRID_CELL_DEG))) + 1)
+        # Nahe der Pole bzw. bei großen Radien alle Längenzellen
+        max_abs_lat = max(abs(lat_min), abs(lat_max))
+        if max_abs_lat >= 90 or radius_deg >= 90:
+            lon_range = range(self.lon_cells)
+        else:
+            lon_radius = radius_deg / math.cos(math.radians(max_abs_lat))
+            if lon_radius >= 180:
+                lon_range = range(self.lon_cells)
+            else:
+                first = int(math.floor((lon - lon_radius + 180) / SITE_GRID_CELL_DEG))
+                last = int(math.floor((lon + lon_radius + 180) / SITE_GRID_CELL_DEG))
+                lon_range = [cell % self.lon_cells for cell in range(first, last + 1)]
+        
+        cells = [self.grid[(lat_cell, lon_cell)] for lat_cell in lat_range for lon_cell in set(lon_range)
+                 if (lat_cell, lon_cell) in self.grid]
+        return np.concatenate(cells) if cells else np.array([], dtype=int)
+    
+    def _distances_km(self, indices, lat, lon):
+        # Sehnenlänge statt arccos(Skalarprodukt), genauer für kleine Abstände
+        chord = np.linalg.norm(self.vectors[indices] - unit_vectors(lat, lon), axis=-1)
+        return 2 * EARTH_MEAN_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+    
+    def within_radius(self, lat, lon, radius_km):
+        """Startorte im Umkreis, nach Entfernung sortiert: (Indizes, Entfernungen in km)"""
+        indices = self._candidates(lat, lon, radius_km)
+        distances = self._distances_km(indices, lat, lon)
+        inside = distances <= radius_km
+        order = np.argsort(distances[inside], kind="stable")
+        return indices[inside][order], distances[inside][order]
+    
+    def nearest(self, lat, lon, k=5):
+        """Die k nächsten Startorte: (Indizes, Entfernungen in km)"""
+        k = min(k, len(self))
+        radius_km = SITE_GRID_CELL_DEG * 111.2
+        while True:
+            indices, distances = self.within_radius(lat, lon, radius_km)
+            if indices.size >= k or radius_km >= math.pi * EARTH_MEAN_RADIUS_KM:
+                return indices[:k], distances[:k]
+            radius_km = min(radius_km * 2, math.pi * EARTH_MEAN_RADIUS_KM)
+    
+    def rank_of_distance(self, lat, lon, distance_km):
+        """Rang eines Orts in dieser Entfernung unter allen Startorten (1 = am nächsten)"""
+        return int(self.within_radius(lat, lon, distance_km)[0].size) + 1
+
+def get_best_launch_positions_for_germany(registry):
+    """Gibt die besten Startpositionen des Registers für Sichtbarkeit von Deutschland zurück"""
+    
+    # Nächste Startorte aus dem Index, dann ellipsoidisch genau nachbewerten
+    indices, _ = registry.nearest(germany_coords[0], germany_coords[1], k=10)
+    launch_sites = [dict(registry.sites[i]) for i in indices.tolist()]
+    if not launch_sites:
+        return []
+    
+    site_coords = np.array([site["coords"] for site in launch_sites])
+    distances = distance_from_germany_km(site_coords[:, 0], site_coords[:, 1], ellipsoidal=True)
+    
+    for site, distance in zip(launch_sites, np.atleast_1d(distances).tolist()):
+        site["distance"] = distance
+        
+        # Bewertung basierend auf Entfernung
+        if distance <= 1000:
+            site["rating"] = "Exzellent"
+            site["score"] = 5
+        elif distance <= 2000:
+            site["rating"] = "Sehr gut"
+            site["score"] = 4
+        elif distance <= 3500:
+            site["rating"] = "Gut"
+            site["score"] = 3
+        elif distance <= 6000:
+            site["rating"] = "Mäßig"
+            site["score"] = 2
+        else:
+            site["rating"] = "Schlecht"
+            site["score"] = 1
+    
+    # Sortiere nach Entfernung (beste zuerst)
+    launch_sites.sort(key=lambda x: x["distance"])
+    
+    return launch_sites[:5]  # Top 5
+
+def get_launch_position_rank(launch_coords, registry):
+    """Bewertet die Qualität einer Startposition für Deutschland (Rang unter den Startorten des Registers)"""
+    
+    distance = distance_from_germany_km(launch_coords[0], launch_coords[1])
+    # Rang unter allen bekannten Startorten (Umkreisabfrage um Deutschland)
+    rank = registry.rank_of_distance(germany_coords[0], germany_coords[1], max(distance - LAUNCH_SITE_MERGE_KM, 0))
+    rank_text = f"Platz {rank} von {len(registry)} Startorten"
+    
+    if distance <= 1000:
+        return f"🥇 Exzellent ({rank_text})"
+    elif distance <= 2000:
+        return f"🥈 Sehr gut ({rank_text})"
+    elif distance <= 3500:
+        return f"🥉 Gut ({rank_text})"
+    elif distance <= 6000:
+        return f"🟡 Mäßig ({rank_text})"
+    else:
+        return f"🔴 Schlecht für Sichtbarkeit ({rank_text})"
@@ -0,0 +1,155 @@
+"""Starlink-Überflüge der ganzen Konstellation über Deutschland (Vorfilter, grober Scan, Prozess-Pool)"""
+import os
+
+import numpy as np
+
+from .geometry import (EARTH_MEAN_RADIUS_KM, ecef_to_geodetic, geodetic_to_ecef, germany_coords, julian_dates,
+                       look_angles, teme_to_ecef)
+from .passes import PASS_MIN_ELEVATION_DEG
+from .pool import map_chunks
+from .satellites import TLE_DIR
+from .visibility import is_point_visible_from_germany_batch
+
+# Starlink-Sichtbarkeit für die ganze Konstellation
+STARLINK_TLE_PATH = os.environ.get("ROCKETS_STARLINK_TLE_PATH", os.path.join(TLE_DIR, "starlink.tle"))
+STARLINK_SCAN_STEP_SECONDS = 120
+STARLINK_FINE_STEP_SECONDS = 5
+STARLINK_CHUNK_SIZE = 500  # Satelliten pro Block (Speicherbedarf und Verteilung auf Prozesse)
+STARLINK_WORKERS = int(os.environ.get("ROCKETS_STARLINK_WORKERS", str(os.cpu_count() or 1)))
+
+def horizon_cap_half_angle(radius_km, min_elevation_deg):
+    """Erdzentrischer Winkel (rad) zwischen Beobachter und Objekt im Abstand radius_km vom
+    Erdmittelpunkt, bis zu dem das Objekt mindestens min_elevation_deg hoch steht"""
+    elevation = np.radians(min_elevation_deg)
+    ratio = EARTH_MEAN_RADIUS_KM * np.cos(elevation) / np.asarray(radius_km, dtype=float)
+    return np.arccos(np.clip(ratio, -1, 1)) - elevation
+
+def prefilter_satellites(catalog, observer=germany_coords, min_elevation=PASS_MIN_ELEVATION_DEG):
+    """Indizes aller Satelliten, deren Bahn den Sichtkreis des Beobachters überhaupt erreichen kann.
+    
+    Die Bodenspur eines Satelliten bleibt im Breitenband ±Inklination, der Sichtkreis
+    reicht bei Apogäumshöhe um den Cap-Winkel darüber hinaus.
+    """
+    inclinations = np.array([satrec.inclo for satrec in catalog.satrecs])
+    max_latitudes = np.minimum(inclinations, np.pi - inclinations)
+    apogee_radii = np.array([(1 + satrec.alta) * satrec.radiusearthkm for satrec in catalog.satrecs])
+    reach = max_latitudes + horizon_cap_half_angle(apogee_radii, min_elevation)
+    return np.flatnonzero(reach >= abs(np.radians(observer[0])))
+
+def _contiguous_runs(mask):
+    """Start- und End-Index (exklusiv) aller zusammenhängenden True-Bereiche"""
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def _satellite_passes(satrec, windows, observer, min_elevation):
+    """Feinberechnung der Überflüge eines Satelliten in den Kandidaten-Zeitfenstern"""
+    segments = [np.arange(start, end + STARLINK_FINE_STEP_SECONDS, STARLINK_FINE_STEP_SECONDS) for start, end in windows]
+    fine_times = np.concatenate(segments)
+    errors, positions, _ = satrec.sgp4_array(*julian_dates(fine_times))
+    ecef = teme_to_ecef(positions, fine_times)
+    elevation, azimuth, range_km = look_angles(observer[0], observer[1], ecef)
+    above = (elevation >= min_elevation) & (errors == 0)
+    
+    # Jedes Kandidatenfenster einzeln auswerten: zwischen zwei Fenstern liegen oft Stunden,
+    # über diese Lücke hinweg darf weder ein Überflug verlaufen noch interpoliert werden
+    boundaries = np.cumsum([0] + [segment.size for segment in segments]).tolist()
+    passes = []
+    for first, last in zip(boundaries[:-1], boundaries[1:]):
+        run_starts, run_ends = _contiguous_runs(above[first:last])
+        for start, end in zip((run_starts + first).tolist(), (run_ends + first).tolist()):
+            # Aufgang/Untergang linear zwischen den Stützstellen interpolieren
+            rise = fine_times[start]
+            if start > first:
+                fraction = (min_elevation - elevation[start - 1]) / (elevation[start] - elevation[start - 1])
+                rise = fine_times[start - 1] + fraction * (fine_times[start] - fine_times[start - 1])
+            set_time = fine_times[end - 1]
+            if end < last:
+                fraction = (elevation[end - 1] - min_elevation) / (elevation[end - 1] - elevation[end])
+                set_time = fine_times[end - 1] + fraction * (fine_times[end] - fine_times[end - 1])
+            
+            # Kulmination per Parabel durch das Maximum und seine Nachbarn
+            peak = start + int(np.argmax(elevation[start:end]))
+            culmination, max_elevation = fine_times[peak], elevation[peak]
+            if start < peak < end - 1:
+                y0, y1, y2 = elevation[peak - 1], elevation[peak], elevation[peak + 1]
+                curvature = y0 - 2 * y1 + y2
+                if curvature < 0:
+                    offset = 0.5 * (y0 - y2) / curvature
+                    culmination = fine_times[peak] + offset * STARLINK_FINE_STEP_SECONDS
+                    max_elevation = y1 - 0.25 * (y0 - y2) * offset
+            
+            lat, lon, alt = ecef_to_geodetic(ecef[peak])
+            passes.append({
+                'rise': float(rise),
+                'culmination': float(culmination),
+                'set': float(set_time),
+                'duration': float(set_time - rise),
+                'max_elevation': float(max_elevation),
+                'rise_azimuth': float(azimuth[start]),
+                'set_azimuth': float(azimuth[end - 1]),
+                'min_range': float(range_km[peak]),
+                'culmination_position': (float(lat), float(lon)),
+                'culmination_altitude': float(alt),
+            })
+    return passes
+
+def _constellation_chunk_passes(tle_lines, names, start_epoch, end_epoch, observer, min_elevation):
+    """Überflüge eines Blocks der Konstellation (läuft auch in Worker-Prozessen, daher nur TLE-Zeilen)"""
+    # Erst hier importiert: ohne sgp4 bleibt das Modul importierbar (SGP4_AVAILABLE in satellites)
+    from sgp4.api import Satrec, SatrecArray
+    satrecs = [Satrec.twoline2rv(line1, line2) for line1, line2 in tle_lines]
+    
+    # Grober Scan aller Satelliten des Blocks in einem SGP4-Aufruf
+    scan_times = np.arange(start_epoch, end_epoch + STARLINK_SCAN_STEP_SECONDS, STARLINK_SCAN_STEP_SECONDS, dtype=float)
+    errors, positions, _ = SatrecArray(satrecs).sgp4(*julian_dates(scan_times))
+    ecef = teme_to_ecef(positions, scan_times)
+    
+    # Horizont-Cap: Winkel zwischen Beobachter- und Satellitenrichtung per Skalarprodukt,
+    # erweitert um die Bewegung während eines Scan-Schritts
+    observer_unit = geodetic_to_ecef(observer[0], observer[1])
+    observer_unit = observer_unit / np.linalg.norm(observer_unit)
+    radius = np.linalg.norm(ecef, axis=-1)
+    step_angle = np.array([satrec.no_kozai for satrec in satrecs]) * STARLINK_SCAN_STEP_SECONDS / 60
+    cap = np.minimum(horizon_cap_half_angle(radius, min_elevation) + step_angle[:, None], np.pi)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        candidates = (errors == 0) & (ecef @ observer_unit >= radius * np.cos(cap))
+    
+    passes = []
+    for sat in np.flatnonzero(candidates.any(axis=1)).tolist():
+        run_starts, run_ends = _contiguous_runs(candidates[sat])
+        windows = [(scan_times[max(start - 1, 0)], scan_times[min(end, scan_times.size - 1)])
+                   for start, end in zip(run_starts.tolist(), run_ends.tolist())]
+        for satellite_pass in _satellite_passes(satrecs[sat], windows, observer, min_elevation):
+            satellite_pass['name'] = names[sat]
+            satellite_pass['norad_id'] = satrecs[sat].satnum
+            passes.append(satellite_pass)
+    return passes
+
+def predict_constellation_passes(catalog, start_epoch, end_epoch, observer=germany_coords,
+                                 min_elevation=PASS_MIN_ELEVATION_DEG, workers=STARLINK_WORKERS):
+    """Rangliste aller Überflüge einer Konstellation, nach Sichtbarkeit und Elevation sortiert.
+    
+    Satelliten, die den Beobachter nie erreichen können, werden vorab verworfen. Der Rest
+    wird in Blöcken gerechnet, bei mehreren Kernen verteilt auf den gemeinsamen Prozess-Pool.
+    """
+    indices = prefilter_satellites(catalog, observer, min_elevation).tolist()
+    chunks = [indices[i:i + STARLINK_CHUNK_SIZE] for i in range(0, len(indices), STARLINK_CHUNK_SIZE)]
+    chunk_args = [([catalog.lines[i] for i in chunk], [catalog.names[i] for i in chunk],
+                   start_epoch, end_epoch, observer, min_elevation) for chunk in chunks]
+    
+    results = map_chunks(_constellation_chunk_passes, chunk_args, workers)
+    passes = [satellite_pass for chunk_passes in results for satellite_pass in chunk_passes]
+    if not passes:
+        return []
+    
+    # Sichtbarkeitsbewertung zur Kulmination (ein Batch für alle Überflüge)
+    visibility, _, _ = is_point_visible_from_germany_batch(
+        [satellite_pass['culmination_position'] for satellite_pass in passes],
+        [satellite_pass['culmination_altitude'] for satellite_pass in passes],
+        [satellite_pass['culmination'] for satellite_pass in passes],
+    )
+    for satellite_pass, score in zip(passes, visibility.tolist()):
+        satellite_pass['visibility'] = score
+    
+    passes.sort(key=lambda satellite_pass: (-satellite_pass['visibility'], -satellite_pass['max_elevation']))
+    return passes
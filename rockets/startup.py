@@ -0,0 +1,77 @@
+"""Startzeit-Bericht: Importzeiten je Paket (python -X importtime) und Speicher nach dem Import"""
+import os
+import subprocess
+import sys
+
+from . import PROJECT_DIR
+
+# Module, deren Startkosten berichtet werden: die App und die Module der Worker-Prozesse
+STARTUP_MODULES = ("Rocketnew", "rockets.windows", "rockets.starlink")
+# Schwere Abhängigkeiten; folium, streamlit_folium und plotly.express lädt die App erst bei Bedarf
+HEAVY_MODULES = ("folium", "streamlit_folium", "plotly.express", "pandas")
+
+# Misst im frischen Interpreter, die Ausgabe von -X importtime landet auf stderr
+_MEASURE_SCRIPT = """
+import importlib, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+rss_kb = None
+try:
+    # VmHWM statt ru_maxrss: ru_maxrss enthält auf Linux noch den Speicher des Elternprozesses vor exec
+    with open("/proc/self/status") as status:
+        rss_kb = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    try:
+        import resource
+        rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            rss_kb //= 1024  # macOS liefert Bytes
+    except ImportError:
+        pass
+print(seconds, rss_kb)
+"""
+
+def parse_importtime(stderr):
+    """Kumulierte Importzeit in Sekunden je Wurzelpaket und die Menge aller geladenen Module.
+
+    Zeilen haben die Form "import time: <self> | <kumuliert> | <Name>", verschachtelte
+    Importe sind im Namen eingerückt; die Zeiten zählen nur auf der obersten Ebene.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # Kopfzeile
+        name = fields[2].rstrip()
+        entries.append((len(name) - len(name.lstrip()), name.strip(), int(fields[1])))
+    if not entries:
+        return {}, set()
+
+    top_level = min(indent for indent, _, _ in entries)
+    packages = {}
+    for indent, name, cumulative_us in entries:
+        if indent == top_level:
+            root = name.split(".")[0]
+            packages[root] = packages.get(root, 0) + cumulative_us / 1e6
+    return packages, {name for _, name, _ in entries}
+
+def measure_startup(module):
+    """Importiert ein Modul in einem neuen Interpreter und liefert Zeit, Speicher und Kosten je Paket"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PROJECT_DIR, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", _MEASURE_SCRIPT, module],
+                            cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"module": module, "error": result.stderr.strip().splitlines()[-1:]}
+
+    seconds, rss_kb = result.stdout.split()[-2:]
+    packages, loaded = parse_importtime(result.stderr)
+    return {
+        "module": module,
+        "seconds": float(seconds),
+        "rss_mb": None if rss_kb == "None" else int(rss_kb) / 1024,
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        "heavy_loaded": [name for name in HEAVY_MODULES if name in loaded],
+    }
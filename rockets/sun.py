@@ -0,0 +1,125 @@
+"""Sonnenstand, Erdschatten und Tageszeit-Bewertung am Beobachtungsort"""
+import functools
+from datetime import datetime
+
+import numpy as np
+import pytz
+
+from .geometry import EARTH_MEAN_RADIUS_KM, germany_coords, teme_to_ecef
+
+# Sonnenstand: vereinfachte Ephemeride (Astronomical Almanac, ca. 0,01°) als Tagestabelle
+SUN_TABLE_STEP_SECONDS = 3600  # Stützstellen je Tag, dazwischen linear interpoliert
+
+def sun_direction_eci(epoch_seconds):
+    """Einheitsvektor zur Sonne im äquatorialen Inertialsystem (TEME ≈ ECI) für beliebig viele Zeitpunkte"""
+    n = np.asarray(epoch_seconds, dtype=float) / 86400.0 + 2440587.5 - 2451545.0
+    mean_longitude = np.radians(280.460 + 0.9856474 * n)
+    mean_anomaly = np.radians(357.528 + 0.9856003 * n)
+    ecliptic_longitude = mean_longitude + np.radians(1.915 * np.sin(mean_anomaly) + 0.020 * np.sin(2 * mean_anomaly))
+    obliquity = np.radians(23.439 - 0.0000004 * n)
+    return np.stack([np.cos(ecliptic_longitude),
+                     np.cos(obliquity) * np.sin(ecliptic_longitude),
+                     np.sin(obliquity) * np.sin(ecliptic_longitude)], axis=-1)
+
+@functools.lru_cache(maxsize=64)
+def get_sun_ephemeris_day(day):
+    """Sonnenrichtungen (ECI) eines UTC-Tages (Tage seit 1970) an den Stützstellen, einmal pro Tag berechnet"""
+    table = sun_direction_eci(day * 86400.0 + np.arange(0, 86400 + 1, SUN_TABLE_STEP_SECONDS))
+    table.setflags(write=False)
+    return table
+
+def sun_direction_ecef(epoch_seconds):
+    """Einheitsvektor zur Sonne im erdfesten System, aus den Tagestabellen interpoliert"""
+    epoch_seconds = np.asarray(epoch_seconds, dtype=float)
+    if epoch_seconds.size == 0:
+        return np.zeros(epoch_seconds.shape + (3,))
+    days = np.floor(epoch_seconds / 86400.0)
+    unique_days, day_index = np.unique(days, return_inverse=True)
+    tables = np.stack([get_sun_ephemeris_day(int(day)) for day in unique_days])
+    
+    position = (epoch_seconds - days * 86400.0) / SUN_TABLE_STEP_SECONDS
+    step = np.minimum(position.astype(int), tables.shape[1] - 2)
+    weight = (position - step)[..., None]
+    day_index = day_index.reshape(epoch_seconds.shape)
+    direction = (1 - weight) * tables[day_index, step] + weight * tables[day_index, step + 1]
+    direction /= np.linalg.norm(direction, axis=-1, keepdims=True)
+    return teme_to_ecef(direction, epoch_seconds)
+
+def sun_elevation_deg(epoch_seconds, observer_lat=germany_coords[0], observer_lon=germany_coords[1]):
+    """Geometrische Sonnenhöhe in Grad für Beobachter und Zeitpunkte (gegeneinander gebroadcastet)"""
+    lat = np.radians(np.asarray(observer_lat, dtype=float))[..., None]
+    lon = np.radians(np.asarray(observer_lon, dtype=float))[..., None]
+    up = np.concatenate([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+    return np.degrees(np.arcsin(np.clip(np.sum(up * sun_direction_ecef(epoch_seconds), axis=-1), -1, 1)))
+
+def in_earth_shadow(targets_ecef, sun_direction):
+    """Zylindrischer Erdschatten: True, wenn ein Ziel (ECEF, km) auf der Nachtseite im Schatten liegt"""
+    along_sun = np.sum(targets_ecef * sun_direction, axis=-1)
+    off_axis = np.linalg.norm(targets_ecef - along_sun[..., None] * sun_direction, axis=-1)
+    return (along_sun < 0) & (off_axis < EARTH_MEAN_RADIUS_KM)
+
+# Lichtkategorien nach Sonnenhöhe am Beobachtungsort: 0 = Nacht, 1 = nautische Dämmerung,
+# 2 = bürgerliche Dämmerung (Morgen/Abend), 3 = Tag (Sonne über dem Horizont, mit Refraktion)
+SUN_ELEVATION_CATEGORY_LIMITS = np.array([-12.0, -6.0, -0.833])
+
+def get_light_categories(sun_elevation):
+    """Ordnet Sonnenhöhen (Grad) den Lichtkategorien zu"""
+    return np.searchsorted(SUN_ELEVATION_CATEGORY_LIMITS, sun_elevation, side='right')
+
+# Tageszeit-Faktoren je Lichtkategorie für die verschiedenen Bewertungen
+TIME_FACTOR_SCHEMES = {
+    "visibility": np.array([1.0, 0.8, 0.3, 0.0]),     # Satelliten/Raketen (Sonnenlicht-Reflexion)
+    "reentry": np.array([1.0, 0.8, 0.3, 0.0]),        # Wiedereintritts-Bewertung
+    "reentry_window": np.array([1.0, 1.0, 0.8, 0.3]),  # Wiedereintritts-Beobachtungsfenster
+}
+# Beobachter im Dunkeln: Sonne unter dem Horizont (Dämmerung zählt, der Faktor bewertet sie geringer)
+DARK_SKY_MAX_SUN_ELEVATION_DEG = SUN_ELEVATION_CATEGORY_LIMITS[-1]
+
+# Tageszeit-Bewertungstexte je Lichtkategorie
+TIME_RATING_SCHEMES = {
+    "reentry": ["🌙 Optimal (Nacht)", "🌅 Gut (Dämmerung)", "🌅 Mäßig (Dämmerung)", "☀️ Nicht sichtbar (Tag)"],
+    "launch": ["🌙 Optimal (Nacht)", "🌅 Gut (Dämmerung)", "☀️ Ungünstig (Tag)", "☀️ Ungünstig (Tag)"],
+}
+
+# Zentrale Tageszeit-Bewertung für alle Sichtbarkeitsberechnungen
+def get_time_factors(epoch_seconds, scheme="visibility", observer=germany_coords):
+    """Liefert (Sonnenhöhe am Beobachter, Tageszeit-Faktoren) für ein Array von Epoch-Sekunden.
+    
+    observer darf Arrays enthalten, die gegen die Zeitpunkte gebroadcastet werden.
+    """
+    sun_elevation = sun_elevation_deg(epoch_seconds, observer[0], observer[1])
+    return sun_elevation, TIME_FACTOR_SCHEMES[scheme][get_light_categories(sun_elevation)]
+
+def get_observing_conditions(epoch_seconds, targets_ecef, observer=germany_coords):
+    """Lichtverhältnisse für Objekte, die nur im Sonnenlicht sichtbar sind (Satelliten, Raketen).
+    
+    Liefert (Sonnenhöhe, Tageszeit-Faktor, beobachtbar). Beobachtbar ist ein Objekt nur, wenn
+    der Beobachter im Dunkeln steht und das Objekt (ECEF, km) außerhalb des Erdschattens liegt;
+    der Faktor gewichtet dann nur noch Nacht und Dämmerung und ist sonst 0.
+    """
+    sun_elevation, factors = get_time_factors(epoch_seconds, "visibility", observer)
+    sunlit = ~in_earth_shadow(targets_ecef, sun_direction_ecef(epoch_seconds))
+    observable = (sun_elevation < DARK_SKY_MAX_SUN_ELEVATION_DEG) & sunlit
+    return sun_elevation, np.where(observable, factors, 0.0), observable
+
+def get_time_rating(time_utc, scheme="launch"):
+    """Liefert den Tageszeit-Bewertungstext für einen einzelnen UTC-Zeitpunkt"""
+    category = get_light_categories(sun_elevation_deg(time_utc.timestamp()))
+    return TIME_RATING_SCHEMES[scheme][int(category)]
+
+NIGHT_SUN_ELEVATION_DEG = -6  # Beobachtungsnacht ab Ende der bürgerlichen Dämmerung
+NIGHT_SCAN_STEP_SECONDS = 300
+
+def get_next_night_window(now=None):
+    """Beobachtungsnacht in Deutschland (Sonne unter -6°), eine laufende Nacht ab jetzt"""
+    now = (now or datetime.now(pytz.UTC)).timestamp()
+    
+    # Festes 5-Minuten-Raster, damit das Nachtende über Reruns gleich bleibt
+    scan_start = now - now % NIGHT_SCAN_STEP_SECONDS
+    samples = scan_start + np.arange(0, 2 * 86400, NIGHT_SCAN_STEP_SECONDS)
+    dark = sun_elevation_deg(samples) < NIGHT_SUN_ELEVATION_DEG
+    if not dark.any():
+        return now, now
+    first_dark = int(np.argmax(dark))
+    first_light = first_dark + int(np.argmax(~dark[first_dark:]))
+    return max(samples[first_dark], now), float(samples[first_light])
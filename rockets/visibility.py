@@ -0,0 +1,173 @@
+"""Sichtbarkeitsmodell für Punkte am Himmel und Beobachter-Raster über ganz Deutschland"""
+import functools
+import math
+import os
+
+import numpy as np
+
+from .geometry import (EARTH_MEAN_RADIUS_KM, distance_from_germany_km, geodetic_to_ecef, germany_coords, look_angles,
+                       look_angles_from_germany, to_epoch_seconds, unit_vectors)
+from .sun import get_observing_conditions
+
+# Sichtbarkeitsberechnung für viele Punkte auf einmal
+def visibility_scores(distance, heights, elevation, time_factor, observable):
+    """Sichtbarkeitsmodell für beliebig gebroadcastete Arrays (Entfernung Beobachter–Bodenpunkt
+    in km, Höhe in km, Elevation in Grad aus look_angles, Tageszeit-Faktor und Maske
+    "Beobachter im Dunkeln und Objekt beschienen" aus get_observing_conditions).
+    Liefert (visibility_chance, distance_factor, visible)."""
+    
+    # 1. Mindesthöhe für Sichtbarkeit (unter 100km ist praktisch nichts sichtbar)
+    high_enough = heights >= 100
+    
+    # 2. Horizont: nur Ziele mit echter Elevation über 0° sind sichtbar
+    above_horizon = elevation >= 0
+    elevation_factor = np.where(elevation < 10, np.maximum(elevation, 0) / 10, 1.0)
+    
+    # 3. Maximale Sichtdistanz basierend auf Höhe
+    max_visibility_distance = np.select(
+        [heights < 200, heights < 500, heights < 1000], [800, 1200, 1800], default=2500
+    )
+    
+    # 4. Entfernungsfaktor
+    distance_factor = np.where(distance <= max_visibility_distance,
+                               np.maximum(0, 1 - distance / max_visibility_distance), 0.0)
+    
+    # 5. Höhenfaktor (höhere Objekte sind besser sichtbar)
+    height_factor = np.select([heights >= 400, heights >= 200, heights >= 100], [1.0, 0.8, 0.5], default=0.1)
+    
+    # 6. Gesamtsichtbarkeit berechnen
+    visibility_chance = (
+        distance_factor * 0.4 +      # 40% Entfernung
+        time_factor * 0.3 +          # 30% Tageszeit
+        elevation_factor * 0.2 +     # 20% Elevation
+        height_factor * 0.1          # 10% Höhe
+    ) * 100
+    visibility_chance = np.minimum(100, np.maximum(0, visibility_chance))
+    
+    # Nicht sichtbare Punkte (zu niedrig, unter dem Horizont, Taghimmel oder im Erdschatten) auf 0 setzen
+    visible = high_enough & above_horizon & observable
+    return np.where(visible, visibility_chance, 0.0), np.where(visible, distance_factor, 0.0), visible
+
+def is_point_visible_from_germany_batch(positions, heights, times_utc):
+    """Vektorisierte Sichtbarkeitsberechnung: Arrays von Positionen, Höhen und Zeitpunkten.
+    
+    positions hat die Form (N, 2) mit (lat, lon), heights und times_utc (datetimes oder
+    Epoch-Sekunden) werden auf N Werte gebroadcastet. Liefert die Arrays
+    (visibility_chance, distance_factor, time_factor) mit denselben Werten wie
+    is_point_visible_from_germany für jeden einzelnen Punkt.
+    """
+    
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    num_points = len(positions)
+    heights = np.broadcast_to(np.asarray(heights, dtype=float).ravel(), (num_points,))
+    epoch_seconds = np.broadcast_to(to_epoch_seconds(times_utc).ravel(), (num_points,))
+    
+    # Entfernung und Elevation von Deutschland aus, Tageszeit-Faktor und Gate "dunkler Himmel, beschienenes Objekt"
+    distance = distance_from_germany_km(positions[:, 0], positions[:, 1])
+    targets_ecef = geodetic_to_ecef(positions[:, 0], positions[:, 1], heights)
+    elevation, _, _ = look_angles(germany_coords[0], germany_coords[1], targets_ecef)
+    _, time_factor, observable = get_observing_conditions(epoch_seconds, targets_ecef)
+    
+    visibility_chance, distance_factor, visible = visibility_scores(distance, heights, elevation, time_factor,
+                                                                    observable)
+    return visibility_chance, distance_factor, np.where(visible, time_factor, 0.0)
+
+# Beobachter-Raster über ganz Deutschland
+GERMANY_BOUNDS = (47.2, 55.1, 5.8, 15.1)  # Süd, Nord, West, Ost
+OBSERVER_GRID_KM = float(os.environ.get("ROCKETS_OBSERVER_GRID_KM", "20"))
+OBSERVER_GRID_CHUNK = 4096  # Rasterzellen pro Block (begrenzt die Größe der Zellen × Punkte-Matrix)
+GOOD_VISIBILITY = 30  # ab hier gilt ein Punkt als gut sichtbar
+
+class ObserverGrid:
+    """Regelmäßiges Raster von Beobachtern (Zellmittelpunkte) über Deutschland mit Regionszuordnung"""
+    
+    def __init__(self, resolution_km, bounds=GERMANY_BOUNDS):
+        south, north, west, east = bounds
+        self.resolution_km = resolution_km
+        self.bounds = bounds
+        lat_step = resolution_km / 111.2
+        lon_step = resolution_km / (111.2 * math.cos(math.radians((south + north) / 2)))
+        self.lat_centers = np.arange(south + lat_step / 2, north, lat_step)
+        self.lon_centers = np.arange(west + lon_step / 2, east, lon_step)
+        
+        lat_grid, lon_grid = np.meshgrid(self.lat_centers, self.lon_centers, indexing="ij")
+        self.shape = lat_grid.shape
+        self.lats = lat_grid.ravel()
+        self.lons = lon_grid.ravel()
+        self.vectors = unit_vectors(self.lats, self.lons)
+        
+        # Region nach Azimut vom Mittelpunkt (Quadranten um Norden, Osten, Süden, Westen)
+        _, azimuth, _ = look_angles_from_germany(self.lats, self.lons)
+        self.regions = np.array(["Nord", "Ost", "Süd", "West"])[((azimuth + 45) % 360 // 90).astype(int)]
+    
+    def __len__(self):
+        return self.lats.size
+
+@functools.lru_cache(maxsize=4)
+def get_observer_grid(resolution_km=OBSERVER_GRID_KM):
+    """Beobachter-Raster einer Auflösung, einmal pro Prozess aufgebaut"""
+    return ObserverGrid(resolution_km)
+
+def compute_visibility_field(grid, lats, lons, heights, times_utc):
+    """Bewertet eine Flugbahn für alle Rasterzellen in einem vektorisierten Durchlauf.
+    
+    Für jede Zelle werden alle Bahnpunkte mit dem Sichtbarkeitsmodell bewertet (Entfernung
+    über Einheitsvektoren, Elevation und Sonnenhöhe aus der Zelle selbst, Zellen blockweise).
+    Liefert je Zelle die beste Sichtbarkeit, den Zeitpunkt dazu und die Anzahl gut sichtbarer
+    Bahnpunkte.
+    """
+    import pandas as pd
+    
+    point_vectors = unit_vectors(lats, lons)
+    num_points = len(point_vectors)
+    heights = np.broadcast_to(np.asarray(heights, dtype=float).ravel(), (num_points,))
+    point_ecef = geodetic_to_ecef(np.ravel(lats), np.ravel(lons), heights)
+    epoch_seconds = np.broadcast_to(to_epoch_seconds(times_utc).ravel(), (num_points,))
+    
+    best_score = np.empty(len(grid))
+    best_point = np.empty(len(grid), dtype=int)
+    good_points = np.empty(len(grid), dtype=int)
+    for start in range(0, len(grid), OBSERVER_GRID_CHUNK):
+        cells = slice(start, start + OBSERVER_GRID_CHUNK)
+        distance = EARTH_MEAN_RADIUS_KM * np.arccos(np.clip(grid.vectors[cells] @ point_vectors.T, -1, 1))
+        observer = (grid.lats[cells, None], grid.lons[cells, None])
+        elevation, _, _ = look_angles(observer[0], observer[1], point_ecef)
+        _, time_factor, observable = get_observing_conditions(epoch_seconds, point_ecef, observer)
+        scores, _, _ = visibility_scores(distance, heights[None, :], elevation, time_factor, observable)
+        best_point[cells] = scores.argmax(axis=1)
+        best_score[cells] = np.take_along_axis(scores, best_point[cells, None], axis=1)[:, 0]
+        good_points[cells] = (scores > GOOD_VISIBILITY).sum(axis=1)
+    
+    return pd.DataFrame({
+        'lat': grid.lats,
+        'lon': grid.lons,
+        'region': grid.regions,
+        'visibility': best_score,
+        'best_time': epoch_seconds[best_point],
+        'good_points': good_points,
+    })
+
+def aggregate_visibility_by_region(field):
+    """Fasst ein Sichtbarkeitsfeld je Region zusammen (Mittel, Maximum, Flächenanteil mit guter Sicht)"""
+    import pandas as pd
+    grouped = field.groupby('region')
+    summary = pd.DataFrame({
+        'mean_visibility': grouped['visibility'].mean(),
+        'max_visibility': grouped['visibility'].max(),
+        'good_share': grouped['visibility'].apply(lambda values: (values > GOOD_VISIBILITY).mean()),
+        'cells': grouped.size(),
+    })
+    best_cells = field.loc[grouped['visibility'].idxmax()]
+    summary['best_lat'] = best_cells['lat'].to_numpy()
+    summary['best_lon'] = best_cells['lon'].to_numpy()
+    summary['best_time'] = best_cells['best_time'].to_numpy()
+    return summary.sort_values('mean_visibility', ascending=False)
+
+# Sichtbarkeitsberechnung für einen einzelnen Punkt
+def is_point_visible_from_germany(position, height, time_utc):
+    """Verbesserte Sichtbarkeitsberechnung mit realistischen physikalischen Constraints"""
+    
+    visibility_chance, distance_factor, time_factor = is_point_visible_from_germany_batch(
+        [position], height, time_utc
+    )
+    return float(visibility_chance[0]), float(distance_factor[0]), float(time_factor[0])
@@ -0,0 +1,232 @@
+"""Sichtbarkeitsfenster von Starts entlang Aufstieg und Umläufen sowie die Analyse des ganzen Manifests"""
+import functools
+import math
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+import pytz
+
+from .geometry import azimuth_to_direction, distance_from_germany_km, look_angles_from_germany
+from .orbits import LAUNCH_ORBIT_PARAMS, calculate_ground_tracks, calculate_orbit_period, determine_orbit_type
+from .passes import golden_section_maximum, find_intervals
+from .pool import map_chunks
+from .visibility import is_point_visible_from_germany_batch
+
+# Sichtbarkeitsfenster entlang Aufstieg und Umläufen: grober Scan, Ränder per Bisektion
+LAUNCH_WINDOW_ORBITS = 3
+LAUNCH_WINDOW_SCAN_SECONDS = 20
+LAUNCH_WINDOW_TOLERANCE_SECONDS = 1.0
+LAUNCH_WINDOW_MIN_VISIBILITY = 20  # wie bisher: nur relevante Sichtungen
+LAUNCH_WINDOW_MIN_ELEVATION_DEG = 10
+LAUNCH_TIMELINE_DAYS = float(os.environ.get("ROCKETS_TIMELINE_DAYS", "7"))
+LAUNCH_TIMELINE_CHUNK_SECONDS = 6 * 3600  # Suchblock des Zeitplan-Generators
+LAUNCH_TIMELINE_PAGE_SIZE = 10
+
+def launch_positions(launch_coords, launch_epoch, target_orbit, epoch_seconds):
+    """Position (lat, lon, Höhe) auf Aufstieg und Umläufen für beliebige Zeitpunkte.
+    
+    Gleiches Modell wie build_launch_trajectory, aber zeitkontinuierlich: Aufstieg nach
+    Fortschritt, danach Umläufe, unter denen sich die Erde weiterdreht (jeder Umlauf liegt
+    um die Erddrehung während einer Umlaufzeit weiter westlich).
+    """
+    minutes = (np.asarray(epoch_seconds, dtype=float) - launch_epoch) / 60
+    ascent_duration = target_orbit["ascent_duration"]
+    
+    progress = np.clip(minutes / ascent_duration, 0, 1)
+    inclination_rad = math.radians(target_orbit["inclination"])
+    ascent_lats = launch_coords[0] + progress * 2 * math.cos(inclination_rad)
+    ascent_lons = launch_coords[1] + (progress * 4 * math.sin(inclination_rad) if target_orbit["inclination"] > 0 else progress * 4)
+    ascent_heights = target_orbit["height"] * (1 - np.exp(-3 * progress))
+    
+    orbit_period = calculate_orbit_period(target_orbit["height"])
+    orbit_minutes = np.maximum(minutes - ascent_duration, 0)
+    theta = (orbit_minutes / orbit_period % 1) * 2 * np.pi
+    orbit_lats, orbit_lons = calculate_ground_tracks(
+        launch_coords[0], launch_coords[1], target_orbit["inclination"], theta, ascent_duration + orbit_minutes
+    )
+    
+    in_orbit = minutes >= ascent_duration
+    return (np.where(in_orbit, orbit_lats, ascent_lats),
+            np.where(in_orbit, orbit_lons, ascent_lons),
+            np.where(in_orbit, float(target_orbit["height"]), ascent_heights))
+
+def iter_visibility_windows(launch_coords, launch_time_utc, target_orbit, horizon_days=LAUNCH_TIMELINE_DAYS,
+                            chunk_seconds=LAUNCH_TIMELINE_CHUNK_SECONDS):
+    """Liefert Sichtbarkeitsfenster (Beginn, Höhepunkt, Ende) von Aufstieg und Umläufen lazy in zeitlicher Reihenfolge.
+    
+    Der Zeitraum ab dem Start wird blockweise durchsucht, ein am Blockende noch laufendes
+    Fenster wird in den nächsten Block übernommen. Ein Fenster liegt vor, solange die
+    Sichtbarkeit über LAUNCH_WINDOW_MIN_VISIBILITY und die Elevation über
+    LAUNCH_WINDOW_MIN_ELEVATION_DEG liegt. Wird der Generator nicht weiter verbraucht,
+    werden auch keine weiteren Blöcke berechnet.
+    """
+    de_timezone = pytz.timezone('Europe/Berlin')
+    launch_epoch = launch_time_utc.timestamp()
+    ascent_end = launch_epoch + target_orbit["ascent_duration"] * 60
+    orbit_period = calculate_orbit_period(target_orbit["height"])
+    end_epoch = launch_epoch + horizon_days * 86400
+    
+    def state(epoch_seconds):
+        lats, lons, heights = launch_positions(launch_coords, launch_epoch, target_orbit, epoch_seconds)
+        visibility, _, _ = is_point_visible_from_germany_batch(np.column_stack([lats, lons]), heights, epoch_seconds)
+        elevation, azimuth, _ = look_angles_from_germany(lats, lons, heights)
+        return visibility, elevation, azimuth, lats, lons, heights
+    
+    def margin(epoch_seconds):
+        visibility, elevation = state(epoch_seconds)[:2]
+        return np.minimum(visibility - LAUNCH_WINDOW_MIN_VISIBILITY, elevation - LAUNCH_WINDOW_MIN_ELEVATION_DEG)
+    
+    carried_start = None
+    for chunk_start in np.arange(launch_epoch, end_epoch, chunk_seconds):
+        chunk_end = min(chunk_start + chunk_seconds, end_epoch)
+        starts, ends, open_start, open_end = find_intervals(margin, chunk_start, chunk_end, LAUNCH_WINDOW_SCAN_SECONDS,
+                                                            LAUNCH_WINDOW_TOLERANCE_SECONDS)
+        
+        # Fenster über die Blockgrenze zusammenführen, ein offenes Ende in den nächsten Block übernehmen
+        if carried_start is not None and open_start[:1].any():
+            starts[0] = carried_start
+        carried_start = None
+        if open_end[-1:].any() and chunk_end < end_epoch:
+            carried_start = starts[-1]
+            starts, ends = starts[:-1], ends[:-1]
+        if not starts.size:
+            continue
+        
+        peaks = golden_section_maximum(lambda epochs: state(epochs)[1], starts, ends, LAUNCH_WINDOW_TOLERANCE_SECONDS)
+        
+        # Zustand an allen Ereignissen des Blocks in einem Aufruf
+        count = starts.size
+        visibility, elevation, azimuth, lats, lons, heights = state(np.concatenate([starts, peaks, ends]))
+        distances = distance_from_germany_km(lats[count:2 * count], lons[count:2 * count])
+        
+        for i in range(count):
+            peak = count + i
+            start_time = datetime.fromtimestamp(starts[i], pytz.UTC)
+            peak_time = datetime.fromtimestamp(peaks[i], pytz.UTC)
+            end_time = datetime.fromtimestamp(ends[i], pytz.UTC)
+            if peaks[i] < ascent_end:
+                phase = "Aufstieg"
+            else:
+                phase = f"Umlauf {int((peaks[i] - ascent_end) // (orbit_period * 60)) + 1}"
+            yield {
+                'phase': phase,
+                'start': float(starts[i]),
+                'peak': float(peaks[i]),
+                'end': float(ends[i]),
+                'duration': float(ends[i] - starts[i]),
+                'date_de': peak_time.astimezone(de_timezone).strftime('%d.%m.%Y'),
+                'time_utc': peak_time.strftime('%H:%M:%S'),
+                'time_de': peak_time.astimezone(de_timezone).strftime('%H:%M:%S'),
+                'start_de': start_time.astimezone(de_timezone).strftime('%H:%M:%S'),
+                'end_de': end_time.astimezone(de_timezone).strftime('%H:%M:%S'),
+                'coords': (float(lats[peak]), float(lons[peak])),
+                'height': int(heights[peak]),
+                'visibility': float(visibility[peak]),
+                'distance': float(distances[i]),
+                'elevation': float(elevation[peak]),
+                'start_azimuth': float(azimuth[i]),
+                'end_azimuth': float(azimuth[2 * count + i]),
+                'start_direction': azimuth_to_direction(azimuth[i]),
+                'end_direction': azimuth_to_direction(azimuth[2 * count + i]),
+            }
+
+def calculate_visibility_schedule(launch_coords, launch_time_utc, target_orbit, num_orbits=LAUNCH_WINDOW_ORBITS):
+    """Alle Sichtbarkeitsfenster von Aufstieg und den ersten Umläufen als Liste (chronologisch)"""
+    horizon_minutes = target_orbit["ascent_duration"] + num_orbits * calculate_orbit_period(target_orbit["height"])
+    return list(iter_visibility_windows(launch_coords, launch_time_utc, target_orbit, horizon_minutes / (24 * 60)))
+
+# Flugbahnanalyse aller Starts: Fenstersuche je Start, verteilt auf einen Prozess-Pool
+MANIFEST_ANALYSIS_ORBITS = int(os.environ.get("ROCKETS_MANIFEST_ORBITS", str(LAUNCH_WINDOW_ORBITS)))
+MANIFEST_ANALYSIS_WORKERS = int(os.environ.get("ROCKETS_MANIFEST_WORKERS", str(os.cpu_count() or 1)))
+MANIFEST_ANALYSIS_CHUNK_SIZE = 8  # Starts pro Auftrag an einen Worker-Prozess
+TRAJECTORY_MODEL_VERSION = 2  # erhöhen, wenn sich Flugbahn- oder Sichtbarkeitsmodell ändern
+
+def summarize_visibility_windows(windows):
+    """Kennzahlen einer Fensterliste: Anzahl, beste Sichtbarkeit, Elevation, Gesamtdauer, bestes Fenster"""
+    if not windows:
+        return {'windows': 0, 'best_visibility': 0.0, 'max_elevation': 0.0, 'total_minutes': 0.0,
+                'first_start': None, 'best_peak': None, 'best_phase': None, 'best_direction': None}
+    best = max(windows, key=lambda window: (window['visibility'], window['elevation']))
+    return {
+        'windows': len(windows),
+        'best_visibility': best['visibility'],
+        'max_elevation': max(window['elevation'] for window in windows),
+        'total_minutes': sum(window['duration'] for window in windows) / 60,
+        'first_start': windows[0]['start'],
+        'best_peak': best['peak'],
+        'best_phase': best['phase'],
+        'best_direction': f"{best['start_direction']} → {best['end_direction']}",
+    }
+
+def _analyze_launch_chunk(jobs, num_orbits):
+    """Worker: Fensteranalyse für (Schlüssel, Startort, Startzeit, Orbit-Typ)-Aufträge (nur picklebare Argumente)"""
+    results = []
+    for key, coords, net_epoch, orbit_type in jobs:
+        windows = calculate_visibility_schedule(coords, datetime.fromtimestamp(net_epoch, pytz.UTC),
+                                                LAUNCH_ORBIT_PARAMS[orbit_type], num_orbits)
+        results.append((key, summarize_visibility_windows(windows)))
+    return results
+
+class TrajectoryAnalysisCache:
+    """Thread-sicherer Cache der Flugbahnanalysen je Start-Version (ID, letzte Änderung, Startzeit, Startort, Orbit)"""
+    
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def get_many(self, keys):
+        """Liefert (gefundene Einträge, fehlende Schlüssel)"""
+        with self.lock:
+            found = {key: self.entries[key] for key in keys if key in self.entries}
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found, [key for key in keys if key not in found]
+    
+    def put_many(self, results, keep_keys):
+        """Speichert neue Ergebnisse und verwirft Starts, die nicht mehr im Manifest stehen"""
+        keep_keys = set(keep_keys)
+        with self.lock:
+            self.entries.update(results)
+            for key in [key for key in self.entries if key not in keep_keys]:
+                del self.entries[key]
+    
+    def get_stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+@functools.lru_cache(maxsize=None)
+def get_trajectory_analysis_cache():
+    """Prozessweiter Cache der Flugbahnanalysen (gemeinsam für alle Sitzungen)"""
+    return TrajectoryAnalysisCache()
+
+def analyze_launch_manifest(launches, num_orbits=MANIFEST_ANALYSIS_ORBITS, workers=MANIFEST_ANALYSIS_WORKERS, cache=None):
+    """Volle Aufstiegs-, Orbit- und Fensteranalyse für alle Starts, eine Zeile pro Start.
+    
+    Nur Starts ohne gültigen Cache-Eintrag werden neu gerechnet, bei mehreren Kernen in
+    Blöcken auf dem gemeinsamen Prozess-Pool (rockets.pool).
+    """
+    import pandas as pd
+    jobs = {}
+    for launch in launches:
+        orbit_type = determine_orbit_type(launch.orbit_name)
+        key = (launch.id, launch.last_updated, launch.net_epoch, launch.pad_lat, launch.pad_lon, orbit_type,
+               num_orbits, TRAJECTORY_MODEL_VERSION)
+        jobs[key] = (key, launch.coords, launch.net_epoch, orbit_type)
+    
+    cache = cache or get_trajectory_analysis_cache()
+    summaries, missing = cache.get_many(list(jobs))
+    if missing:
+        missing_jobs = [jobs[key] for key in missing]
+        chunks = [missing_jobs[i:i + MANIFEST_ANALYSIS_CHUNK_SIZE]
+                  for i in range(0, len(missing_jobs), MANIFEST_ANALYSIS_CHUNK_SIZE)]
+        
+        results = map_chunks(_analyze_launch_chunk, [(chunk, num_orbits) for chunk in chunks], workers)
+        new_summaries = dict(pair for chunk_results in results for pair in chunk_results)
+        cache.put_many(new_summaries, jobs)
+        summaries.update(new_summaries)
+    
+    return pd.DataFrame([{'id': key[0], 'orbit_type': key[5], **summaries[key]} for key in jobs])
@@ -0,0 +1,42 @@
+"""Entfernungen (Haversine, Andoyer-Lambert) gegen bekannte Geodäten auf dem WGS84-Ellipsoid"""
+import numpy as np
+import pytest
+
+from rockets.geometry import germany_coords, great_circle_distance_km
+
+# Referenzwerte: Karney-Lösung des inversen Problems auf WGS84 (geographiclib)
+KNOWN_GEODESICS_KM = [
+    # Flinders Peak – Buninyong (Beispiel aus Vincentys Veröffentlichung)
+    ((-37.95103342, 144.42486789), (-37.65282114, 143.92649554), 54.972271),
+    ((0.0, 0.0), (0.0, 1.0), 111.319491),
+    ((0.0, 0.0), (90.0, 0.0), 10001.965729),  # Meridianquadrant
+    ((52.52, 13.405), (48.137, 11.575), 504.612742),  # Berlin – München
+    (germany_coords, (69.29, 16.02), 2040.690098),  # Andøya
+    (germany_coords, (28.56, -80.57), 7659.062614),  # Cape Canaveral
+    (germany_coords, (-39.26, 177.86), 18362.605720),  # Mahia
+]
+
+@pytest.mark.parametrize("point1, point2, expected_km", KNOWN_GEODESICS_KM)
+def test_haversine_within_documented_error(point1, point2, expected_km):
+    distance = great_circle_distance_km(*point1, *point2)
+    assert abs(distance - expected_km) <= 0.0052 * expected_km
+
+@pytest.mark.parametrize("point1, point2, expected_km", KNOWN_GEODESICS_KM)
+def test_ellipsoidal_within_documented_error(point1, point2, expected_km):
+    distance = great_circle_distance_km(*point1, *point2, ellipsoidal=True)
+    assert abs(distance - expected_km) <= (0.04 if expected_km <= 4000 else 1.1)
+
+@pytest.mark.parametrize("ellipsoidal", [False, True])
+def test_distance_broadcasts_and_handles_degenerate_points(ellipsoidal):
+    lats = np.array([[point1[0] for point1, _, _ in KNOWN_GEODESICS_KM]])
+    lons = np.array([[point1[1] for point1, _, _ in KNOWN_GEODESICS_KM]])
+    other_lats = np.array([[point2[0] for _, point2, _ in KNOWN_GEODESICS_KM]])
+    other_lons = np.array([[point2[1] for _, point2, _ in KNOWN_GEODESICS_KM]])
+    
+    distances = great_circle_distance_km(lats, lons, other_lats, other_lons, ellipsoidal=ellipsoidal)
+    assert distances.shape == lats.shape
+    np.testing.assert_allclose(distances, great_circle_distance_km(other_lats, other_lons, lats, lons,
+                                                                   ellipsoidal=ellipsoidal))
+    # Identische und exakt antipodale Punkte liefern endliche Werte
+    assert great_circle_distance_km(51.0, 10.0, 51.0, 10.0, ellipsoidal=ellipsoidal) == 0.0
+    assert np.isfinite(great_circle_distance_km(0.0, 0.0, 0.0, 180.0, ellipsoidal=ellipsoidal))
@@ -0,0 +1,53 @@
+"""Fixture-Store: Aufzeichnen und Wiedergeben externer Antworten über den HTTP-Client"""
+import pytest
+
+from rockets.http_client import FixtureMissing, FixtureResponse, FixtureStore, HttpClient, RateBudget
+
+URL = "https://example.org/api/launches/?limit=10"
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """HTTP-Client mit Fixture-Store in tmp_path, Live-Antworten kommen aus client.live_responses"""
+    client = HttpClient("test", rate_budget=RateBudget(1, 3600))
+    client.fixture_store = FixtureStore(str(tmp_path), mode="record")
+    client.live_responses = []
+    client.live_headers = []
+    
+    def get_live(url, headers=None, timeout=None):
+        client.live_headers.append(headers)
+        return client.live_responses.pop(0)
+    
+    monkeypatch.setattr(client, "_get_live", get_live)
+    return client
+
+def test_recorded_response_is_replayed(client):
+    client.live_responses.append(FixtureResponse(200, {"ETag": "W/\"7\""}, b'{"results": [1, 2]}', URL))
+    client.get(URL, headers={"Accept": "application/json", "If-None-Match": "W/\"6\""})
+    # Bedingte Header werden beim Aufzeichnen weggelassen (vollständige Antwort statt 304)
+    assert client.live_headers == [{"Accept": "application/json"}]
+    
+    client.fixture_store.mode = "replay"
+    response = client.get(URL)
+    assert response.status_code == 200 and response.json() == {"results": [1, 2]}
+    assert response.headers["etag"] == "W/\"7\""
+    assert client.rate_budget.remaining() == 1  # Replay verbraucht kein Kontingent
+
+@pytest.mark.parametrize("status_code", [304, 429, 503])
+def test_non_2xx_responses_are_not_recorded(client, status_code):
+    client.live_responses.append(FixtureResponse(status_code, {}, b"", URL))
+    assert client.get(URL).status_code == status_code
+    
+    client.fixture_store.mode = "replay"
+    with pytest.raises(FixtureMissing):
+        client.get(URL)
+
+def test_replay_keys_on_source_and_url(client):
+    client.live_responses.append(FixtureResponse(200, {}, b"[]", URL))
+    client.get(URL)
+    store = client.fixture_store
+    store.mode = "replay"
+    assert store.replay("test", URL).content == b"[]"
+    with pytest.raises(FixtureMissing):
+        store.replay("other", URL)
+    with pytest.raises(FixtureMissing):
+        store.replay("test", URL + "&offset=10")
@@ -0,0 +1,143 @@
+"""Start-Snapshot: Festplatten-Round-Trip und Stale-While-Revalidate mit aufgezeichneten API-Antworten"""
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from rockets import launches
+from rockets.http_client import FixtureResponse, FixtureStore, get_http_client
+from rockets.launches import (LAUNCH_API_URL, LAUNCH_CACHE_NAME, LAUNCH_CACHE_TTL, LAUNCH_PAGE_SIZE,
+                              REFRESH_RETRY_SECONDS, get_launch_snapshot, launch_table_from_snapshot,
+                              read_cache_snapshot, refresh_due, refresh_launch_cache, sync_launch_manifest,
+                              write_cache_snapshot)
+
+LIST_URL = f"{LAUNCH_API_URL}?mode=list&limit={LAUNCH_PAGE_SIZE}&offset=0"
+
+def _launch(launch_id, net, last_updated="2026-10-01T00:00:00Z"):
+    """Roh-Datensatz im Format der Launch Library (mode=detailed)"""
+    return {
+        "id": launch_id,
+        "name": f"Falcon 9 | {launch_id}",
+        "net": net,
+        "last_updated": last_updated,
+        "launch_service_provider": {"name": "SpaceX"},
+        "pad": {"name": "SLC-40", "latitude": "28.56", "longitude": "-80.57",
+                "location": {"name": "Cape Canaveral SFS, FL, USA"}},
+        "mission": {"name": launch_id, "orbit": {"name": "Low Earth Orbit"}},
+    }
+
+@pytest.fixture
+def fixture_store(tmp_path, monkeypatch):
+    """Leerer Cache in tmp_path, API-Zugriffe nur aus dem Fixture-Store (Replay)"""
+    monkeypatch.setattr(launches, "CACHE_DIR", str(tmp_path / "cache"))
+    store = FixtureStore(str(tmp_path / "fixtures"), mode="replay")
+    monkeypatch.setattr(get_http_client("thespacedevs"), "fixture_store", store)
+    return store
+
+def _record(store, url, data):
+    store.record("thespacedevs", url, FixtureResponse(200, {"Content-Type": "application/json"},
+                                                      json.dumps(data).encode("utf-8"), url))
+
+def _record_list(store, launch_list):
+    _record(store, LIST_URL, {"next": None, "results": [
+        {"id": launch["id"], "last_updated": launch["last_updated"]} for launch in launch_list]})
+
+def _record_details(store, launch_list):
+    ids = sorted(launch["id"] for launch in launch_list)
+    _record(store, f"{LAUNCH_API_URL}?mode=detailed&limit={len(ids)}&offset=0&id__in={','.join(ids)}",
+            {"next": None, "results": launch_list})
+
+def _record_api(store, launch_list):
+    """Zeichnet Listenansicht und Detailabfrage (id__in) für die gegebenen Starts auf"""
+    _record_list(store, launch_list)
+    _record_details(store, launch_list)
+
+def _join_background_refresh():
+    for thread in threading.enumerate():
+        if thread.name == "launch-cache-refresh":
+            thread.join(timeout=10)
+
+def test_snapshot_round_trip(fixture_store):
+    snapshot = {"fetched_at": 1700000000.5, "launches": {"a": _launch("a", "2026-10-20T12:00:00Z")},
+                "pages": {LIST_URL: {"etag": "W/\"1\"", "entries": [["a", None]], "next": None}}}
+    assert read_cache_snapshot(LAUNCH_CACHE_NAME) is None
+    
+    write_cache_snapshot(LAUNCH_CACHE_NAME, snapshot)
+    assert read_cache_snapshot(LAUNCH_CACHE_NAME) == snapshot
+    assert os.listdir(launches.CACHE_DIR) == [LAUNCH_CACHE_NAME + ".json.gz"]  # keine Temp-Dateien
+    
+    table = launch_table_from_snapshot(snapshot)
+    assert len(table) == 1 and table[0].coords == (28.56, -80.57)
+
+def test_corrupt_snapshot_reads_as_missing(fixture_store):
+    os.makedirs(launches.CACHE_DIR)
+    with open(os.path.join(launches.CACHE_DIR, LAUNCH_CACHE_NAME + ".json.gz"), "wb") as f:
+        f.write(b"kein gzip")
+    assert read_cache_snapshot(LAUNCH_CACHE_NAME) is None
+
+def test_first_load_blocks_until_data_is_available(fixture_store):
+    _record_api(fixture_store, [_launch("b", "2026-10-21T12:00:00Z"), _launch("a", "2026-10-20T12:00:00Z")])
+    
+    snapshot = get_launch_snapshot()
+    assert sorted(snapshot["launches"]) == ["a", "b"]
+    assert [launch.id for launch in launch_table_from_snapshot(snapshot)] == ["a", "b"]
+    assert not refresh_due(snapshot)
+
+def test_stale_snapshot_is_served_while_refreshing(fixture_store):
+    stale = {"fetched_at": time.time() - LAUNCH_CACHE_TTL - 60, "pages": {},
+             "launches": {"a": _launch("a", "2026-10-20T12:00:00Z")}}
+    write_cache_snapshot(LAUNCH_CACHE_NAME, stale)
+    _record_api(fixture_store, [_launch("a", "2026-10-20T13:00:00Z", last_updated="2026-10-02T00:00:00Z"),
+                                _launch("c", "2026-10-22T12:00:00Z")])
+    
+    # Sofort der alte Stand, der Abgleich läuft im Hintergrund
+    assert get_launch_snapshot() == stale
+    _join_background_refresh()
+    
+    refreshed = read_cache_snapshot(LAUNCH_CACHE_NAME)
+    assert refreshed["fetched_at"] > stale["fetched_at"] and refreshed["changed"] == 2
+    assert sorted(refreshed["launches"]) == ["a", "c"]
+    assert refreshed["launches"]["a"]["net"] == "2026-10-20T13:00:00Z"
+    assert get_launch_snapshot() == refreshed  # frisch: kein weiterer Abgleich
+
+def test_failed_refresh_keeps_data_and_backs_off(fixture_store):
+    stale = {"fetched_at": time.time() - LAUNCH_CACHE_TTL - 60, "pages": {},
+             "launches": {"a": _launch("a", "2026-10-20T12:00:00Z")}}
+    write_cache_snapshot(LAUNCH_CACHE_NAME, stale)
+    
+    # Keine Aufzeichnung: der Replay-Modus meldet einen Verbindungsfehler
+    before = time.time()
+    snapshot = refresh_launch_cache()
+    assert snapshot["launches"] == stale["launches"]
+    assert snapshot["failures"] == 1 and snapshot["last_error"].startswith("Verbindungsfehler")
+    assert before + REFRESH_RETRY_SECONDS <= snapshot["retry_after"] <= time.time() + REFRESH_RETRY_SECONDS
+    assert read_cache_snapshot(LAUNCH_CACHE_NAME) == snapshot
+    assert not refresh_due(snapshot)
+    assert refresh_due(snapshot, now=snapshot["retry_after"] + 1)
+
+def test_sync_fetches_only_changed_launches(fixture_store):
+    unchanged = _launch("a", "2026-10-20T12:00:00Z")
+    manifest = {"launches": {"a": unchanged, "b": _launch("b", "2026-10-21T12:00:00Z")},
+                "pages": {LIST_URL.replace("offset=0", "offset=100"): {"entries": [["b", None]], "next": None}}}
+    added = _launch("c", "2026-10-22T12:00:00Z", last_updated="2026-10-03T00:00:00Z")
+    _record_list(fixture_store, [unchanged, added])
+    # Nur für c existiert eine Detail-Aufzeichnung, jede weitere Detailabfrage schlüge fehl
+    _record_details(fixture_store, [added])
+    
+    manifest = sync_launch_manifest(manifest)
+    assert manifest["changed"] == 1
+    assert sorted(manifest["launches"]) == ["a", "c"]  # b wird nicht mehr gelistet
+    assert manifest["launches"]["a"] is unchanged
+    assert list(manifest["pages"]) == [LIST_URL]  # Seiten früherer Durchläufe verworfen
+
+def test_sync_fetches_details_in_id_batches(fixture_store, monkeypatch):
+    monkeypatch.setattr(launches, "LAUNCH_ID_BATCH_SIZE", 2)
+    launch_list = [_launch(launch_id, f"2026-10-2{i}T12:00:00Z") for i, launch_id in enumerate("abc")]
+    _record_list(fixture_store, launch_list)
+    _record_details(fixture_store, launch_list[:2])
+    _record_details(fixture_store, launch_list[2:])
+    
+    manifest = sync_launch_manifest()
+    assert manifest["changed"] == 3 and sorted(manifest["launches"]) == ["a", "b", "c"]
@@ -0,0 +1,49 @@
+"""Bodenspur des vereinfachten Bahnmodells: Erdrotation unter der im Raum festen Bahn"""
+from datetime import datetime, timezone
+
+import numpy as np
+
+from rockets.orbits import LAUNCH_ORBIT_PARAMS, build_launch_trajectory, calculate_orbit_period
+from rockets.windows import launch_positions
+
+LAUNCH_COORDS = (28.56, -80.57)
+LAUNCH_EPOCH = 1792454400.0  # 2026-10-20T00:00Z
+
+def _orbit_start(target_orbit):
+    return LAUNCH_EPOCH + target_orbit["ascent_duration"] * 60
+
+def _lon_difference(a, b):
+    return (np.asarray(a) - np.asarray(b) + 180) % 360 - 180
+
+def test_consecutive_orbits_shift_west_by_earth_rotation():
+    target_orbit = LAUNCH_ORBIT_PARAMS["LEO"]
+    period = calculate_orbit_period(target_orbit["height"])
+    epochs = _orbit_start(target_orbit) + np.linspace(0, period * 60, 50, endpoint=False)
+    lat1, lon1, _ = launch_positions(LAUNCH_COORDS, LAUNCH_EPOCH, target_orbit, epochs)
+    lat2, lon2, _ = launch_positions(LAUNCH_COORDS, LAUNCH_EPOCH, target_orbit, epochs + period * 60)
+    
+    np.testing.assert_allclose(lat2, lat1, atol=1e-9)
+    shift = _lon_difference(lon2, lon1)
+    np.testing.assert_allclose(shift, -360 * period / (24 * 60), atol=1e-6)
+    assert -24 < shift[0] < -22  # ca. 22,5° bei ~90 Minuten Umlaufzeit
+
+def test_ground_track_is_continuous_across_orbit_boundary():
+    target_orbit = LAUNCH_ORBIT_PARAMS["SSO"]
+    period = calculate_orbit_period(target_orbit["height"])
+    boundary = _orbit_start(target_orbit) + period * 60
+    epochs = boundary + np.array([-10.0, 0.0, 10.0])
+    lat, lon, _ = launch_positions(LAUNCH_COORDS, LAUNCH_EPOCH, target_orbit, epochs)
+    
+    # 10 Sekunden Flug sind weniger als 1° Bodenspur, auch über die Umlaufgrenze hinweg
+    assert np.all(np.abs(np.diff(lat)) < 1)
+    assert np.all(np.abs(_lon_difference(lon[1:], lon[:-1])) < 1)
+
+def test_launch_trajectory_matches_launch_positions():
+    target_orbit = LAUNCH_ORBIT_PARAMS["LEO"]
+    launch_time = datetime.fromtimestamp(LAUNCH_EPOCH, timezone.utc)
+    lats, lons, _, epochs = build_launch_trajectory(LAUNCH_COORDS, launch_time, target_orbit)
+    in_orbit = np.arange(len(epochs)) > target_orbit["ascent_duration"]
+    lat, lon, _ = launch_positions(LAUNCH_COORDS, LAUNCH_EPOCH, target_orbit, epochs[in_orbit])
+    
+    np.testing.assert_allclose(lat, lats[in_orbit], atol=1e-6)
+    np.testing.assert_allclose(_lon_difference(lon, lons[in_orbit]), 0, atol=1e-6)
@@ -0,0 +1,59 @@
+"""Intervall-Suche und Goldener Schnitt gegen einen feinen Brute-Force-Scan"""
+import numpy as np
+import pytest
+
+from rockets.passes import find_intervals, golden_section_maximum
+
+FINE_STEP_SECONDS = 0.01
+
+def _indicator(epoch_seconds):
+    # Mehrere Intervalle unterschiedlicher Länge (alle länger als der grobe Scan-Schritt)
+    epoch_seconds = np.asarray(epoch_seconds, dtype=float)
+    return np.sin(2 * np.pi * epoch_seconds / 600) + 0.4 * np.sin(2 * np.pi * epoch_seconds / 2300) - 0.3
+
+def _brute_force_intervals(indicator, start_epoch, end_epoch):
+    """Anfänge und Enden aller Intervalle mit indicator > 0 auf einem feinen Gitter"""
+    times = np.arange(start_epoch, end_epoch + FINE_STEP_SECONDS / 2, FINE_STEP_SECONDS)
+    inside = indicator(times) > 0
+    starts = times[1:][~inside[:-1] & inside[1:]]
+    ends = times[:-1][inside[:-1] & ~inside[1:]]
+    if inside[0]:
+        starts = np.concatenate([[start_epoch], starts])
+    if inside[-1]:
+        ends = np.concatenate([ends, [end_epoch]])
+    return starts, ends, bool(inside[0]), bool(inside[-1])
+
+@pytest.mark.parametrize("start_epoch, end_epoch", [(0.0, 6000.0), (100.0, 7300.0), (350.0, 4450.0)])
+def test_find_intervals_matches_brute_force(start_epoch, end_epoch):
+    tolerance = 0.5
+    starts, ends, open_start, open_end = find_intervals(_indicator, start_epoch, end_epoch, 30, tolerance)
+    expected_starts, expected_ends, expected_open_start, expected_open_end = _brute_force_intervals(
+        _indicator, start_epoch, end_epoch)
+    
+    assert starts.size == expected_starts.size == ends.size == expected_ends.size > 0
+    np.testing.assert_allclose(starts, expected_starts, atol=tolerance + FINE_STEP_SECONDS)
+    np.testing.assert_allclose(ends, expected_ends, atol=tolerance + FINE_STEP_SECONDS)
+    assert bool(open_start[0]) == expected_open_start and not open_start[1:].any()
+    assert bool(open_end[-1]) == expected_open_end and not open_end[:-1].any()
+
+def test_find_intervals_without_crossings():
+    starts, ends, _, _ = find_intervals(lambda t: -np.ones_like(t), 0.0, 1000.0, 30, 0.5)
+    assert starts.size == ends.size == 0
+    starts, ends, open_start, open_end = find_intervals(lambda t: np.ones_like(t), 0.0, 1000.0, 30, 0.5)
+    assert starts.tolist() == [0.0] and ends.tolist() == [1000.0] and open_start.all() and open_end.all()
+
+def test_golden_section_maximum_matches_grid_argmax():
+    # Elevationsähnliche, unimodale Kurven mit verschiedenen Maxima je Intervall
+    peaks = np.array([12.3, 47.9, 80.05, 133.3])
+    widths = np.array([5.0, 20.0, 2.0, 40.0])
+    lower, upper = peaks - 1.7 * widths, peaks + 0.9 * widths
+    
+    def curve(t, index=slice(None)):
+        return np.cos(np.clip((t - peaks[index]) / widths[index], -1.5, 1.5))
+    
+    tolerance = 1e-3
+    found = golden_section_maximum(curve, lower.copy(), upper.copy(), tolerance)
+    for i in range(peaks.size):
+        grid = np.arange(lower[i], upper[i], tolerance / 10)
+        expected = grid[np.argmax(curve(grid, i))]
+        assert abs(found[i] - expected) <= tolerance
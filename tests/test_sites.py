@@ -0,0 +1,58 @@
+"""Umkreis- und Nächste-Nachbarn-Abfragen des Startort-Registers gegen eine Brute-Force-Suche"""
+import numpy as np
+import pytest
+
+from rockets.geometry import great_circle_distance_km
+from rockets.sites import STATIC_LAUNCH_SITES, LaunchSiteRegistry
+
+QUERY_POINTS = [
+    (51.1657, 10.4515),  # Deutschland
+    (0.0, 179.9),  # Datumsgrenze
+    (-0.5, -179.95),
+    (89.5, 42.0),  # nahe Nordpol
+    (-88.0, -120.0),
+    (28.6, -80.6),
+]
+
+@pytest.fixture(scope="module")
+def registry():
+    rng = np.random.default_rng(13)
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, 600)))
+    lons = rng.uniform(-180, 180, 600)
+    # Zusätzliche Orte an den Zellrändern: Pole und Datumsgrenze
+    lats = np.concatenate([lats, [89.9, -89.9, 0.0, 1.0, -1.0]])
+    lons = np.concatenate([lons, [0.0, 90.0, 180.0, -179.99, 179.99]])
+    sites = [dict(site) for site in STATIC_LAUNCH_SITES]
+    sites += [{"name": f"Ort {i}", "coords": (lat, lon), "active": True}
+              for i, (lat, lon) in enumerate(zip(lats.tolist(), lons.tolist()))]
+    return LaunchSiteRegistry(sites)
+
+def _brute_force_distances(registry, lat, lon):
+    return great_circle_distance_km(lat, lon, registry.lats, registry.lons)
+
+@pytest.mark.parametrize("lat, lon", QUERY_POINTS)
+@pytest.mark.parametrize("radius_km", [50, 500, 2500, 9000, 20100])
+def test_within_radius_matches_brute_force(registry, lat, lon, radius_km):
+    indices, distances = registry.within_radius(lat, lon, radius_km)
+    expected = _brute_force_distances(registry, lat, lon)
+    
+    # Orte direkt auf dem Kreisrand (Rundung) nicht bewerten
+    borderline = np.abs(expected - radius_km) < 1e-6
+    assert set(indices.tolist()) - set(np.flatnonzero(borderline).tolist()) == \
+        set(np.flatnonzero((expected <= radius_km) & ~borderline).tolist())
+    np.testing.assert_allclose(distances, expected[indices], atol=1e-6)
+    assert np.all(np.diff(distances) >= 0)
+
+@pytest.mark.parametrize("lat, lon", QUERY_POINTS)
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_nearest_matches_brute_force(registry, lat, lon, k):
+    indices, distances = registry.nearest(lat, lon, k)
+    expected = _brute_force_distances(registry, lat, lon)
+    order = np.argsort(expected, kind="stable")[:k]
+    
+    assert indices.tolist() == order.tolist()
+    np.testing.assert_allclose(distances, expected[order], atol=1e-6)
+
+def test_nearest_returns_all_sites_for_large_k(registry):
+    indices, _ = registry.nearest(-60.0, 30.0, k=len(registry) + 10)
+    assert sorted(indices.tolist()) == list(range(len(registry)))
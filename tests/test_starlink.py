@@ -0,0 +1,54 @@
+"""Starlink-Feinberechnung: Überflüge je Kandidatenfenster gegen die Überflugvorhersage der passes"""
+import numpy as np
+import pytest
+
+pytest.importorskip("sgp4")
+
+from sgp4.api import Satrec
+
+from rockets.geometry import germany_coords, julian_dates, look_angles, teme_to_ecef
+from rockets.passes import predict_passes
+from rockets.starlink import _constellation_chunk_passes, _satellite_passes
+
+TLE_LINES = ("1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927",
+             "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537")
+
+@pytest.fixture(scope="module")
+def satrec():
+    return Satrec.twoline2rv(*TLE_LINES)
+
+def _look_angles(satrec):
+    def look_angle_function(epoch_seconds):
+        epoch_seconds = np.atleast_1d(np.asarray(epoch_seconds, dtype=float))
+        _, positions, _ = satrec.sgp4_array(*julian_dates(epoch_seconds))
+        return look_angles(germany_coords[0], germany_coords[1], teme_to_ecef(positions, epoch_seconds))
+    return look_angle_function
+
+def _epoch(satrec):
+    return (satrec.jdsatepoch - 2440587.5 + satrec.jdsatepochF) * 86400.0
+
+def test_chunk_passes_match_event_prediction(satrec):
+    start_epoch = _epoch(satrec)
+    end_epoch = start_epoch + 2 * 86400
+    expected = predict_passes(_look_angles(satrec), start_epoch, end_epoch)
+    passes = sorted(_constellation_chunk_passes([TLE_LINES], ["ISS"], start_epoch, end_epoch, germany_coords, 0),
+                    key=lambda satellite_pass: satellite_pass['rise'])
+    
+    assert len(passes) == len(expected) > 0
+    for satellite_pass, expected_pass in zip(passes, expected):
+        assert satellite_pass['rise'] == pytest.approx(expected_pass['rise'], abs=1.0)
+        assert satellite_pass['set'] == pytest.approx(expected_pass['set'], abs=1.0)
+        assert satellite_pass['max_elevation'] == pytest.approx(expected_pass['max_elevation'], abs=1.0)
+
+def test_passes_never_span_two_windows(satrec):
+    start_epoch = _epoch(satrec)
+    first, second = predict_passes(_look_angles(satrec), start_epoch, start_epoch + 86400)[:2]
+    # Das erste Fenster endet mitten im ersten Überflug, das zweite beginnt mitten im zweiten
+    windows = [(first['culmination'] - 300, first['culmination']), (second['culmination'], second['culmination'] + 300)]
+    passes = _satellite_passes(satrec, windows, germany_coords, 0)
+    
+    assert len(passes) == 2
+    assert passes[0]['rise'] == pytest.approx(first['rise'], abs=1.0)
+    assert passes[0]['set'] <= windows[0][1]
+    assert passes[1]['rise'] >= windows[1][0]
+    assert passes[1]['set'] == pytest.approx(second['set'], abs=1.0)
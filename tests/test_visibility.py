@@ -0,0 +1,42 @@
+"""Sichtbarkeitsmodell: nur bei dunklem Himmel am Beobachter und von der Sonne beschienenem Objekt"""
+from datetime import datetime, timezone
+
+import numpy as np
+
+from rockets.geometry import geodetic_to_ecef, germany_coords
+from rockets.sun import in_earth_shadow, sun_direction_ecef, sun_elevation_deg
+from rockets.visibility import compute_visibility_field, get_observer_grid, is_point_visible_from_germany_batch
+
+ISS_HEIGHT_KM = 400.0
+
+def _epoch(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc).timestamp()
+
+def _zenith_visibility(epoch):
+    """Objekt in ISS-Höhe senkrecht über Deutschland: (Sichtbarkeit, im Schatten, Sonnenhöhe)"""
+    visibility, _, _ = is_point_visible_from_germany_batch([germany_coords], ISS_HEIGHT_KM, epoch)
+    shadow = in_earth_shadow(geodetic_to_ecef(*germany_coords, ISS_HEIGHT_KM), sun_direction_ecef(epoch))
+    return float(visibility[0]), bool(shadow), float(sun_elevation_deg(epoch))
+
+def test_object_in_earth_shadow_is_not_visible():
+    visibility, shadow, sun_elevation = _zenith_visibility(_epoch("2026-12-21T00:00"))
+    assert shadow and sun_elevation < -18
+    assert visibility == 0.0
+
+def test_daylight_pass_is_not_visible():
+    visibility, shadow, sun_elevation = _zenith_visibility(_epoch("2026-06-21T12:00"))
+    assert not shadow and sun_elevation > 0
+    assert visibility == 0.0
+
+def test_sunlit_object_in_dark_sky_is_visible():
+    for text in ("2026-06-21T21:30", "2026-12-21T17:00"):
+        visibility, shadow, sun_elevation = _zenith_visibility(_epoch(text))
+        assert not shadow and sun_elevation < -6
+        assert visibility > 30
+
+def test_observer_grid_applies_the_same_gate():
+    grid = get_observer_grid(100)
+    epochs = np.array([_epoch("2026-12-21T00:00"), _epoch("2026-06-21T12:00"), _epoch("2026-12-21T17:00")])
+    for epoch, expected_visible in zip(epochs, (False, False, True)):
+        field = compute_visibility_field(grid, [germany_coords[0]], [germany_coords[1]], ISS_HEIGHT_KM, [epoch])
+        assert (field['visibility'].max() > 0) == expected_visible
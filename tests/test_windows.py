@@ -0,0 +1,47 @@
+"""Flugbahnanalyse des Startmanifests: Fenster und Rangfolge je Start, Orbit-Typ und Startzeit"""
+from datetime import datetime, timezone
+
+import pytest
+
+from rockets.launches import LaunchRecord, LaunchTable
+from rockets.orbits import LAUNCH_ORBIT_PARAMS
+from rockets.windows import (TrajectoryAnalysisCache, analyze_launch_manifest, calculate_visibility_schedule,
+                             summarize_visibility_windows)
+
+CAPE = (28.56, -80.57)
+KOUROU = (5.26, -52.78)
+
+def _launch(launch_id, net, coords, orbit_name):
+    net_epoch = datetime.fromisoformat(net).replace(tzinfo=timezone.utc).timestamp()
+    return LaunchRecord(launch_id, launch_id, net_epoch, coords[0], coords[1], "Pad", "Ort", "Anbieter",
+                        "Mission", orbit_name, "2026-10-01T00:00:00Z")
+
+@pytest.fixture(scope="module")
+def manifest():
+    launches = LaunchTable([
+        _launch("leo-00", "2026-10-20T00:00", CAPE, "Low Earth Orbit"),
+        _launch("leo-03", "2026-10-20T03:00", CAPE, "Low Earth Orbit"),
+        _launch("leo-18", "2026-10-20T18:00", CAPE, "Low Earth Orbit"),
+        _launch("sso-18", "2026-10-20T18:00", KOUROU, "Sun-Synchronous Orbit"),
+        _launch("geo-18", "2026-10-20T18:00", KOUROU, "Geostationary Transfer Orbit"),
+    ])
+    return launches, analyze_launch_manifest(launches, workers=1, cache=TrajectoryAnalysisCache())
+
+def test_manifest_rows_match_single_launch_schedule(manifest):
+    launches, analysis = manifest
+    assert list(analysis['orbit_type']) == ["LEO", "LEO", "LEO", "SSO", "GEO"]
+    for launch, (_, row) in zip(launches, analysis.iterrows()):
+        windows = calculate_visibility_schedule(launch.coords, launch.net_utc, LAUNCH_ORBIT_PARAMS[row['orbit_type']])
+        expected = summarize_visibility_windows(windows)
+        assert row['windows'] == expected['windows']
+        assert row['best_visibility'] == pytest.approx(expected['best_visibility'])
+
+def test_manifest_ranking_depends_on_orbit_and_launch_time(manifest):
+    _, analysis = manifest
+    with_windows = analysis[analysis['windows'] > 0]
+    ranked = with_windows.sort_values(['best_visibility', 'max_elevation'], ascending=[False, False])
+    
+    # Gleicher Startplatz, andere Startzeit: die Umläufe liegen anders über Deutschland
+    assert list(ranked['id']) == ["leo-00", "sso-18", "geo-18", "leo-03"]
+    assert "leo-18" not in set(with_windows['id'])
+    assert ranked['best_visibility'].is_unique